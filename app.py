@@ -3,24 +3,32 @@ Flask 애플리케이션 팩토리 - MongoDB 기반
 """
 import os
 import json
-import threading
-from datetime import datetime, timedelta
+from datetime import datetime
 from flask import Flask, request, abort, send_from_directory, session, g, redirect, url_for, jsonify
-from routes.main import main
+from routes.main import main, SERVICE_LIST_TAG, SITE_TAG
 from routes.admin import admin
 from extensions import db, login_manager, migrate, mail, babel, compress, cache
 from config import Config
 from dotenv import load_dotenv
 from utils.security import add_security_headers, is_suspicious_request, get_client_ip, log_security_event
 from utils.translation_helper import register_template_helpers
-from utils.mongo_models import get_mongo_db, init_collections, Service, SiteSettings
+from utils.mongo_models import get_mongo_db, Service, SiteSettings
+from utils.mongo_indexes import check_indexes_in_background, db_indexes_cli
+from utils.mongo_client import warm_pool_in_background
+from utils.mongo_profiler import init_app as init_mongo_profiler
+from utils.shared_cache import configure_cache, tagged_key, mark_render_fallback, is_render_fallback
+from utils.memoize import TTLCache
+from utils.lazy_context import lazy_context
+from utils.fragment_cache import FragmentCacheExtension
+from utils.page_snapshots import build_snapshots_in_background, snapshots_cli
+from utils.image_disk_cache import image_cache_cli
+from utils.warmup import configure_bytecode_cache, warm_command
+from utils import lang_urls
 from utils.translation import export_mongodb_to_cache, TRANSLATIONS_CACHE_FILE
 
-# 전역 메모리 캐시 (context_processor용 성능 최적화)
-_context_cache = {}
-_context_cache_timestamps = {}
-_context_cache_lock = threading.Lock()
+# 전역 메모리 캐시 (context_processor용 성능 최적화, 크기 제한 + TTL)
 CONTEXT_CACHE_TIMEOUT = 300  # 5분
+_context_cache = TTLCache('context_processor', maxsize=16, ttl=CONTEXT_CACHE_TIMEOUT)
 
 # 지원하는 언어 목록
 SUPPORTED_LANGUAGES = {
@@ -59,10 +67,9 @@ def create_app():
     app.config['COMPRESS_MIN_SIZE'] = 500
     compress.init_app(app)
     
-    # 캐싱 설정 (SimpleCache - 메모리 기반)
-    app.config['CACHE_TYPE'] = 'SimpleCache'
+    # 캐싱 설정 (워커 공유 저장소 - 파일 시스템 또는 Redis, utils/shared_cache.py)
     app.config['CACHE_DEFAULT_TIMEOUT'] = 300  # 5분
-    cache.init_app(app)
+    configure_cache(app)
     
     # SQLAlchemy 초기화 (마이그레이션 스크립트용으로 유지)
     db.init_app(app)
@@ -74,6 +81,10 @@ def create_app():
     
     # Babel 초기화
     def get_locale():
+        # 0. 언어 접두사 URL (/en/services) - 세션/쿠키를 보지 않음
+        if g.get('url_lang'):
+            return g.url_lang
+        
         # 1. URL 파라미터에서 언어 확인 (최우선)
         lang = request.args.get('lang')
         if lang and lang in SUPPORTED_LANGUAGES:
@@ -109,16 +120,6 @@ def create_app():
     
     login_manager.login_view = 'admin.login'
     
-    # MongoDB 컬렉션 초기화
-    def init_mongodb():
-        """MongoDB 컬렉션 및 인덱스 초기화"""
-        try:
-            print("🔧 MongoDB 컬렉션 초기화 중...")
-            init_collections()
-            print("✅ MongoDB 컬렉션 초기화 완료")
-        except Exception as e:
-            print(f"⚠️ MongoDB 초기화 오류: {str(e)}")
-    
     def init_translation_cache():
         """번역 JSON 캐시 초기화"""
         try:
@@ -134,11 +135,16 @@ def create_app():
         except Exception as e:
             print(f"⚠️ 번역 캐시 초기화 오류: {str(e)} (MongoDB fallback 사용)")
     
-    # 앱 시작 시 MongoDB 및 번역 캐시 초기화
+    # 앱 시작 시 번역 캐시 초기화
     with app.app_context():
-        init_mongodb()
         init_translation_cache()
     
+    # MongoDB 인덱스 점검 (읽기 전용, 백그라운드) - 생성/삭제는 `flask db-indexes sync`
+    check_indexes_in_background()
+    
+    # 워커 부팅 직후 연결 풀 예열 (첫 요청이 핸드셰이크를 기다리지 않도록, 백그라운드)
+    warm_pool_in_background()
+    
     # 보안 미들웨어
     @app.before_request
     def security_middleware():
@@ -271,6 +277,12 @@ def create_app():
         log_security_event("RATE_LIMIT", f"IP: {get_client_ip()}")
         return "Too Many Requests", 429
     
+    # Jinja2 조각 캐시 ({% cache 키, 태그 %} ... {% endcache %}, utils/fragment_cache.py)
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    
+    # Jinja2 템플릿 바이트코드 캐시 (instance/jinja_cache - 재시작/다른 워커는 컴파일 생략)
+    configure_bytecode_cache(app)
+    
     # Jinja2 필터 추가
     @app.template_filter('from_json')
     def from_json_filter(value):
@@ -290,15 +302,15 @@ def create_app():
         # 줄바꿈 문자를 공백으로 대체하고 연속된 공백을 하나로 정리
         return re.sub(r'\s+', ' ', str(value)).strip()
     
-    # 전역 컨텍스트 - 언어 설정
+    # 전역 컨텍스트 - 언어 설정 (고정 값은 Jinja 전역으로 한 번만 등록)
+    app.jinja_env.globals['supported_languages'] = SUPPORTED_LANGUAGES
+    
     @app.context_processor
     def inject_language_data():
+        # current_lang은 함수/쿼리 인자로도 쓰이므로 프록시가 아닌 문자열로 제공 (요청당 한 번 결정됨)
         from flask_babel import get_locale
         current_locale = get_locale()
-        return dict(
-            current_lang=str(current_locale) if current_locale else 'ko',
-            supported_languages=SUPPORTED_LANGUAGES
-        )
+        return dict(current_lang=str(current_locale) if current_locale else 'ko')
     
     # 언어 변경 라우트
     @app.route('/set-language/<lang>')
@@ -324,16 +336,8 @@ def create_app():
         return response
     
     # 전역 컨텍스트 - 사이드 메뉴용 카테고리별 서비스 (캐싱 적용)
-    def _get_cached_menu_data():
-        """메뉴 데이터를 캐시에서 조회하거나 새로 생성"""
-        cache_key = 'menu_data'
-        
-        with _context_cache_lock:
-            # 캐시 유효성 확인
-            if cache_key in _context_cache_timestamps:
-                if datetime.now() - _context_cache_timestamps[cache_key] < timedelta(seconds=CONTEXT_CACHE_TIMEOUT):
-                    return _context_cache[cache_key]
-        
+    def _load_menu_data():
+        """메뉴 데이터 생성"""
         # 카테고리 순서와 설정 (표시 순서대로 정렬)
         categories_order = ['ai_analysis', 'consulting', 'oneday', 'photo']
         categories_config = {
@@ -364,40 +368,37 @@ def create_app():
         }
         
         try:
-            services = Service.query_all()
+            services = Service.query_all(prefetch=['options'])
             for service in services:
                 if service.category and service.category in categories_config:
                     categories_config[service.category]['services'].append(service)
         except Exception as e:
             print(f"Error loading menu data: {str(e)}")
+            mark_render_fallback()
         
-        result = dict(
+        return dict(
             menu_categories=categories_config,
             menu_categories_order=categories_order
         )
-        
-        # 캐시에 저장
-        with _context_cache_lock:
-            _context_cache[cache_key] = result
-            _context_cache_timestamps[cache_key] = datetime.now()
-        
-        return result
+    
+    def _get_cached_menu_data():
+        """메뉴 데이터를 캐시에서 조회하거나 새로 생성 (서비스 목록 변경 시 모든 워커에서 새로 생성)"""
+        return _context_cache.get_or_set(tagged_key((SERVICE_LIST_TAG,), 'menu_data'), _load_menu_data,
+                                         cacheable=lambda _: not is_render_fallback())
+    
+    # 레이아웃(base.html)이 실제로 메뉴를 사용할 때만 조회 (관리자 페이지, HTMX 조각, 메뉴 조각 캐시 적중 시 생략)
+    lazy_menu_data = lazy_context('menu_data', _get_cached_menu_data)
     
     @app.context_processor
     def inject_menu_data():
-        return _get_cached_menu_data()
+        return dict(
+            menu_categories=lazy_menu_data['menu_categories'],
+            menu_categories_order=lazy_menu_data['menu_categories_order']
+        )
     
     # 전역 컨텍스트 - 사이트 색상 설정 (Light mode 전용, 캐싱 적용)
-    def _get_cached_site_colors():
-        """사이트 색상 설정을 캐시에서 조회하거나 새로 생성"""
-        cache_key = 'site_colors'
-        
-        with _context_cache_lock:
-            # 캐시 유효성 확인
-            if cache_key in _context_cache_timestamps:
-                if datetime.now() - _context_cache_timestamps[cache_key] < timedelta(seconds=CONTEXT_CACHE_TIMEOUT):
-                    return _context_cache[cache_key]
-        
+    def _load_site_colors():
+        """사이트 색상 설정 생성"""
         result = dict(
             site_mode='light',
             site_colors={
@@ -426,25 +427,45 @@ def create_app():
                 )
         except Exception as e:
             print(f"Error loading site colors: {str(e)}")
-        
-        # 캐시에 저장
-        with _context_cache_lock:
-            _context_cache[cache_key] = result
-            _context_cache_timestamps[cache_key] = datetime.now()
+            mark_render_fallback()
         
         return result
     
+    def _get_cached_site_colors():
+        """사이트 색상 설정을 캐시에서 조회하거나 새로 생성 (색상 저장 시 모든 워커에서 새로 생성)"""
+        return _context_cache.get_or_set(tagged_key((SITE_TAG,), 'site_colors'), _load_site_colors,
+                                         cacheable=lambda _: not is_render_fallback())
+    
+    # SiteSettings 조회도 템플릿이 site_colors를 사용할 때만 실행
+    lazy_site_colors = lazy_context('site_colors', _get_cached_site_colors)
+    
     @app.context_processor
     def inject_site_colors():
-        return _get_cached_site_colors()
+        return dict(site_mode='light', site_colors=lazy_site_colors['site_colors'])
     
     # 블루프린트 등록
     app.register_blueprint(main)
     app.register_blueprint(admin, url_prefix='/admin')
     
+    # 언어 접두사 URL (/en/services 등 - 세션/쿠키 없는 공유 캐시용, hreflang)
+    lang_urls.init_app(app)
+    
     # 번역 헬퍼 함수 등록
     register_template_helpers(app)
     
+    # MongoDB 쿼리 프로파일러 (요청별 왕복 횟수 집계)
+    init_mongo_profiler(app)
+    
+    # CLI 명령 등록 (flask db-indexes check|sync, flask snapshots build|clear, flask image-cache trim|clear, flask warm)
+    app.cli.add_command(db_indexes_cli)
+    app.cli.add_command(snapshots_cli)
+    app.cli.add_command(image_cache_cli)
+    app.cli.add_command(warm_command)
+    
+    # 공개 페이지 스냅샷 - 없는 스냅샷만 한 워커가 백그라운드 빌드 (flask CLI 실행 시 제외)
+    if not os.environ.get('FLASK_RUN_FROM_CLI'):
+        build_snapshots_in_background(app)
+    
     return app
 
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+기존 GridFS 이미지의 WebP/AVIF 파생 이미지를 일괄 생성하는 스크립트
+
+새로 업로드한 이미지는 저장 직후 자동으로 변환되므로, 이 스크립트는 그 전에 올린 이미지에 한 번 실행합니다.
+(변환하지 않은 이미지도 첫 요청 때 만들어지지만, 첫 방문자가 인코딩 시간을 기다리게 됩니다)
+
+사용법:
+    python backfill_image_variants.py [옵션]
+
+옵션:
+    --dry-run       실제로 변환하지 않고 대상 수만 출력
+    --batch-size N  한 번에 처리할 이미지 수 (기본: 50)
+    --full-only     원본 크기만 변환 (허용 너비별 축소본 생략)
+    --stats         현재 저장소 통계만 출력
+
+예시:
+    python backfill_image_variants.py --dry-run      # 대상 확인
+    python backfill_image_variants.py                # 실제 변환
+    python backfill_image_variants.py --stats        # 통계 확인
+"""
+
+import sys
+import argparse
+from datetime import datetime
+
+# 프로젝트 경로 설정
+sys.path.insert(0, '.')
+
+from utils.gridfs_helper import (
+    get_mongo_connection,
+    backfill_modern_variants,
+    get_gridfs_stats,
+    IMAGE_MODERN_FORMATS,
+    IMAGE_VARIANT_WIDTHS
+)
+
+
+def print_stats():
+    """저장소 통계 출력"""
+    stats = get_gridfs_stats()
+    
+    print("\n" + "=" * 60)
+    print("📊 저장소 통계")
+    print("=" * 60)
+    
+    if 'error' in stats:
+        print(f"❌ 오류: {stats['error']}")
+        return
+    
+    print(f"GridFS 원본 이미지: {stats['gridfs_files_count']:,}개 ({stats['gridfs_total_size'] / (1024 * 1024):.2f} MB)")
+    print(f"파생 이미지: {stats['variant_files_count']:,}개 ({stats['variant_total_size'] / (1024 * 1024):.2f} MB)")
+    print(f"제공 포맷: {', '.join(stats['variant_formats']) or '없음 (원본 포맷만)'}")
+    print("=" * 60 + "\n")
+
+
+def run_backfill(batch_size=50, sized=True, dry_run=False):
+    """파생 이미지 일괄 생성"""
+    print("\n" + "=" * 60)
+    print(f"🚀 파생 이미지 백필 {'시뮬레이션 (Dry Run)' if dry_run else '시작'}")
+    print(f"   포맷: {', '.join(IMAGE_MODERN_FORMATS)}")
+    print(f"   너비: 원본{', ' + ', '.join(str(width) for width in IMAGE_VARIANT_WIDTHS) if sized else ''}")
+    print(f"   배치 크기: {batch_size}")
+    print(f"   시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+    
+    success, fail, skip = backfill_modern_variants(batch_size=batch_size, sized=sized, dry_run=dry_run)
+    
+    # 결과 출력
+    print("\n" + "=" * 60)
+    print("📋 백필 결과")
+    print("=" * 60)
+    print(f"✅ {'변환 대상' if dry_run else '성공'}: {success:,}개")
+    print(f"❌ 실패: {fail:,}개")
+    print(f"⏭️ 건너뜀: {skip:,}개 (이미 변환됨)")
+    print(f"   완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 60)
+    
+    if not dry_run:
+        print_stats()
+    if fail > 0:
+        print("⚠️ 일부 이미지 변환에 실패했습니다. 로그를 확인하세요.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='기존 GridFS 이미지의 WebP/AVIF 파생 이미지 일괄 생성',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='실제로 변환하지 않고 대상 수만 출력'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=50,
+        help='한 번에 처리할 이미지 수 (기본: 50)'
+    )
+    
+    parser.add_argument(
+        '--full-only',
+        action='store_true',
+        help='원본 크기만 변환 (허용 너비별 축소본 생략)'
+    )
+    
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='현재 저장소 통계만 출력'
+    )
+    
+    args = parser.parse_args()
+    
+    # MongoDB 연결 확인
+    gridfs, db, _ = get_mongo_connection()
+    if gridfs is None:
+        print("❌ MongoDB 연결에 실패했습니다.")
+        print("   MONGO_URI 환경 변수를 확인하세요.")
+        sys.exit(1)
+    
+    print(f"✅ MongoDB 연결 성공: {db.name}")
+    
+    if args.stats:
+        print_stats()
+    elif not IMAGE_MODERN_FORMATS:
+        print("❌ 설치된 Pillow가 WebP/AVIF 인코딩을 지원하지 않습니다 (IMAGE_FORMATS 환경 변수도 확인하세요).")
+        sys.exit(1)
+    else:
+        run_backfill(batch_size=args.batch_size, sized=not args.full_only, dry_run=args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
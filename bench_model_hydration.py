@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+MongoModel 객체 생성(hydration) 성능 비교 마이크로 벤치마크
+
+fields 선언 기반 __slots__ 모델(현재 구현)과 이전 방식
+(__init__에서 모든 키를 setattr 한 뒤 서브클래스가 kwargs.get으로 다시 읽는 구조)의
+문서 → 객체 변환 처리량과 메모리 사용량을 비교합니다.
+MongoDB 연결 없이 메모리에서 만든 문의(Inquiry) 문서로 측정합니다.
+
+사용법:
+    python bench_model_hydration.py [옵션]
+
+옵션:
+    --count N    생성할 문서 수 (기본: 5000)
+    --repeat N   반복 측정 횟수, 가장 빠른 값 사용 (기본: 5)
+
+예시:
+    python bench_model_hydration.py
+    python bench_model_hydration.py --count 20000 --repeat 3
+"""
+
+import sys
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+# 프로젝트 경로 설정
+sys.path.insert(0, '.')
+
+from utils.mongo_models import Inquiry
+
+
+class LegacyMongoModel:
+    """이전 MongoModel 구현 (비교용)"""
+    
+    def __init__(self, **kwargs):
+        self._id = kwargs.get('_id') or kwargs.get('id')
+        self.id = self._id
+        for key, value in kwargs.items():
+            if key != '_id':
+                setattr(self, key, value)
+    
+    @classmethod
+    def from_doc(cls, doc):
+        if doc is None:
+            return None
+        obj = cls(**doc)
+        obj._id = doc.get('_id')
+        obj.id = doc.get('_id')
+        return obj
+    
+    def to_doc(self):
+        doc = {}
+        for key, value in self.__dict__.items():
+            if not key.startswith('_') or key == '_id':
+                if key == '_id' and value is not None:
+                    doc['_id'] = value
+                elif key != 'id':
+                    doc[key] = value
+        return doc
+
+
+class LegacyInquiry(LegacyMongoModel):
+    """이전 Inquiry 구현 (비교용)"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.name = kwargs.get('name', '')
+        self.phone = kwargs.get('phone', '')
+        self.email = kwargs.get('email', '')
+        self.service_id = kwargs.get('service_id')
+        self.message = kwargs.get('message', '')
+        self.status = kwargs.get('status', '대기')
+        self.created_at = kwargs.get('created_at', datetime.utcnow())
+        self._service = None
+        self.is_spam = kwargs.get('is_spam', False)
+        self.spam_reason = kwargs.get('spam_reason', '')
+        self.is_irrelevant = kwargs.get('is_irrelevant', False)
+        self.irrelevant_reason = kwargs.get('irrelevant_reason', '')
+        self.detected_language = kwargs.get('detected_language', '')
+        self.sentiment = kwargs.get('sentiment', '')
+        self.sentiment_detail = kwargs.get('sentiment_detail', '')
+        self.ai_response = kwargs.get('ai_response', '')
+        self.translated_message = kwargs.get('translated_message', '')
+        self.response_sent = kwargs.get('response_sent', False)
+        self.response_sent_at = kwargs.get('response_sent_at')
+        self.response_email_subject = kwargs.get('response_email_subject', '')
+        self.admin_notified = kwargs.get('admin_notified', False)
+        self.ai_processed = kwargs.get('ai_processed', False)
+        self.ai_processed_at = kwargs.get('ai_processed_at')
+
+
+def make_docs(count):
+    """문의 컬렉션과 같은 형태의 샘플 문서 생성 (일부는 AI 필드가 없는 구버전 문서)"""
+    now = datetime.utcnow()
+    docs = []
+    for i in range(count):
+        doc = {
+            '_id': i + 1,
+            'name': f'고객{i}',
+            'phone': '010-0000-0000',
+            'email': f'user{i}@example.com',
+            'service_id': i % 7 + 1,
+            'message': '촬영 문의드립니다. ' * 5,
+            'status': '대기',
+            'created_at': now,
+        }
+        if i % 3:
+            doc.update({
+                'is_spam': False,
+                'spam_reason': '',
+                'is_irrelevant': False,
+                'irrelevant_reason': '',
+                'detected_language': 'ko',
+                'sentiment': 'neutral',
+                'sentiment_detail': 'formal',
+                'ai_response': '안녕하세요. 문의 감사합니다.',
+                'translated_message': '',
+                'response_sent': True,
+                'response_sent_at': now,
+                'response_email_subject': '[스타일그래퍼] 문의 답변',
+                'admin_notified': True,
+                'ai_processed': True,
+                'ai_processed_at': now,
+            })
+        docs.append(doc)
+    return docs
+
+
+def measure_speed(model, docs, repeat):
+    """가장 빠른 반복의 (hydration 초, to_doc 초) 반환"""
+    best_load = best_dump = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        objs = [model.from_doc(doc) for doc in docs]
+        loaded = time.perf_counter()
+        for obj in objs:
+            obj.to_doc()
+        dumped = time.perf_counter()
+        
+        load_time, dump_time = loaded - start, dumped - loaded
+        best_load = load_time if best_load is None else min(best_load, load_time)
+        best_dump = dump_time if best_dump is None else min(best_dump, dump_time)
+    return best_load, best_dump
+
+
+def measure_memory(model, docs):
+    """객체 목록이 차지하는 메모리 (바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [model.from_doc(doc) for doc in docs]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objs
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MongoModel hydration 벤치마크')
+    parser.add_argument('--count', type=int, default=5000, help='생성할 문서 수 (기본: 5000)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 측정 횟수 (기본: 5)')
+    args = parser.parse_args()
+    
+    docs = make_docs(args.count)
+    
+    print("\n" + "=" * 60)
+    print(f"⏱️  MongoModel hydration 벤치마크 (문서 {args.count:,}개, {args.repeat}회 중 최고 기록)")
+    print("=" * 60)
+    
+    results = {}
+    for label, model in (('이전 구현', LegacyInquiry), ('__slots__ 모델', Inquiry)):
+        load_time, dump_time = measure_speed(model, docs, args.repeat)
+        memory = measure_memory(model, docs)
+        results[label] = (load_time, dump_time, memory)
+        print(f"{label:>12}: from_doc {args.count / load_time:>10,.0f}개/초 | "
+              f"to_doc {args.count / dump_time:>10,.0f}개/초 | "
+              f"메모리 {memory / 1024 / 1024:6.2f} MB")
+    
+    legacy, slotted = results['이전 구현'], results['__slots__ 모델']
+    print("-" * 60)
+    print(f"📈 from_doc {legacy[0] / slotted[0]:.2f}배, to_doc {legacy[1] / slotted[1]:.2f}배, "
+          f"메모리 {slotted[2] / legacy[2] * 100:.0f}% (이전 구현 대비)")
+    print("=" * 60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -62,6 +62,12 @@ def main():
     except:
         print("⚠️ pip 캐시 제거 실패 (무시 가능)")
     
+    # Jinja2 템플릿 바이트코드 캐시 제거 (템플릿 확장 코드가 바뀌어도 새로 컴파일되도록)
+    jinja_cache_dir = os.path.join(current_dir, 'instance', 'jinja_cache')
+    if os.path.isdir(jinja_cache_dir):
+        shutil.rmtree(jinja_cache_dir, ignore_errors=True)
+        print(f"✅ 템플릿 바이트코드 캐시 제거: {jinja_cache_dir}")
+    
     # Python 모듈 재로드 강제
     if hasattr(sys, '_clear_type_cache'):
         sys._clear_type_cache()
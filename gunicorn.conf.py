@@ -0,0 +1,19 @@
+"""
+gunicorn 설정 - 워커 예열 훅
+
+실행 옵션(workers/threads/timeout)은 Procfile, render.yaml 의 명령줄에 있습니다.
+앱은 워커가 fork된 뒤 로드되므로(--preload 미사용) post_fork 시점에는 아직 앱이 없어,
+앱 로드 직후이자 요청을 받기 전인 post_worker_init 에서 예열합니다 (utils/warmup.py).
+"""
+
+
+def post_worker_init(worker):
+    from utils.warmup import WARMUP_ENABLED, warm_app
+    
+    if not WARMUP_ENABLED:
+        return
+    try:
+        warm_app(worker.wsgi)
+    except Exception as e:
+        # 예열 실패로 워커가 부팅되지 않으면 안 되므로 기록만 하고 계속
+        worker.log.warning(f"워커 예열 실패: {str(e)}")
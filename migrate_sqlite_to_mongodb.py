@@ -23,8 +23,10 @@ load_dotenv()
 from app import create_app
 from extensions import db
 from sqlalchemy import text
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
 from utils.mongo_models import (
-    get_mongo_db, init_collections,
+    get_mongo_db, init_collections, sync_id_counters,
     User, Service, ServiceOption, GalleryGroup, Gallery,
     Booking, Inquiry, CollageText, SiteSettings,
     TermsOfService, PrivacyPolicy
@@ -33,6 +35,36 @@ from utils.mongo_models import (
 app = create_app()
 
 
+def insert_missing_docs(collection, docs):
+    """
+    아직 없는 문서만 한 번의 bulk_write로 삽입
+    
+    기존 _id는 $in 조회 1회로 확인하고, 나머지는 ordered=False로 한 번에 전송한다.
+    
+    Returns:
+        (삽입 수, 건너뛴 수) 튜플
+    """
+    if not docs:
+        return 0, 0
+    
+    existing = {d['_id'] for d in collection.find({'_id': {'$in': [doc['_id'] for doc in docs]}}, {'_id': 1})}
+    new_docs = [doc for doc in docs if doc['_id'] not in existing]
+    skipped = len(docs) - len(new_docs)
+    
+    if not new_docs:
+        return 0, skipped
+    
+    try:
+        result = collection.bulk_write([InsertOne(doc) for doc in new_docs], ordered=False)
+        return result.inserted_count, skipped
+    except BulkWriteError as e:
+        # 동시에 들어온 중복 등 일부 실패 - 실패 건은 건너뜀으로 집계
+        errors = e.details.get('writeErrors', [])
+        for err in errors:
+            print(f"   ⚠️ 삽입 실패 (_id={new_docs[err['index']]['_id']}): {err.get('errmsg')}")
+        return e.details.get('nInserted', 0), skipped + len(errors)
+
+
 def migrate_users():
     """사용자 마이그레이션"""
     print("\n📦 사용자 마이그레이션 중...")
@@ -44,17 +76,11 @@ def migrate_users():
         result = db.session.execute(text("SELECT id, uq_user_username, email, password_hash, is_admin FROM user"))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             user_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': user_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': user_id,
                 'username': row[1],
@@ -62,8 +88,9 @@ def migrate_users():
                 'password_hash': row[3],
                 'is_admin': bool(row[4]) if row[4] is not None else False
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 사용자: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -80,17 +107,11 @@ def migrate_services():
         result = db.session.execute(text("SELECT id, name, description, category, details, packages FROM service"))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             service_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': service_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': service_id,
                 'name': row[1],
@@ -99,8 +120,9 @@ def migrate_services():
                 'details': row[4],
                 'packages': row[5]
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 서비스: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -122,17 +144,11 @@ def migrate_service_options():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             option_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': option_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': option_id,
                 'service_id': row[1],
@@ -149,8 +165,9 @@ def migrate_service_options():
                 'refund_policy_table': row[12],
                 'overtime_charge_table': row[13]
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 서비스 옵션: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -170,17 +187,11 @@ def migrate_gallery_groups():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             group_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': group_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': group_id,
                 'title': row[1],
@@ -189,8 +200,9 @@ def migrate_gallery_groups():
                 'created_at': row[4] if row[4] else datetime.utcnow(),
                 'updated_at': row[5] if row[5] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 갤러리 그룹: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -210,17 +222,11 @@ def migrate_galleries():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             gallery_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': gallery_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': gallery_id,
                 'image_path': row[1],
@@ -229,8 +235,9 @@ def migrate_galleries():
                 'group_id': row[4],
                 'created_at': row[5] if row[5] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 갤러리 이미지: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -250,17 +257,11 @@ def migrate_bookings():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             booking_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': booking_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': booking_id,
                 'name': row[1],
@@ -270,8 +271,9 @@ def migrate_bookings():
                 'status': row[5] if row[5] else '대기',
                 'created_at': row[6] if row[6] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 예약: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -291,17 +293,11 @@ def migrate_inquiries():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             inquiry_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': inquiry_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': inquiry_id,
                 'name': row[1],
@@ -312,8 +308,9 @@ def migrate_inquiries():
                 'status': row[6] if row[6] else '대기',
                 'created_at': row[7] if row[7] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 문의: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -333,17 +330,11 @@ def migrate_collage_texts():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             text_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': text_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': text_id,
                 'text': row[1],
@@ -351,8 +342,9 @@ def migrate_collage_texts():
                 'created_at': row[3] if row[3] else datetime.utcnow(),
                 'updated_at': row[4] if row[4] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ Fade Text: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -375,17 +367,11 @@ def migrate_site_settings():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             settings_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': settings_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': settings_id,
                 'main_color_r': row[1] if row[1] is not None else 181,
@@ -400,8 +386,9 @@ def migrate_site_settings():
                 'created_at': row[10] if row[10] else datetime.utcnow(),
                 'updated_at': row[11] if row[11] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 사이트 설정: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -421,25 +408,20 @@ def migrate_terms_of_service():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             terms_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': terms_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': terms_id,
                 'content': row[1],
                 'created_at': row[2] if row[2] else datetime.utcnow(),
                 'updated_at': row[3] if row[3] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 이용약관: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -459,25 +441,20 @@ def migrate_privacy_policy():
         """))
         rows = result.fetchall()
         
-        migrated = 0
-        skipped = 0
+        docs = []
         
         for row in rows:
             policy_id = row[0]
             
-            # 이미 존재하는지 확인
-            if collection.find_one({'_id': policy_id}):
-                skipped += 1
-                continue
-            
             doc = {
                 '_id': policy_id,
                 'content': row[1],
                 'created_at': row[2] if row[2] else datetime.utcnow(),
                 'updated_at': row[3] if row[3] else datetime.utcnow()
             }
-            collection.insert_one(doc)
-            migrated += 1
+            docs.append(doc)
+        
+        migrated, skipped = insert_missing_docs(collection, docs)
         
         print(f"   ✅ 개인정보처리방침: {migrated}개 마이그레이션, {skipped}개 건너뜀")
         return migrated, skipped
@@ -517,6 +494,9 @@ def run_migration():
         traceback.print_exc()
         return False
     
+    # 명시적 _id로 넣은 문서에 맞춰 ID 카운터 재동기화
+    sync_id_counters()
+    
     # 결과 요약
     print("\n" + "=" * 60)
     print("📊 마이그레이션 결과 요약")
@@ -23,15 +23,28 @@ from utils.translation_helper import trigger_translation
 from utils.gridfs_helper import (
     save_image_to_gridfs,
     get_image_from_gridfs,
+    get_image_variant,
+    IMAGE_VARIANT_WIDTHS,
     delete_image_from_gridfs,
     get_mongo_connection,
     get_gridfs_stats,
-    migrate_legacy_to_gridfs
+    migrate_legacy_to_gridfs,
+    backfill_modern_variants,
+    get_image_cache_stats
 )
+from utils.image_disk_cache import get_image_disk_cache_stats
+from utils.mongo_client import get_pool_stats
+from utils.mongo_profiler import query_profiler
+from utils.shared_cache import get_page_cache_stats
+from utils.page_snapshots import get_snapshot_stats
+from utils.memoize import get_memoize_stats
+from utils.fragment_cache import get_fragment_cache_stats
+from utils.lazy_context import get_lazy_context_stats
+from utils.warmup import get_warmup_stats
 
 # MongoDB 모델 임포트
 from utils.mongo_models import (
-    get_mongo_db, init_collections,
+    get_mongo_db, init_collections, get_model_cache_stats,
     User, Service, ServiceOption, GalleryGroup, Gallery,
     Booking, Inquiry, CollageText, SiteSettings,
     TermsOfService, PrivacyPolicy, AdminNotificationEmail, CompanyInfo, AboutContent,
@@ -91,9 +104,9 @@ def dashboard():
         kst = pytz.timezone('Asia/Seoul')
         
         # MongoDB에서 최근 100개 데이터 가져오기
-        recent_bookings = Booking.query_all_ordered(limit=100)
-        recent_inquiries = Inquiry.query_all_ordered(limit=100)
-        recent_galleries = GalleryGroup.query_all_ordered()[:100]
+        recent_bookings = Booking.query_all_ordered(limit=100, prefetch=['service'])
+        recent_inquiries = Inquiry.query_all_ordered(limit=100, prefetch=['service'])
+        recent_galleries = GalleryGroup.query_ordered().limit(100).prefetch('images').all()
         
         # 시간대 변환
         for booking in recent_bookings:
@@ -192,6 +205,9 @@ def add_service():
             
             trigger_translation('service', service)
             
+            from routes.main import invalidate_page_cache, SERVICE_LIST_TAG
+            invalidate_page_cache(SERVICE_LIST_TAG)
+            
             flash('서비스가 성공적으로 추가되었습니다. 이제 개별 옵션을 추가해보세요.')
             return redirect(url_for('admin.list_options', service_id=service.id))
             
@@ -226,9 +242,9 @@ def add_category():
             )
             service_option.save()
             
-            # 서비스 옵션 캐시 클리어
-            from routes.main import clear_service_option_cache
-            clear_service_option_cache(service_option.id)
+            # 서비스 목록 페이지 캐시 무효화
+            from routes.main import invalidate_page_cache, SERVICE_LIST_TAG
+            invalidate_page_cache(SERVICE_LIST_TAG)
             
             # 다국어 번역 트리거
             trigger_translation('service', service)
@@ -352,8 +368,8 @@ def upload_image():
         
         try:
             # 새 갤러리의 순서 결정 (기존 갤러리 영향 없음)
-            all_groups = GalleryGroup.query_all_ordered()
-            min_order = min([g.display_order for g in all_groups]) if all_groups else 1
+            lowest_group = GalleryGroup.query_set().order_by('display_order').only('display_order').first()
+            min_order = lowest_group.display_order if lowest_group else 1
             next_order = min_order - 1 if min_order > 0 else 0
             
             print(f"🛡️ 갤러리 순서 보호: 새 갤러리를 순서 {next_order}로 배치")
@@ -365,16 +381,21 @@ def upload_image():
             )
             gallery_group.save()
             
+            galleries = []
             for i, file in enumerate(files):
                 if file and allowed_file(file.filename):
                     image_id = save_image_to_mongodb(file, gallery_group.id, i)
                     
-                    gallery = Gallery(
+                    galleries.append(Gallery(
                         image_path=image_id,
                         order=i,
                         group_id=gallery_group.id
-                    )
-                    gallery.save()
+                    ))
+            
+            # 이미지 레코드는 한 번의 bulk_write로 저장
+            for result in Gallery.bulk_save(galleries):
+                if not result['ok']:
+                    print(f"⚠️ 갤러리 이미지 레코드 저장 실패: {result['error']}")
             
             try:
                 trigger_translation('gallery_group', gallery_group)
@@ -511,6 +532,59 @@ def update_gallery_order(group_id):
     return redirect(url_for('admin.list_gallery'))
 
 
+@admin.route('/gallery/update-orders', methods=['POST'])
+@login_required
+def update_gallery_orders():
+    """여러 갤러리 그룹의 표출 순서를 한 번에 저장 (조회 1회 + bulk_write 1회)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        raw_orders = data.get('orders') or {}
+        
+        orders = {}
+        for group_id, value in raw_orders.items():
+            display_order = int(value)
+            if display_order < 0 or display_order > 999:
+                return jsonify({
+                    'success': False,
+                    'message': '표출 순서는 0~999 사이의 값이어야 합니다.'
+                }), 400
+            orders[int(group_id)] = display_order
+        
+        if not orders:
+            return jsonify({'success': False, 'message': '변경할 순서가 없습니다.'}), 400
+        
+        groups = GalleryGroup.query_set({'_id': {'$in': list(orders)}}).all()
+        now = datetime.utcnow()
+        for group in groups:
+            group.display_order = orders[group.id]
+            group.updated_at = now
+        
+        results = GalleryGroup.bulk_update(groups, ['display_order', 'updated_at'])
+        failed = [r['id'] for r in results if not r['ok']]
+        
+        try:
+            from routes.main import clear_gallery_cache
+            clear_gallery_cache()
+        except Exception as cache_error:
+            print(f"⚠️ 캐시 클리어 실패 (무시 가능): {str(cache_error)}")
+        
+        return jsonify({
+            'success': not failed,
+            'message': f'{len(results) - len(failed)}개 갤러리의 표출 순서가 업데이트되었습니다.',
+            'updated': len(results) - len(failed),
+            'failed': failed,
+            'missing': [group_id for group_id in orders if group_id not in {g.id for g in groups}]
+        })
+    except (ValueError, TypeError, AttributeError):
+        return jsonify({'success': False, 'message': '올바른 숫자를 입력해주세요.'}), 400
+    except Exception as e:
+        print(f"Error updating gallery orders: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': '갤러리 순서 업데이트 중 오류가 발생했습니다.'
+        }), 500
+
+
 @admin.route('/gallery/toggle-pin/<int:group_id>', methods=['POST'])
 @login_required
 def toggle_gallery_pin(group_id):
@@ -523,7 +597,7 @@ def toggle_gallery_pin(group_id):
         new_state = not group.is_pinned
         
         if new_state:
-            pinned_count = len([g for g in GalleryGroup.query_all_ordered() if g.is_pinned])
+            pinned_count = GalleryGroup.count({'is_pinned': True})
             if pinned_count >= 3:
                 flash('상단 고정은 최대 3개까지만 가능합니다. 다른 갤러리의 고정을 해제한 후 시도해주세요.', 'warning')
                 return redirect(url_for('admin.list_gallery'))
@@ -539,7 +613,7 @@ def toggle_gallery_pin(group_id):
             print(f"⚠️ 캐시 클리어 실패 (무시 가능): {str(cache_error)}")
         
         if new_state:
-            pinned_count = len([g for g in GalleryGroup.query_all_ordered() if g.is_pinned])
+            pinned_count = GalleryGroup.count({'is_pinned': True})
             flash(f'"{group.title}" 갤러리가 상단에 고정되었습니다. (현재 {pinned_count}/3개 고정)')
         else:
             flash(f'"{group.title}" 갤러리의 상단 고정이 해제되었습니다.')
@@ -554,7 +628,7 @@ def toggle_gallery_pin(group_id):
 @admin.route('/services')
 @login_required
 def list_services():
-    services = Service.query_all()
+    services = Service.query_all(prefetch=['options'])
     return render_template('admin/services.html', services=services)
 
 
@@ -571,6 +645,9 @@ def edit_service(id):
         
         trigger_translation('service', service)
         
+        from routes.main import invalidate_page_cache, service_tag, SERVICE_LIST_TAG
+        invalidate_page_cache(service_tag(id), SERVICE_LIST_TAG)
+        
         flash('카테고리 설명이 수정되었습니다.')
         return redirect(url_for('admin.list_services'))
         
@@ -583,10 +660,15 @@ def delete_service(id):
     service = Service.get_or_404(id)
     
     # 관련 옵션들도 삭제
+    option_ids = [option.id for option in service.options]
     for option in service.options:
         option.delete()
     
     service.delete()
+    
+    from routes.main import invalidate_page_cache, service_tag, service_option_tag, SERVICE_LIST_TAG
+    invalidate_page_cache(service_tag(id), SERVICE_LIST_TAG, *[service_option_tag(option_id) for option_id in option_ids])
+    
     flash('서비스가 삭제되었습니다.')
     return redirect(url_for('admin.list_services'))
 
@@ -614,14 +696,14 @@ def add_option_standalone():
             description=request.form.get('description', ''),
             detailed_description=request.form.get('detailed_description', '')
         )
-
+        
         details_text = request.form.get('details', '')
         if details_text.strip():
             details_list = [line.strip() for line in details_text.split('\n') if line.strip()]
             option.details = json.dumps(details_list, ensure_ascii=False)
         else:
             option.details = None
-
+        
         packages_text = request.form.get('packages', '')
         if packages_text.strip():
             packages_list = []
@@ -661,9 +743,9 @@ def add_option_standalone():
         
         option.save()
         
-        # 서비스 옵션 캐시 클리어
-        from routes.main import clear_service_option_cache
-        clear_service_option_cache(option.id)
+        # 서비스 목록 페이지 캐시 무효화 (새 옵션)
+        from routes.main import invalidate_page_cache, SERVICE_LIST_TAG
+        invalidate_page_cache(SERVICE_LIST_TAG)
         
         trigger_translation('service_option', option)
         
@@ -685,14 +767,14 @@ def add_option(service_id):
             description=request.form.get('description', ''),
             detailed_description=request.form.get('detailed_description', '')
         )
-
+        
         details_text = request.form.get('details', '')
         if details_text.strip():
             details_list = [line.strip() for line in details_text.split('\n') if line.strip()]
             option.details = json.dumps(details_list, ensure_ascii=False)
         else:
             option.details = None
-
+        
         packages_text = request.form.get('packages', '')
         if packages_text.strip():
             packages_list = []
@@ -732,9 +814,9 @@ def add_option(service_id):
         
         option.save()
         
-        # 서비스 옵션 캐시 클리어
-        from routes.main import clear_service_option_cache
-        clear_service_option_cache(option.id)
+        # 서비스 목록 페이지 캐시 무효화 (새 옵션)
+        from routes.main import invalidate_page_cache, SERVICE_LIST_TAG
+        invalidate_page_cache(SERVICE_LIST_TAG)
         
         trigger_translation('service_option', option)
         
@@ -850,9 +932,9 @@ def edit_option(option_id):
             option.save()
             print(f"✅ MongoDB 저장 성공 - 옵션 ID: {option_id}")
             
-            # 서비스 옵션 캐시 클리어
-            from routes.main import clear_service_option_cache
-            clear_service_option_cache(option_id)
+            # 해당 옵션 페이지 + 서비스 목록 페이지 캐시 무효화
+            from routes.main import invalidate_page_cache, service_option_tag, SERVICE_LIST_TAG
+            invalidate_page_cache(service_option_tag(option_id), SERVICE_LIST_TAG)
             
             flash('옵션이 수정되었습니다.')
             trigger_translation('service_option', option)
@@ -886,9 +968,9 @@ def delete_option(option_id):
     service_name = option.name
     option.delete()
     
-    # 서비스 옵션 캐시 클리어
-    from routes.main import clear_service_option_cache
-    clear_service_option_cache(option_id)
+    # 해당 옵션 페이지 + 서비스 목록 페이지 캐시 무효화
+    from routes.main import invalidate_page_cache, service_option_tag, SERVICE_LIST_TAG
+    invalidate_page_cache(service_option_tag(option_id), SERVICE_LIST_TAG)
     
     flash(f'서비스 "{service_name}"이(가) 삭제되었습니다.')
     return redirect(url_for('admin.list_services'))
@@ -899,7 +981,7 @@ def delete_option(option_id):
 def list_bookings():
     try:
         kst = pytz.timezone('Asia/Seoul')
-        bookings = Booking.query_all_ordered()
+        bookings = Booking.query_all_ordered(prefetch=['service'])
         
         for booking in bookings:
             if booking.created_at and isinstance(booking.created_at, datetime):
@@ -977,7 +1059,7 @@ def list_inquiries():
     try:
         kst = pytz.timezone('Asia/Seoul')
         # 스팸이 아닌 문의만 표시 (기본)
-        inquiries = Inquiry.query_non_spam()
+        inquiries = Inquiry.query_non_spam(prefetch=['service'])
         
         for inquiry in inquiries:
             if inquiry.created_at and isinstance(inquiry.created_at, datetime):
@@ -987,7 +1069,7 @@ def list_inquiries():
                     inquiry.created_at = inquiry.created_at.astimezone(kst)
         
         # 스팸 문의 개수
-        spam_count = len(Inquiry.query_spam())
+        spam_count = Inquiry.count({'is_spam': True})
         
         return render_template('admin/inquiries.html', inquiries=inquiries, spam_count=spam_count)
     except Exception as e:
@@ -1002,7 +1084,7 @@ def list_spam_inquiries():
     """스팸으로 분류된 문의 목록"""
     try:
         kst = pytz.timezone('Asia/Seoul')
-        inquiries = Inquiry.query_spam()
+        inquiries = Inquiry.query_spam(prefetch=['service'])
         
         for inquiry in inquiries:
             if inquiry.created_at and isinstance(inquiry.created_at, datetime):
@@ -1089,11 +1171,18 @@ def reset_admin_password(username, new_password):
 
 @admin.route('/image/<image_id>')
 def get_image(image_id):
-    """GridFS 및 레거시 저장소에서 이미지 조회"""
+    """GridFS 및 레거시 저장소에서 이미지 조회 (?w=320 지정 시 목록용 파생 이미지)"""
     try:
+        width = request.args.get('w', type=int)
+        if width is not None and width not in IMAGE_VARIANT_WIDTHS:
+            return f"Unsupported width: {width}", 400
+        
         # 1. GridFS에서 이미지 검색 시도
         try:
-            binary_data, content_type, etag = get_image_from_gridfs(image_id)
+            if width:
+                binary_data, content_type, etag = get_image_variant(image_id, width)
+            else:
+                binary_data, content_type, etag = get_image_from_gridfs(image_id)
             if binary_data:
                 response = make_response(binary_data)
                 response.headers.set('Content-Type', content_type)
@@ -1171,6 +1260,9 @@ def add_fade_text():
             
             trigger_translation('collage_text', fade_text)
             
+            from routes.main import invalidate_page_cache, COLLAGE_TEXT_TAG
+            invalidate_page_cache(COLLAGE_TEXT_TAG)
+            
             flash('Fade Text가 추가되었습니다.')
             return redirect(url_for('admin.list_fade_texts'))
         except Exception as e:
@@ -1201,6 +1293,9 @@ def edit_fade_text(id):
             
             trigger_translation('collage_text', fade_text)
             
+            from routes.main import invalidate_page_cache, COLLAGE_TEXT_TAG
+            invalidate_page_cache(COLLAGE_TEXT_TAG)
+            
             flash('Fade Text가 수정되었습니다.')
             return redirect(url_for('admin.list_fade_texts'))
             
@@ -1216,6 +1311,10 @@ def edit_fade_text(id):
 def delete_fade_text(id):
     try:
         CollageText.delete_by_id(id)
+        
+        from routes.main import invalidate_page_cache, COLLAGE_TEXT_TAG
+        invalidate_page_cache(COLLAGE_TEXT_TAG)
+        
         flash('Fade Text가 삭제되었습니다.')
     except Exception as e:
         print(f"Error deleting fade text: {str(e)}")
@@ -1261,6 +1360,10 @@ def update_site_colors():
         settings.updated_at = datetime.utcnow()
         settings.save()
         
+        # 모든 페이지의 색상 변수가 바뀌므로 사이트 공통 태그 무효화
+        from routes.main import invalidate_page_cache, SITE_TAG
+        invalidate_page_cache(SITE_TAG)
+        
         flash('사이트 색상이 성공적으로 업데이트되었습니다.')
         return redirect(url_for('admin.site_colors'))
         
@@ -1297,6 +1400,9 @@ def update_terms():
         terms.updated_at = datetime.utcnow()
         terms.save()
         
+        from routes.main import invalidate_page_cache, TERMS_TAG
+        invalidate_page_cache(TERMS_TAG)
+        
         # 다국어 번역 트리거
         trigger_translation('terms_of_service', terms)
         
@@ -1335,6 +1441,9 @@ def update_privacy():
         policy.updated_at = datetime.utcnow()
         policy.save()
         
+        from routes.main import invalidate_page_cache, PRIVACY_TAG
+        invalidate_page_cache(PRIVACY_TAG)
+        
         # 다국어 번역 트리거
         trigger_translation('privacy_policy', policy)
         
@@ -1411,6 +1520,9 @@ def update_about_content():
         about_content.updated_at = datetime.utcnow()
         about_content.save()
         
+        from routes.main import invalidate_page_cache, ABOUT_TAG
+        invalidate_page_cache(ABOUT_TAG)
+        
         flash('About 페이지 콘텐츠가 성공적으로 업데이트되었습니다. RAG 컨텍스트 및 About 페이지에 자동 반영됩니다.', 'success')
         
     except Exception as e:
@@ -1474,11 +1586,18 @@ def translations_dashboard():
 def migrate_translations():
     """전체 데이터 번역 마이그레이션 (비동기)"""
     import threading
+    from routes.main import invalidate_page_cache, lang_tag
+    from utils.translation import SUPPORTED_LANGUAGES
+    
+    app = current_app._get_current_object()
     
     def run_migration():
         try:
             from utils.translation import migrate_all_translations
             migrate_all_translations()
+            # 번역 언어 페이지 캐시 무효화 (한국어 원문 페이지는 그대로)
+            with app.app_context():
+                invalidate_page_cache(*[lang_tag(lang) for lang in SUPPORTED_LANGUAGES if lang != 'ko'])
         except Exception as e:
             print(f"번역 마이그레이션 오류: {str(e)}")
     
@@ -1530,8 +1649,12 @@ def storage_dashboard():
     if 'gridfs_total_size' in stats:
         size_mb = stats['gridfs_total_size'] / (1024 * 1024)
         stats['gridfs_total_size_mb'] = f"{size_mb:.2f}"
+    if 'variant_total_size' in stats:
+        stats['variant_total_size_mb'] = f"{stats['variant_total_size'] / (1024 * 1024):.2f}"
     
-    return render_template('admin/storage_dashboard.html', stats=stats)
+    return render_template('admin/storage_dashboard.html', stats=stats, pool_stats=get_pool_stats(),
+                           image_cache_stats=get_image_cache_stats(),
+                           image_disk_cache_stats=get_image_disk_cache_stats())
 
 
 @admin.route('/storage/migrate', methods=['POST'])
@@ -1555,14 +1678,73 @@ def migrate_to_gridfs():
     return redirect(url_for('admin.storage_dashboard'))
 
 
+@admin.route('/storage/backfill-variants', methods=['POST'])
+@login_required
+def backfill_image_variants():
+    """기존 이미지의 WebP/AVIF 파생 이미지 일괄 생성 (백그라운드)"""
+    import threading
+    
+    def run_backfill():
+        try:
+            backfill_modern_variants(batch_size=50)
+        except Exception as e:
+            print(f"파생 이미지 백필 오류: {str(e)}")
+    
+    thread = threading.Thread(target=run_backfill)
+    thread.daemon = True
+    thread.start()
+    
+    flash('WebP/AVIF 변환이 백그라운드에서 시작되었습니다. 이미지 수에 따라 몇 분이 소요될 수 있습니다.', 'info')
+    return redirect(url_for('admin.storage_dashboard'))
+
+
 @admin.route('/storage/stats')
 @login_required
 def storage_stats_json():
-    """GridFS 저장소 통계 JSON 반환"""
+    """GridFS 저장소 통계 + 이미지 메모리/디스크 캐시/MongoDB 연결 풀/모델 캐시/페이지 캐시/스냅샷/메모이제이션/조각 캐시/지연 컨텍스트/워커 예열 통계 JSON 반환"""
     stats = get_gridfs_stats()
+    stats['image_cache'] = get_image_cache_stats()
+    stats['image_disk_cache'] = get_image_disk_cache_stats()
+    stats['mongo_pool'] = get_pool_stats()
+    stats['model_cache'] = get_model_cache_stats()
+    stats['page_cache'] = get_page_cache_stats()
+    stats['snapshots'] = get_snapshot_stats()
+    stats['memoize'] = get_memoize_stats()
+    stats['fragment_cache'] = get_fragment_cache_stats()
+    stats['lazy_context'] = get_lazy_context_stats()
+    stats['warmup'] = get_warmup_stats()
     return jsonify(stats)
 
 
+# ========== MongoDB 쿼리 프로파일 ==========
+
+@admin.route('/db-profile')
+@login_required
+def db_profile_dashboard():
+    """MongoDB 쿼리 프로파일 (엔드포인트별 왕복 횟수, 명령별 시간, 느린 쿼리)"""
+    return render_template('admin/db_profile.html', profile=query_profiler.snapshot())
+
+
+@admin.route('/db-profile/stats')
+@login_required
+def db_profile_stats_json():
+    """MongoDB 쿼리 프로파일 JSON 반환"""
+    profile = query_profiler.snapshot()
+    profile['started_at'] = profile['started_at'].isoformat()
+    for entry in profile['slow_queries']:
+        entry['time'] = entry['time'].isoformat()
+    return jsonify(profile)
+
+
+@admin.route('/db-profile/reset', methods=['POST'])
+@login_required
+def reset_db_profile():
+    """MongoDB 쿼리 프로파일 초기화 (현재 워커)"""
+    query_profiler.reset()
+    flash('쿼리 프로파일을 초기화했습니다. (현재 워커 프로세스 기준)', 'success')
+    return redirect(url_for('admin.db_profile_dashboard'))
+
+
 # ========== 알림 이메일 관리 ==========
 
 @admin.route('/notification-emails')
@@ -1702,7 +1884,7 @@ def delete_notification_email(id):
 @login_required
 def sessions_dashboard():
     """사용자 세션 분석 대시보드"""
-    from utils.visitor_tracker import get_visitor_sessions, get_visitor_stats
+    from utils.visitor_tracker import get_visitor_sessions, get_visitor_stats, SESSION_SORT_FIELDS
     
     try:
         # 필터 파라미터
@@ -1710,23 +1892,27 @@ def sessions_dashboard():
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         sort_by = request.args.get('sort_by', 'timestamp')
+        if sort_by not in SESSION_SORT_FIELDS:
+            sort_by = 'timestamp'
         sort_order_str = request.args.get('sort_order', 'desc')
         sort_order = -1 if sort_order_str == 'desc' else 1
         ip_filter = request.args.get('ip', '').strip()
         country_filter = request.args.get('country', '').strip()
+        cursor = request.args.get('cursor') or None
         
-        # 오프셋 계산
-        offset = (page - 1) * per_page
+        # 커서가 없을 때만 오프셋 사용 (페이지 번호 직접 입력 호환)
+        offset = 0 if cursor else (page - 1) * per_page
         
-        # 세션 목록 조회
-        sessions, total_count = get_visitor_sessions(
+        # 세션 목록 조회 (다음 페이지는 커서로 이어서 조회)
+        sessions, total_count, next_cursor = get_visitor_sessions(
             days=days,
             limit=per_page,
             offset=offset,
             sort_by=sort_by,
             sort_order=sort_order,
             ip_filter=ip_filter if ip_filter else None,
-            country_filter=country_filter if country_filter else None
+            country_filter=country_filter if country_filter else None,
+            cursor=cursor
         )
         
         # 통계 조회
@@ -1752,6 +1938,7 @@ def sessions_dashboard():
                              page=page,
                              per_page=per_page,
                              total_pages=total_pages,
+                             next_cursor=next_cursor,
                              days=days,
                              sort_by=sort_by,
                              sort_order=sort_order_str,
@@ -1772,6 +1959,7 @@ def sessions_dashboard():
                              page=1,
                              per_page=50,
                              total_pages=0,
+                             next_cursor=None,
                              days=30,
                              sort_by='timestamp',
                              sort_order='desc',
@@ -1,7 +1,9 @@
 """
 Main 라우트 - MongoDB 기반
 """
-from flask import Blueprint, render_template, request, flash, redirect, url_for, current_app, send_file, make_response, session
+from flask import Blueprint, render_template, request, flash, redirect, url_for, current_app, send_file, make_response, session, Response, abort
+from werkzeug.wsgi import FileWrapper, wrap_file
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
 from flask_babel import gettext as _
 from flask_mail import Message
 import json
@@ -11,7 +13,6 @@ from PIL import Image
 from datetime import datetime, timedelta
 # pymongo 상수는 utils/mongo_models.py에서 사용
 from dotenv import load_dotenv
-import functools
 
 # MongoDB 모델 임포트
 from utils.mongo_models import (
@@ -28,10 +29,21 @@ from utils.translation_helper import (
     get_translated_collage_text,
     get_translated_gallery_group,
     translate_package_photo_category,
-    translate_package_photo_concept
+    translate_package_photo_concept,
+    on_translation_complete
 )
-from utils.gridfs_helper import get_image_from_gridfs, get_mongo_connection
-from extensions import mail, cache
+from utils.gridfs_helper import (
+    get_image_from_gridfs, open_image, get_mongo_connection,
+    IMAGE_VARIANT_WIDTHS, IMAGE_VARIANT_QUALITIES, IMAGE_MODERN_FORMATS
+)
+from utils.image_disk_cache import CachedImageFile, sendfile_headers
+from extensions import mail
+from utils.shared_cache import tagged_key, invalidate_tags, cached_page, lang_tag, mark_render_fallback
+from utils.memoize import memoize
+from utils.page_snapshots import (
+    register_snapshot_page, serve_snapshot, invalidate_snapshots, not_modified_response, add_page_validators
+)
+from utils.lang_urls import localize_pages, localize_links
 from utils.visitor_tracker import log_visitor
 from utils.email_utils import send_email_with_retry, send_customer_email, send_admin_notification
 
@@ -105,119 +117,166 @@ def track_visitor():
         # 추적 실패 시 무시 (사용자 경험에 영향 없음)
         print(f"방문자 추적 오류 (무시): {str(e)}")
 
-# 간단한 메모리 캐시 구현
-_cache = {}
-_cache_timestamps = {}
+# 페이지/계산 결과 캐시 태그 (utils/shared_cache.py - 태그를 무효화하면 그 태그가 붙은 항목만 모든 워커에서 무효화)
+GALLERY_TAG = 'gallery'            # 갤러리 목록, 홈 콜라주
+SERVICE_LIST_TAG = 'service_list'  # 서비스/옵션 목록이 보이는 페이지 (홈, /services, 서비스 메뉴)
+COLLAGE_TEXT_TAG = 'collage_text'  # 홈 Fade Text
+SITE_TAG = 'site'                  # 모든 페이지 공통 (사이트 색상)
+ABOUT_TAG = 'about'
+TERMS_TAG = 'terms'
+PRIVACY_TAG = 'privacy'
 
 
-def cache_with_timeout(timeout_seconds=300):
-    """메모리 캐시 데코레이터 (언어별 캐싱 지원, 응답 전체 캐싱)"""
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # 언어 설정을 캐시 키에 포함하여 다국어 지원
-            current_lang = get_current_language()
-            cache_key = f"{func.__name__}:{current_lang}:{hash(str(args) + str(sorted(kwargs.items())))}"
-            
-            if cache_key in _cache_timestamps:
-                if datetime.now() - _cache_timestamps[cache_key] < timedelta(seconds=timeout_seconds):
-                    return _cache[cache_key]
-            
-            result = func(*args, **kwargs)
-            _cache[cache_key] = result
-            _cache_timestamps[cache_key] = datetime.now()
-            
-            return result
-        return wrapper
-    return decorator
+def service_tag(service_id):
+    return f"service:{service_id}"
+
+
+def service_option_tag(option_id):
+    return f"service_option:{option_id}"
+
+
+def invalidate_page_cache(*tags):
+    """태그가 붙은 페이지/계산 캐시를 모든 워커에서 무효화"""
+    invalidate_tags(*tags)
+    invalidate_snapshots(tags)
+    print(f"🧹 캐시 무효화 (모든 워커): {', '.join(tags)}")
+
+
+# 레이아웃(base.html)의 서비스 메뉴/사이트 색상은 모든 페이지에 포함 - 페이지 캐시 키와 스냅샷/ETag 태그 모두에 사용
+LAYOUT_TAGS = (SERVICE_LIST_TAG, SITE_TAG)
+
+register_snapshot_page('main.index', lambda lang: (GALLERY_TAG, COLLAGE_TEXT_TAG, *LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.services', lambda lang: (*LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page(
+    'main.service_option_detail',
+    lambda lang, id: (service_option_tag(id), *LAYOUT_TAGS, lang_tag(lang)),
+    variants=lambda: [{'id': option.id} for option in ServiceOption.query_all()],
+)
+register_snapshot_page('main.gallery', lambda lang, page=1: (GALLERY_TAG, *LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.about', lambda lang: (ABOUT_TAG, *LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.customer_story', lambda lang: (*LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.commercial_portfolio', lambda lang: (*LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.terms_of_service', lambda lang: (TERMS_TAG, *LAYOUT_TAGS, lang_tag(lang)))
+register_snapshot_page('main.privacy_policy', lambda lang: (PRIVACY_TAG, *LAYOUT_TAGS, lang_tag(lang)))
+
+# 언어 접두사 URL(/en/services 등)로도 제공하는 공개 페이지 - 세션/쿠키 없이 응답해 공유 캐시 가능
+localize_pages(
+    'main.index', 'main.services', 'main.service_detail', 'main.service_option_detail',
+    'main.gallery', 'main.gallery_detail', 'main.booking_choice', 'main.customer_story',
+    'main.commercial_portfolio', 'main.about', 'main.terms_of_service', 'main.privacy_policy',
+    'main.ai_analysis', 'main.styling_consulting', 'main.oneday_styling', 'main.photo_profile',
+)
+# 세션을 쓰는 폼 페이지는 접두사 대신 ?lang= 으로 언어 유지
+localize_links('main.contact', 'main.ask')
+
+
+# 비동기 번역이 끝나면 번역본이 보이는 페이지 무효화 (admin 저장 시점에는 아직 이전 번역)
+_TRANSLATION_TAGS = {
+    'service': lambda obj: (service_tag(obj.id), SERVICE_LIST_TAG),
+    'service_option': lambda obj: (service_option_tag(obj.id), SERVICE_LIST_TAG),
+    'collage_text': lambda obj: (COLLAGE_TEXT_TAG,),
+    'gallery_group': lambda obj: (GALLERY_TAG,),
+    'terms_of_service': lambda obj: (TERMS_TAG,),
+    'privacy_policy': lambda obj: (PRIVACY_TAG,),
+}
+
+
+@on_translation_complete
+def _invalidate_translated_pages(model_type, model_instance):
+    tags_of = _TRANSLATION_TAGS.get(model_type)
+    if tags_of:
+        invalidate_page_cache(*tags_of(model_instance))
+
+
+@main.before_request
+def serve_page_snapshot():
+    """
+    공개 페이지 빠른 응답 (방문자 기록 이후 실행)
+    
+    - 클라이언트 사본이 최신이면 렌더링 없이 304
+    - 사전 렌더링된 스냅샷이 있으면 뷰/MongoDB 조회 없이 파일 응답
+    """
+    return not_modified_response() or serve_snapshot()
+
+
+main.after_request(add_page_validators)
+
+
+def make_cache_key_index():
+    """홈 페이지용 캐시 키 생성 함수 (갤러리/Fade Text/레이아웃 변경 시 무효화)"""
+    lang = get_current_language()
+    return tagged_key((GALLERY_TAG, COLLAGE_TEXT_TAG, *LAYOUT_TAGS, lang_tag(lang)), 'index', lang)
 
 
 def make_cache_key_with_lang():
-    """언어별 캐시 키 생성 함수"""
+    """언어별 캐시 키 생성 함수 (레이아웃 - 서비스 목록/사이트 색상 변경 시 무효화)"""
     lang = get_current_language()
-    return f"{request.path}:{lang}"
+    return tagged_key((*LAYOUT_TAGS, lang_tag(lang)), request.path, lang)
+
+
+def _gallery_cursor():
+    """
+    갤러리 ?cursor= 값 (없으면 None)
+    
+    캐시 키에 넣기 전에 검증하므로 잘못된 커서는 400으로 응답하고 페이지 캐시에 저장하지 않는다.
+    """
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            GalleryGroup.query_ordered().cursor_values(cursor)
+        except ValueError as e:
+            abort(400, description=str(e))
+    return cursor or None
 
 
 def make_cache_key_gallery():
-    """갤러리 페이지용 캐시 키 생성 함수 (페이지 번호 포함)"""
+    """갤러리 페이지용 캐시 키 생성 함수 (커서/페이지 번호, HTMX 조각 여부 포함)"""
     lang = get_current_language()
-    # URL에서 페이지 번호 추출
+    # URL에서 페이지 번호 추출 (이전 /gallery/<page> 링크 호환)
     page = request.view_args.get('page', 1) if request.view_args else 1
-    return f"gallery:{lang}:{page}"
+    cursor = _gallery_cursor() or ''
+    fragment = 'hx' if request.headers.get('HX-Request') else 'full'
+    return tagged_key((GALLERY_TAG, *LAYOUT_TAGS, lang_tag(lang)), 'gallery', lang, page, cursor, fragment)
 
 
 def make_cache_key_service_detail():
     """서비스 상세 페이지용 캐시 키 생성 함수"""
     lang = get_current_language()
     service_id = request.view_args.get('id', 0) if request.view_args else 0
-    return f"service:{lang}:{service_id}"
+    return tagged_key((service_tag(service_id), *LAYOUT_TAGS, lang_tag(lang)), 'service', lang, service_id)
 
 
 def make_cache_key_service_option():
-    """서비스 옵션 상세 페이지용 캐시 키 생성 함수"""
+    """서비스 옵션 상세 페이지용 캐시 키 생성 함수 (옵션/패키지 화보 변경 시 무효화)"""
     lang = get_current_language()
     option_id = request.view_args.get('id', 0) if request.view_args else 0
-    return f"service_option:{lang}:{option_id}"
+    return tagged_key((service_option_tag(option_id), *LAYOUT_TAGS, lang_tag(lang)), 'service_option', lang, option_id)
 
 
 def clear_gallery_cache():
-    """갤러리 관련 캐시를 모두 클리어하는 함수"""
-    global _cache, _cache_timestamps
-    keys_to_remove = []
-    
-    for key in _cache.keys():
-        if key.startswith('gallery:') or key.startswith('index:'):
-            keys_to_remove.append(key)
-    
-    for key in keys_to_remove:
-        if key in _cache:
-            del _cache[key]
-        if key in _cache_timestamps:
-            del _cache_timestamps[key]
-    
-    print(f"🧹 갤러리 캐시 클리어 완료: {len(keys_to_remove)}개 항목 제거")
+    """갤러리 관련 캐시(갤러리 목록, 홈)를 무효화하는 함수"""
+    invalidate_page_cache(GALLERY_TAG)
 
 
 def clear_service_option_cache(option_id=None):
-    """서비스 옵션 관련 캐시를 클리어하는 함수
+    """서비스 옵션 관련 캐시를 무효화하는 함수
     
     Args:
-        option_id: 특정 옵션 ID만 클리어할 경우 지정 (None이면 모든 서비스 옵션 캐시 클리어)
+        option_id: 특정 옵션 페이지만 무효화할 경우 지정 (None이면 서비스 목록 페이지 무효화)
     """
-    global _cache, _cache_timestamps
-    
-    # 지원되는 언어 목록
-    languages = ['ko', 'en', 'ja', 'zh', 'es']
-    
-    # Flask-Caching 캐시 클리어
     if option_id:
-        # 특정 옵션에 대해 모든 언어별 캐시 클리어
-        for lang in languages:
-            cache_key = f"service_option:{lang}:{option_id}"
-            cache.delete(cache_key)
-        print(f"🧹 서비스 옵션 캐시 클리어 완료 - 옵션 ID: {option_id}")
+        invalidate_page_cache(service_option_tag(option_id))
     else:
-        # 모든 서비스 옵션 캐시 클리어 (패턴 삭제가 지원되지 않으면 전체 클리어)
-        cache.clear()
-        print(f"🧹 전체 캐시 클리어 완료")
-    
-    # 메모리 캐시에서도 서비스 관련 캐시 클리어
-    keys_to_remove = []
-    for key in list(_cache.keys()):
-        if key.startswith('get_all_services:') or key.startswith('service_option:'):
-            keys_to_remove.append(key)
-    
-    for key in keys_to_remove:
-        if key in _cache:
-            del _cache[key]
-        if key in _cache_timestamps:
-            del _cache_timestamps[key]
-    
-    if keys_to_remove:
-        print(f"🧹 메모리 캐시 클리어 완료: {len(keys_to_remove)}개 항목 제거")
+        invalidate_page_cache(SERVICE_LIST_TAG)
+
+
+def make_memo_key_services():
+    """get_all_services 메모 키 (언어별, 서비스 목록/번역 변경 시 모든 워커에서 새로 계산)"""
+    lang = get_current_language()
+    return tagged_key((SERVICE_LIST_TAG, lang_tag(lang)), 'get_all_services', lang)
 
 
-@cache_with_timeout(300)  # 5분 캐싱
+@memoize('get_all_services', maxsize=32, ttl=300, key=make_memo_key_services)  # 5분 캐싱
 def get_all_services():
     """모든 서비스와 서비스 옵션을 가져와서 카테고리별로 그룹화 (i18n 적용)"""
     from collections import OrderedDict
@@ -278,10 +337,10 @@ def get_all_services():
 
 
 @main.route('/')
-@cache.cached(timeout=300, key_prefix=make_cache_key_with_lang)  # 5분 캐싱 (전체 응답)
+@cached_page(timeout=300, key_prefix=make_cache_key_index)  # 5분 캐싱 (전체 응답)
 def index():
-    # 갤러리 그룹을 상단 고정, 표출 순서, 생성일 순으로 가져오기
-    all_galleries = GalleryGroup.query_all_ordered()
+    # 갤러리 그룹을 상단 고정, 표출 순서, 생성일 순으로 가져오기 (필요한 6개만 조회)
+    all_galleries = GalleryGroup.query_ordered().limit(6).all()
     
     # 상위 3개는 collage용 (상단 고정된 갤러리가 우선)
     recent_galleries = all_galleries[:3] if all_galleries else []
@@ -312,7 +371,7 @@ def index():
 
 
 @main.route('/services')
-@cache.cached(timeout=300, key_prefix=make_cache_key_with_lang)  # 5분 캐싱
+@cached_page(timeout=300, key_prefix=make_cache_key_with_lang)  # 5분 캐싱
 def services():
     lang = get_current_language()
     
@@ -347,7 +406,7 @@ def services():
         }
     }
     
-    services_list = Service.query_all()
+    services_list = Service.query_all(prefetch=['options'])
     translated_options = {}
     
     for service in services_list:
@@ -364,7 +423,7 @@ def services():
 
 
 @main.route('/service/<int:id>')
-@cache.cached(timeout=300, key_prefix=make_cache_key_service_detail)  # 5분 캐싱
+@cached_page(timeout=300, key_prefix=make_cache_key_service_detail)  # 5분 캐싱
 def service_detail(id):
     service = Service.get_or_404(id)
     
@@ -382,7 +441,7 @@ def service_detail(id):
 
 
 @main.route('/service_option/<int:id>')
-@cache.cached(timeout=300, key_prefix=make_cache_key_service_option)  # 5분 캐싱
+@cached_page(timeout=300, key_prefix=make_cache_key_service_option)  # 5분 캐싱
 def service_option_detail(id):
     service_option = ServiceOption.get_or_404(id)
     
@@ -437,6 +496,121 @@ def service_option_detail(id):
                          translate_concept=translate_package_photo_concept)
 
 
+def _requested_variant():
+    """
+    요청 크기 파라미터 (?w=320&q=75)
+    
+    Returns:
+        (width, quality) - 파라미터가 없으면 (None, None)
+    
+    Raises:
+        ValueError: 허용 목록(IMAGE_VARIANT_WIDTHS/QUALITIES)에 없는 값
+    """
+    width = request.args.get('w', type=int)
+    quality = request.args.get('q', type=int)
+    if width is None:
+        if quality is not None or 'w' in request.args:
+            raise ValueError('w 파라미터가 필요합니다')
+        return None, None
+    if width not in IMAGE_VARIANT_WIDTHS or (quality is not None and quality not in IMAGE_VARIANT_QUALITIES):
+        raise ValueError(f"지원하지 않는 이미지 크기: w={width}, q={quality}")
+    return width, quality
+
+
+def _accepted_image_formats():
+    """
+    Accept 헤더에 명시된 최신 포맷 (AVIF, WebP)
+    
+    */* 만 보내는 클라이언트는 원본 포맷(JPEG/PNG/GIF)을 받는다.
+    """
+    accepted = {value.lower() for value, q in request.accept_mimetypes if q > 0}
+    return [fmt for fmt in IMAGE_MODERN_FORMATS if f'image/{fmt}' in accepted]
+
+
+def _body_length(body):
+    # bytes, GridOut (fs.files의 length) 또는 CachedImageFile (디스크 캐시 파일 크기)
+    return len(body) if isinstance(body, bytes) else body.length
+
+
+def _load_image(image_id, width, quality):
+    """
+    원본 또는 파생 이미지 조회 → (body, content_type, etag)
+    
+    body는 디스크 캐시 파일, bytes, 큰 이미지의 GridOut 중 하나 (open_image 참고).
+    요청 중에는 가장 선호하는 포맷(AVIF 우선)만 인코딩하고, 다른 포맷은 이미 만들어진 것
+    (업로드 직후/백필 생성분)만 비교해 가장 작은 것을 보낸다 (이미지에 따라 AVIF가 WebP보다 클 수 있음).
+    최신 포맷을 만들 수 없으면 원본 포맷으로 응답한다.
+    """
+    fmts = _accepted_image_formats()
+    if not fmts:
+        return open_image(image_id, width, quality)
+    
+    candidates = [open_image(image_id, width, quality, fmt, create=False) for fmt in fmts[1:]]
+    candidates.append(open_image(image_id, width, quality, fmts[0]))
+    candidates = [candidate for candidate in candidates if candidate[0] is not None]
+    if not candidates:
+        return open_image(image_id, width, quality)
+    chosen = min(candidates, key=lambda candidate: _body_length(candidate[0]))
+    for body, _, _ in candidates:
+        if body is not chosen[0] and not isinstance(body, bytes):
+            body.close()
+    return chosen
+
+
+def _image_response(body, content_type, etag, cache_headers):
+    """
+    이미지 응답 - 디스크 캐시 파일은 wsgi.file_wrapper(또는 프록시 X-Accel-Redirect/X-Sendfile),
+    메모리 데이터는 그대로, GridOut은 청크 단위 스트리밍
+    
+    If-None-Match(304), Range/If-Range(206) 처리와 Content-Length(fs.files length)는 make_conditional이 담당한다.
+    (프록시가 파일을 보내는 경우 Range는 프록시가 처리)
+    """
+    proxy_headers = {}
+    if isinstance(body, CachedImageFile):
+        proxy_headers = sendfile_headers(body)
+    if proxy_headers:
+        body.close()
+        response = Response(mimetype=content_type, headers=proxy_headers)
+    elif isinstance(body, CachedImageFile):
+        # gunicorn은 wsgi.file_wrapper 응답을 sendfile로 전송 (파이썬에서 바이트를 복사하지 않음)
+        response = Response(wrap_file(request.environ, body.file), mimetype=content_type, direct_passthrough=True)
+        response.content_length = body.length
+    elif isinstance(body, bytes):
+        response = Response(body, mimetype=content_type)
+    else:
+        # GridOut은 seek 가능하므로 Range 요청은 해당 위치의 청크부터 읽음
+        response = Response(FileWrapper(body, body.chunk_size), mimetype=content_type, direct_passthrough=True)
+        response.content_length = body.length
+    if etag:
+        response.set_etag(etag)
+    response.accept_ranges = 'bytes'
+    for key, value in cache_headers.items():
+        response.headers[key] = value
+    if proxy_headers:
+        response = response.make_conditional(request)
+        if response.status_code == 304:
+            # 304에도 파일을 보내는 프록시가 있으므로 헤더 제거
+            for key in proxy_headers:
+                response.headers.pop(key, None)
+        return response
+    try:
+        return response.make_conditional(request, accept_ranges=True, complete_length=_body_length(body))
+    except RequestedRangeNotSatisfiable:
+        response.close()
+        raise
+
+
+@main.app_template_global()
+def image_srcset(endpoint, image_id, widths=IMAGE_VARIANT_WIDTHS):
+    """
+    반응형 이미지 srcset 값 (예: '/image/abc?w=320 320w, /image/abc?w=640 640w')
+    
+    원본이 요청 너비보다 작으면 서버가 원본을 그대로 응답하므로 widths는 최대 표시 크기까지만 지정하면 된다.
+    """
+    arg = 'image_path' if endpoint == 'main.serve_image' else 'image_id'
+    return ', '.join(f"{url_for(endpoint, w=width, **{arg: image_id})} {width}w" for width in widths)
+
+
 @main.route('/image/<path:image_path>')
 def serve_image(image_path):
     """GridFS 및 레거시 저장소에서 이미지를 효율적으로 서빙하는 라우트 (캐싱 최적화)"""
@@ -444,29 +618,21 @@ def serve_image(image_path):
         # 강화된 캐싱 헤더 설정 (30일 캐싱 + ETag)
         cache_headers = {
             'Cache-Control': 'public, max-age=2592000, immutable',
-            'Vary': 'Accept-Encoding'
+            'Vary': 'Accept, Accept-Encoding'  # Accept에 따라 WebP/AVIF 응답
         }
         
-        # 1. GridFS에서 이미지 조회 시도 (메모리 캐시 + ETag 지원)
         try:
-            binary_data, content_type, etag = get_image_from_gridfs(image_path)
-            if binary_data:
-                # ETag 기반 조건부 요청 처리 (304 Not Modified)
-                if etag:
-                    client_etag = request.headers.get('If-None-Match')
-                    if client_etag and client_etag.strip('"') == etag:
-                        response = make_response('', 304)
-                        response.headers['ETag'] = f'"{etag}"'
-                        response.headers['Cache-Control'] = cache_headers['Cache-Control']
-                        return response
-                
-                response = make_response(binary_data)
-                response.headers['Content-Type'] = content_type
-                if etag:
-                    response.headers['ETag'] = f'"{etag}"'
-                for key, value in cache_headers.items():
-                    response.headers[key] = value
-                return response
+            width, quality = _requested_variant()
+        except ValueError as e:
+            return str(e), 400
+        
+        # 1. GridFS에서 이미지 조회 시도 (메모리 캐시/스트리밍 + ETag/Range 지원, ?w= 지정 시 파생 이미지)
+        try:
+            body, content_type, etag = _load_image(image_path, width, quality)
+            if body is not None:
+                return _image_response(body, content_type, etag, cache_headers)
+        except RequestedRangeNotSatisfiable:
+            raise
         except Exception as gridfs_error:
             print(f"GridFS 조회 중 오류: {str(gridfs_error)}")
         
@@ -494,6 +660,8 @@ def serve_image(image_path):
         
         return "Image not found", 404
         
+    except RequestedRangeNotSatisfiable:
+        raise
     except Exception as e:
         print(f"이미지 서빙 오류: {str(e)}")
         return "Image serving error", 500
@@ -505,30 +673,23 @@ def serve_package_photo_image(image_id):
     try:
         cache_headers = {
             'Cache-Control': 'public, max-age=2592000, immutable',
-            'Vary': 'Accept-Encoding'
+            'Vary': 'Accept, Accept-Encoding'  # Accept에 따라 WebP/AVIF 응답
         }
         
-        binary_data, content_type, etag = get_image_from_gridfs(image_id)
-        if binary_data:
-            # ETag 기반 조건부 요청 처리
-            if etag:
-                client_etag = request.headers.get('If-None-Match')
-                if client_etag and client_etag.strip('"') == etag:
-                    response = make_response('', 304)
-                    response.headers['ETag'] = f'"{etag}"'
-                    response.headers['Cache-Control'] = cache_headers['Cache-Control']
-                    return response
-            
-            response = make_response(binary_data)
-            response.headers['Content-Type'] = content_type
-            if etag:
-                response.headers['ETag'] = f'"{etag}"'
-            for key, value in cache_headers.items():
-                response.headers[key] = value
-            return response
+        try:
+            width, quality = _requested_variant()
+        except ValueError as e:
+            return str(e), 400
+        
+        body, content_type, etag = _load_image(image_id, width, quality)
+        if body is not None:
+            # ETag 기반 조건부 요청(304), Range 요청(206) 처리
+            return _image_response(body, content_type, etag, cache_headers)
         
         return "Image not found", 404
         
+    except RequestedRangeNotSatisfiable:
+        raise
     except Exception as e:
         print(f"패키지 화보 이미지 서빙 오류: {str(e)}")
         return "Image serving error", 500
@@ -536,21 +697,23 @@ def serve_package_photo_image(image_id):
 
 @main.route('/gallery')
 @main.route('/gallery/<int:page>')
-@cache.cached(timeout=300, key_prefix=make_cache_key_gallery)  # 5분 캐싱
+@cached_page(timeout=300, key_prefix=make_cache_key_gallery)  # 5분 캐싱
 def gallery(page=1):
+    per_page = 9
+    cursor = _gallery_cursor()
+    
     try:
-        per_page = 9
-        
-        # 갤러리 그룹 총 개수 조회
-        total_groups = GalleryGroup.count()
-        
-        # 페이지네이션 정보
-        total_pages = (total_groups + per_page - 1) // per_page
-        has_more = page < total_pages
-        next_page = page + 1 if has_more else None
-        
-        # 페이지네이션된 갤러리 그룹 조회
-        gallery_groups = GalleryGroup.query_paginated(page=page, per_page=per_page)
+        if page > 1 and not cursor:
+            # 이전 페이지 번호 링크 호환 (skip 기반)
+            total_groups = GalleryGroup.count()
+            gallery_groups = GalleryGroup.query_paginated(page=page, per_page=per_page, prefetch=['images'])
+            has_more = page * per_page < total_groups
+            next_url = url_for('main.gallery', page=page + 1) if has_more else None
+        else:
+            # 커서 기반 조회 - 마지막 (is_pinned, display_order, created_at, _id) 이후만 읽음
+            gallery_groups, next_cursor = GalleryGroup.query_keyset(cursor=cursor, per_page=per_page, prefetch=['images'])
+            has_more = next_cursor is not None
+            next_url = url_for('main.gallery', cursor=next_cursor) if has_more else None
         
         # 딕셔너리 형태로 변환 (템플릿 호환성)
         groups_dict = []
@@ -570,7 +733,7 @@ def gallery(page=1):
             if has_more:
                 button_html = f'''
                 <button class="btn gallery-more-btn"
-                        hx-get="{url_for('main.gallery', page=next_page)}"
+                        hx-get="{next_url}"
                         hx-target="#gallery-container"
                         hx-swap="beforeend"
                         hx-trigger="click"
@@ -591,16 +754,17 @@ def gallery(page=1):
         return render_template('gallery.html', 
                               gallery_groups=groups_dict, 
                               has_more=has_more,
-                              next_page=next_page)
+                              next_url=next_url)
                               
     except Exception as e:
         print(f"Error in gallery route: {str(e)}")
         import traceback
         traceback.print_exc()
+        mark_render_fallback()
         return render_template('gallery.html', 
                               gallery_groups=[], 
                               has_more=False,
-                              next_page=None)
+                              next_url=None)
 
 
 @main.route('/gallery/detail/<int:group_id>')
@@ -1076,8 +1240,7 @@ def terms_of_service():
     
     # 서비스별 환불 조건 표시를 위한 데이터
     lang = get_current_language()
-    services = Service.query_all()
-    service_options = ServiceOption.query_all()
+    service_options = ServiceOption.query_all(prefetch=['service'])
     
     # 서비스 옵션의 번역된 데이터 준비
     refund_policies = []
@@ -0,0 +1,27 @@
+"""
+pytest 공통 설정
+
+MongoDB 없이 실행할 수 있는 단위 테스트만 둡니다.
+페이지 캐시가 필요한 테스트는 SimpleCache를 쓰는 최소 Flask 앱(app 픽스처)을 사용합니다.
+
+실행:
+    python -m pytest
+"""
+
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extensions import cache  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config.update(TESTING=True, CACHE_TYPE='SimpleCache', CACHE_DEFAULT_TIMEOUT=300)
+    cache.init_app(app)
+    return app
@@ -0,0 +1,70 @@
+"""키셋(커서) 페이지네이션 커서 인코딩/검증 (utils/mongo_models.py)"""
+
+import base64
+from datetime import datetime
+
+import pytest
+from bson import json_util
+from pymongo import ASCENDING, DESCENDING
+
+from utils.mongo_models import encode_cursor, decode_cursor, keyset_filter
+
+SORT = [('is_pinned', DESCENDING), ('display_order', ASCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)]
+
+
+def _raw_cursor(payload):
+    raw = json_util.dumps(payload).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def test_round_trip_keeps_types():
+    doc = {'_id': 42, 'is_pinned': True, 'display_order': None, 'created_at': datetime(2024, 5, 1, 12, 30)}
+    cursor = encode_cursor(SORT, doc)
+    
+    assert '=' not in cursor
+    assert decode_cursor(cursor, SORT) == [True, None, datetime(2024, 5, 1, 12, 30), 42]
+
+
+@pytest.mark.parametrize('cursor', ['', 'not-base64!', base64.urlsafe_b64encode(b'{broken').decode('ascii')])
+def test_rejects_corrupted_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, SORT)
+
+
+def test_rejects_cursor_from_other_sort():
+    cursor = encode_cursor([('created_at', DESCENDING), ('_id', DESCENDING)], {'_id': 1, 'created_at': None})
+    
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, SORT)
+
+
+@pytest.mark.parametrize('values', [
+    [{'$ne': None}, 0, None, 1],  # 연산자 문서
+    [[True, False], 0, None, 1],  # 배열
+    [True, 0, None],  # 개수 불일치
+    'abc',
+])
+def test_rejects_values_that_would_change_the_filter(values):
+    cursor = _raw_cursor({'k': [field for field, _ in SORT], 'v': values})
+    
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, SORT)
+
+
+def test_keyset_filter_continues_after_last_key():
+    sort = [('display_order', ASCENDING), ('_id', DESCENDING)]
+    
+    assert keyset_filter(sort, [3, 10]) == {'$or': [
+        {'display_order': {'$gt': 3}},
+        {'display_order': 3, '_id': {'$lt': 10}},
+        {'display_order': 3, '_id': None},
+    ]}
+
+
+def test_keyset_filter_orders_null_first_when_ascending():
+    sort = [('display_order', ASCENDING), ('_id', ASCENDING)]
+    
+    assert keyset_filter(sort, [None, 7]) == {'$or': [
+        {'display_order': {'$ne': None}},
+        {'display_order': None, '_id': {'$gt': 7}},
+    ]}
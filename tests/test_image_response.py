@@ -0,0 +1,84 @@
+"""이미지 응답의 Range/If-Range/조건부 요청 처리 (routes/main.py _image_response)"""
+
+import pytest
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+
+from routes.main import _image_response
+from utils.image_disk_cache import CachedImageFile
+
+BODY = bytes(range(256)) * 4  # 1024바이트
+ETAG = 'abc123'
+CACHE_HEADERS = {'Cache-Control': 'public, max-age=2592000, immutable'}
+
+
+@pytest.fixture(params=['bytes', 'file'])
+def body(request, tmp_path):
+    """메모리 데이터와 디스크 캐시 파일 두 경로 모두 검사"""
+    if request.param == 'bytes':
+        yield BODY
+        return
+    path = tmp_path / 'original~abc123.jpeg'
+    path.write_bytes(BODY)
+    image_file = CachedImageFile(str(path), open(path, 'rb'), len(BODY))
+    yield image_file
+    image_file.close()
+
+
+def _respond(app, body, headers=None):
+    with app.test_request_context('/image/x', headers=headers or {}):
+        response = _image_response(body, 'image/jpeg', ETAG, CACHE_HEADERS)
+        response.direct_passthrough = False
+        return response.status_code, response.headers, response.get_data()
+
+
+def test_full_response_advertises_ranges(app, body):
+    status, headers, data = _respond(app, body)
+    
+    assert status == 200
+    assert data == BODY
+    assert headers['Accept-Ranges'] == 'bytes'
+    assert headers['Content-Length'] == str(len(BODY))
+    assert headers['ETag'] == f'"{ETAG}"'
+    assert headers['Cache-Control'] == CACHE_HEADERS['Cache-Control']
+
+
+def test_range_returns_partial_content(app, body):
+    status, headers, data = _respond(app, body, {'Range': 'bytes=100-199'})
+    
+    assert status == 206
+    assert data == BODY[100:200]
+    assert headers['Content-Range'] == f'bytes 100-199/{len(BODY)}'
+    assert headers['Content-Length'] == '100'
+
+
+def test_suffix_range(app, body):
+    status, headers, data = _respond(app, body, {'Range': 'bytes=-24'})
+    
+    assert status == 206
+    assert data == BODY[-24:]
+
+
+def test_unsatisfiable_range(app, body):
+    with pytest.raises(RequestedRangeNotSatisfiable):
+        _respond(app, body, {'Range': f'bytes={len(BODY) + 10}-'})
+
+
+def test_if_range_with_old_etag_sends_whole_image(app, body):
+    status, _, data = _respond(app, body, {'Range': 'bytes=0-9', 'If-Range': '"stale"'})
+    
+    assert status == 200
+    assert data == BODY
+
+
+def test_if_range_with_current_etag_sends_range(app, body):
+    status, _, data = _respond(app, body, {'Range': 'bytes=0-9', 'If-Range': f'"{ETAG}"'})
+    
+    assert status == 206
+    assert data == BODY[:10]
+
+
+def test_if_none_match_returns_not_modified(app, body):
+    status, headers, _ = _respond(app, body, {'If-None-Match': f'"{ETAG}"'})
+    
+    assert status == 304
+    assert headers['ETag'] == f'"{ETAG}"'
@@ -0,0 +1,109 @@
+"""크기 제한 TTL/LRU 캐시 (utils/memoize.py)"""
+
+import threading
+import time
+
+from utils.memoize import TTLCache, memoize
+
+
+def test_evicts_least_recently_used_over_maxsize():
+    cache = TTLCache('test-lru', maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')  # a를 최근 사용으로
+    cache.set('c', 3)
+    
+    assert cache.keys() == ['a', 'c']
+    assert cache.stats()['evictions'] == 1
+
+
+def test_expired_entries_are_misses():
+    cache = TTLCache('test-ttl', maxsize=4, ttl=0)
+    cache.set('a', 1)
+    
+    assert cache.get('a', 'missing') == 'missing'
+    assert cache.stats()['expired'] == 1
+
+
+def test_memoize_decorator_caches_by_arguments():
+    calls = []
+    
+    @memoize('test-memoize', maxsize=4, ttl=60)
+    def square(x):
+        calls.append(x)
+        return x * x
+    
+    assert square(3) == 9
+    assert square(3) == 9
+    assert square(4) == 16
+    assert calls == [3, 4]
+    assert square.__wrapped__(3) == 9
+
+
+def test_get_or_set_computes_concurrent_misses_once():
+    cache = TTLCache('test-single-flight', maxsize=4, ttl=60)
+    calls = []
+    start = threading.Barrier(5)
+    results = []
+    
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'value'
+    
+    def worker():
+        start.wait()
+        results.append(cache.get_or_set('key', compute))
+    
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert results == ['value'] * 5
+    assert len(calls) == 1
+    assert cache.stats()['waits'] == 4
+
+
+def test_byte_limit_evicts_oldest_and_rejects_oversize():
+    cache = TTLCache('test-bytes', maxsize=100, ttl=60, maxbytes=10, sizeof=len)
+    cache.set('a', b'1234')
+    cache.set('b', b'1234')
+    cache.set('c', b'1234')  # 12바이트 > 10 → a 제거
+    
+    assert cache.keys() == ['b', 'c']
+    assert cache.stats()['bytes'] == 8
+    
+    cache.set('big', b'x' * 11)  # 한도보다 큰 값은 저장하지 않음
+    assert cache.get('big') is None
+    assert cache.stats()['oversize'] == 1
+    assert cache.keys() == ['b', 'c']
+
+
+def test_replacing_a_key_updates_byte_count():
+    cache = TTLCache('test-bytes-replace', maxsize=100, ttl=60, maxbytes=10, sizeof=len)
+    cache.set('a', b'123456')
+    cache.set('a', b'12')
+    cache.pop('a')
+    
+    assert cache.stats()['bytes'] == 0
+
+
+def test_pop_and_keys():
+    cache = TTLCache('test-pop', maxsize=4, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    
+    assert cache.pop('a') == 1
+    assert cache.pop('a') is None
+    assert cache.keys() == ['b']
+
+
+def test_get_or_set_skips_values_that_are_not_cacheable():
+    cache = TTLCache('test-cacheable', maxsize=4, ttl=60)
+    
+    assert cache.get_or_set('a', lambda: None, cacheable=lambda value: value is not None) is None
+    assert cache.keys() == []
+    assert cache.get_or_set('a', lambda: 1, cacheable=lambda value: value is not None) == 1
+    assert cache.keys() == ['a']
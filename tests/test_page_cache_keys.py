@@ -0,0 +1,39 @@
+"""페이지 캐시 키의 태그 (routes/main.py make_cache_key_*)"""
+
+import pytest
+
+from routes.main import (
+    SERVICE_LIST_TAG, SITE_TAG,
+    make_cache_key_index, make_cache_key_with_lang, make_cache_key_gallery,
+    make_cache_key_service_detail, make_cache_key_service_option,
+)
+from utils.shared_cache import invalidate_tags
+
+PAGE_KEYS = [
+    ('/', make_cache_key_index),
+    ('/services', make_cache_key_with_lang),
+    ('/gallery', make_cache_key_gallery),
+    ('/service/3', make_cache_key_service_detail),
+    ('/service_option/3', make_cache_key_service_option),
+]
+
+
+def _keys(app):
+    keys = []
+    for path, make_key in PAGE_KEYS:
+        with app.test_request_context(path):
+            keys.append(make_key())
+    return keys
+
+
+@pytest.mark.parametrize('tag', [SITE_TAG, SERVICE_LIST_TAG])
+def test_layout_tags_invalidate_every_page_key(app, tag):
+    # 모든 페이지가 base.html의 서비스 메뉴/사이트 색상을 포함하므로 레이아웃 태그 무효화 시 전부 바뀌어야 함
+    app.secret_key = 'test'
+    before = _keys(app)
+    with app.app_context():
+        invalidate_tags(tag)
+    after = _keys(app)
+    
+    for path_key, old, new in zip(PAGE_KEYS, before, after):
+        assert old != new, path_key[0]
@@ -0,0 +1,23 @@
+"""관계 프리페치 키 정규화 (utils/mongo_models.py _ref_key / _ref_variants)"""
+
+from bson import ObjectId
+
+from utils.mongo_models import _ref_key, _ref_variants
+
+
+def test_numeric_strings_and_ints_share_a_key():
+    assert _ref_key('12') == _ref_key(12) == 12
+    assert set(_ref_variants(12)) == {12, '12'}
+
+
+def test_object_ids_and_their_strings_share_a_key():
+    oid = ObjectId()
+    
+    assert _ref_key(oid) == _ref_key(str(oid)) == str(oid)
+    assert set(_ref_variants(str(oid))) == {str(oid), oid}
+
+
+def test_other_values_are_kept():
+    assert _ref_key('abc') == 'abc'
+    assert _ref_variants('abc') == ['abc']
+    assert _ref_key(None) is None
@@ -0,0 +1,43 @@
+"""태그 세대 기반 캐시 키/무효화 (utils/shared_cache.py)"""
+
+from utils.shared_cache import tag_versions, tagged_key, tags_last_modified, invalidate_tags, lang_tag
+
+
+def test_tagged_key_is_stable_until_invalidated(app):
+    with app.app_context():
+        first = tagged_key(('gallery', lang_tag('ko')), 'gallery', 'ko', 1)
+    with app.app_context():
+        second = tagged_key(('gallery', lang_tag('ko')), 'gallery', 'ko', 1)
+    
+    assert first == second
+    assert first.startswith('gallery:ko:1@gallery=')
+    assert ',lang:ko=' in first
+
+
+def test_invalidate_changes_only_keys_with_that_tag(app):
+    with app.app_context():
+        gallery_key = tagged_key(('gallery',), 'page')
+        about_key = tagged_key(('about',), 'page')
+        invalidate_tags('gallery')
+        # 같은 요청 안에서도 무효화 이후에는 새 세대를 사용
+        assert tagged_key(('gallery',), 'page') != gallery_key
+    with app.app_context():
+        assert tagged_key(('gallery',), 'page') != gallery_key
+        assert tagged_key(('about',), 'page') == about_key
+
+
+def test_tag_versions_are_shared_between_app_contexts(app):
+    with app.app_context():
+        versions = tag_versions(['service_list', 'site'])
+    with app.app_context():
+        assert tag_versions(['site', 'service_list']) == versions
+
+
+def test_tags_last_modified_uses_newest_generation(app):
+    with app.app_context():
+        before = tags_last_modified(['terms', 'privacy'])
+        invalidate_tags('privacy')
+        after = tags_last_modified(['terms', 'privacy'])
+    
+    assert isinstance(before, int)
+    assert after >= before
@@ -4,7 +4,7 @@
 import os
 import re
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 
 # .env 파일 로드
 load_dotenv()
@@ -86,7 +86,7 @@ def update_translations():
     
     # 모든 번역 문서 조회
     all_translations = translations_collection.find({})
-    updated_count = 0
+    operations = []
     
     for doc in all_translations:
         updated = False
@@ -117,15 +117,18 @@ def update_translations():
                         updated = True
         
         if updated:
-            # MongoDB 업데이트
-            translations_collection.update_one(
+            operations.append(UpdateOne(
                 {'_id': doc['_id']},
                 {'$set': {'fields': fields}}
-            )
-            updated_count += 1
-            print(f"✅ 업데이트: {doc.get('source_type')}_{doc.get('source_id')}")
+            ))
+            print(f"✅ 업데이트 예정: {doc.get('source_type')}_{doc.get('source_id')}")
     
-    return updated_count
+    if not operations:
+        return 0
+    
+    # 변경된 문서를 한 번의 bulk_write로 MongoDB에 반영
+    result = translations_collection.bulk_write(operations, ordered=False)
+    return result.modified_count
 
 if __name__ == '__main__':
     print("\n=== 번역 데이터 화폐 단위 업데이트 ===\n")
@@ -8,25 +8,31 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict
-from pymongo import MongoClient
+from utils.mongo_client import get_database
+from utils.mongo_indexes import Index, register_indexes
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# MongoDB 연결
-_mongo_client = None
+# MongoDB 컬렉션 (연결은 공유 클라이언트 레지스트리 사용)
 _usage_collection = None
 _connection_pid = None
 
+# 인덱스 선언 (`flask db-indexes sync`로 적용)
+register_indexes('ai_usage', [
+    Index([("timestamp", -1)]),
+    Index([("usage_type", 1), ("timestamp", -1)]),
+    Index([("model", 1)]),
+])
+
 
 def get_usage_collection():
     """AI 사용량 컬렉션 반환 (fork-safe)"""
-    global _mongo_client, _usage_collection, _connection_pid
+    global _usage_collection, _connection_pid
     
     current_pid = os.getpid()
     
     if _connection_pid is not None and _connection_pid != current_pid:
-        _mongo_client = None
         _usage_collection = None
     
     if _usage_collection is not None:
@@ -37,20 +43,10 @@ def get_usage_collection():
         return None
     
     try:
-        _mongo_client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=10000,
-            connectTimeoutMS=10000
-        )
-        db = _mongo_client['STG-DB']
+        db = get_database()
         _usage_collection = db['ai_usage']
         _connection_pid = current_pid
         
-        # 인덱스 생성
-        _usage_collection.create_index([("timestamp", -1)])
-        _usage_collection.create_index([("usage_type", 1), ("timestamp", -1)])
-        _usage_collection.create_index([("model", 1)])
-        
         return _usage_collection
     except Exception as e:
         print(f"AI 사용량 추적 MongoDB 연결 실패: {str(e)}")
@@ -0,0 +1,98 @@
+"""
+Jinja 템플릿 조각 캐시
+
+레이아웃의 메뉴/푸터, 갤러리/서비스 목록 조각처럼 관리자가 수정할 때만 바뀌는 부분을
+렌더링 결과 그대로 공유 캐시(extensions.cache)에 보관합니다.
+페이지 전체가 캐시되지 않는 요청(HTMX 갤러리 조각, gallery_detail 등)도 이 부분의 렌더링을 건너뜁니다.
+
+사용법 (템플릿):
+    {% cache 'side_menu', ['service_list'] %} ... {% endcache %}
+    {% cache ('gallery_items', ids), ['gallery'], 600 %} ... {% endcache %}
+
+- 첫 번째 인자: 조각 키 (문자열 또는 튜플/리스트 - 같은 템플릿 안에서 내용이 달라지는 값을 포함)
+- 두 번째 인자: 의존하는 캐시 태그 (invalidate_tags 되면 모든 워커에서 다시 렌더링)
+- 세 번째 인자: 유효 시간(초, 생략 시 FRAGMENT_CACHE_TIMEOUT)
+
+현재 언어와 언어 태그, URL 접두사(/en/...), 템플릿 소스 해시는 자동으로 키에 포함되므로
+번역이 바뀌거나 배포로 템플릿이 바뀌면 이전 조각은 사용되지 않습니다.
+"""
+
+import os
+import hashlib
+import threading
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+from flask import has_request_context
+from extensions import cache
+from utils.shared_cache import tagged_key, lang_tag, is_render_fallback
+from utils.translation_helper import get_current_language
+from utils.lang_urls import url_prefix
+
+FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('FRAGMENT_CACHE_TIMEOUT', '3600'))
+
+_stats = {'hits': 0, 'misses': 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def get_fragment_cache_stats():
+    """조각 캐시 적중/미스 (현재 프로세스)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = round(stats['hits'] / lookups * 100, 1) if lookups else 0.0
+    stats['pid'] = os.getpid()
+    return stats
+
+
+class FragmentCacheExtension(Extension):
+    """{% cache 키, 태그, 유효시간 %} ... {% endcache %} 태그"""
+    
+    tags = {'cache'}
+    
+    def __init__(self, environment):
+        super().__init__(environment)
+        self._source_digests = {}  # {템플릿 이름: 소스 해시}
+    
+    def preprocess(self, source, name, filename=None):
+        # 템플릿이 바뀌면 조각 키도 바뀌도록 소스 해시 기록 (컴파일 시 상수로 포함됨)
+        if name:
+            self._source_digests[name] = hashlib.md5(source.encode('utf-8')).hexdigest()[:8]
+        return source
+    
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        tags = parser.parse_expression() if parser.stream.skip_if('comma') else nodes.List([])
+        timeout = parser.parse_expression() if parser.stream.skip_if('comma') else nodes.Const(None)
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        
+        origin = f"{parser.name}:{lineno}:{self._source_digests.get(parser.name, '')}"
+        call = self.call_method('_render_fragment', [nodes.Const(origin), key, tags, timeout])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+    
+    def _render_fragment(self, origin, key, tags, timeout, caller):
+        if not has_request_context():
+            return caller()
+        
+        lang = get_current_language()
+        parts = key if isinstance(key, (list, tuple)) else (key,)
+        # 조각 안의 url_for 링크는 언어 접두사 URL 여부에 따라 달라지므로 키에 포함
+        cache_key = tagged_key((*tags, lang_tag(lang)), 'fragment', origin, lang + url_prefix(), *parts)
+        
+        html = cache.get(cache_key)
+        if html is not None:
+            _count('hits')
+            return Markup(html)
+        
+        _count('misses')
+        html = caller()
+        # 조회 오류로 빈 메뉴 등이 렌더링된 경우 저장하지 않음 (다음 요청에서 다시 렌더링)
+        if not is_render_fallback():
+            cache.set(cache_key, str(html), timeout=timeout or FRAGMENT_CACHE_TIMEOUT)
+        return Markup(html)
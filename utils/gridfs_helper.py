@@ -8,15 +8,25 @@ import hashlib
 import threading
 from datetime import datetime
 from functools import lru_cache
+from itertools import islice
 from PIL import Image
 from gridfs import GridFS
-from pymongo import MongoClient
+from gridfs.errors import FileExists, NoFile
+from utils.mongo_client import get_client
+from utils.mongo_indexes import Index, register_indexes
+from utils.memoize import TTLCache
+from utils.image_disk_cache import open_cached_image, remove_cached_image, restore_cached_image
 from dotenv import load_dotenv
 from werkzeug.utils import secure_filename
 
 # .env 파일 로드
 load_dotenv()
 
+try:
+    import pillow_avif  # noqa: F401 (선택 의존성 - Pillow에 AVIF 인코더 등록)
+except ImportError:
+    pass
+
 # 전역 변수 (fork-safe, thread-safe)
 _gridfs_instance = None
 _mongo_db = None
@@ -24,12 +34,38 @@ _images_collection = None  # 기존 호환성을 위한 컬렉션
 _connection_pid = None  # 연결이 생성된 프로세스 ID 추적
 _connection_lock = threading.Lock()  # Thread-safe 연결 관리
 
-# 이미지 메모리 캐시 (LRU 방식)
-_image_cache = {}
-_cache_timestamps = {}
-_cache_lock = threading.Lock()
-IMAGE_CACHE_MAX_SIZE = 100  # 최대 캐시 항목 수
+# 이미지 메모리 캐시 (총 바이트 상한 LRU + TTL, 같은 이미지 동시 미스는 한 번만 조회)
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get('IMAGE_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))  # 워커당 32MB
+IMAGE_CACHE_MAX_SIZE = 1000  # 최대 캐시 항목 수 (작은 썸네일이 많을 때 상한)
 IMAGE_CACHE_TIMEOUT = 600  # 캐시 유효시간 (10분)
+_image_cache = TTLCache('image', maxsize=IMAGE_CACHE_MAX_SIZE, ttl=IMAGE_CACHE_TIMEOUT,
+                        maxbytes=IMAGE_CACHE_MAX_BYTES, sizeof=lambda entry: len(entry[0]))
+# 이 크기를 넘는 이미지는 메모리에 읽지 않고 GridFS 청크를 그대로 스트리밍 (메모리 캐시에도 넣지 않음)
+IMAGE_STREAM_THRESHOLD = int(os.environ.get('IMAGE_STREAM_THRESHOLD', str(256 * 1024)))
+
+# 요청 크기별 파생 이미지 (/image/<id>?w=320&q=75) - 허용 목록 외 크기는 생성하지 않음
+IMAGE_VARIANT_WIDTHS = (320, 480, 640, 960, 1280)
+IMAGE_VARIANT_QUALITIES = (60, 75, 85)
+IMAGE_VARIANT_DEFAULT_QUALITY = 75
+
+
+def _modern_formats():
+    # IMAGE_FORMATS 중 설치된 Pillow가 인코딩할 수 있는 포맷만 (AVIF는 pillow-avif-plugin 필요)
+    Image.init()
+    wanted = [fmt.strip().lower() for fmt in os.environ.get('IMAGE_FORMATS', 'avif,webp').split(',') if fmt.strip()]
+    return tuple(fmt for fmt in ('avif', 'webp') if fmt in wanted and fmt.upper() in Image.SAVE)
+
+
+# Accept 헤더로 협상하는 최신 포맷 (받을 수 있는 포맷 중 가장 작은 파생 이미지를 응답)
+IMAGE_MODERN_FORMATS = _modern_formats()
+_variant_fs = None
+_variant_fs_pid = None
+
+# 파생 이미지 버킷 인덱스 (GridFS 기본 인덱스 + 원본 ID로 일괄 삭제)
+register_indexes('image_variants.files', [
+    Index([("filename", 1), ("uploadDate", 1)]),
+    Index("metadata.source_id"),
+])
 
 
 def get_mongo_connection():
@@ -61,23 +97,8 @@ def get_mongo_connection():
             return None, None, None
         
         try:
-            print(f"GridFS: MongoDB에 연결 시도... (PID: {current_pid})")
-            mongo_client = MongoClient(
-                mongo_uri,
-                serverSelectionTimeoutMS=30000,
-                connectTimeoutMS=20000,
-                socketTimeoutMS=20000,
-                retryWrites=True,
-                retryReads=True,
-                w='majority',
-                readPreference='primaryPreferred',
-                maxPoolSize=50,  # 연결 풀 크기
-                minPoolSize=5
-            )
-            
-            # 연결 테스트
-            mongo_client.server_info()
-            print("GridFS: MongoDB 연결 성공!")
+            # 공유 클라이언트 사용 (연결 풀/연결 확인은 레지스트리에서 프로세스당 한 번)
+            mongo_client = get_client()
             
             # 데이터베이스 선택
             db_name = 'STG-DB' if 'mongodb.net' in mongo_uri else 'stylegrapher_db'
@@ -266,8 +287,11 @@ def save_image_to_gridfs(file, group_id=None, order=0, custom_id=None):
         content_type=content_type,
         metadata=metadata
     )
+    if custom_id:
+        restore_cached_image(image_id)
     
     print(f"GridFS: 이미지 저장 완료 - ID: {image_id}, 크기: {len(img_binary)} bytes")
+    _create_variants_in_background(image_id, img_binary, resized_img.size[0])
     return image_id
 
 
@@ -390,34 +414,24 @@ def save_package_photo_to_gridfs(file, group_id=None, order=0, custom_id=None):
         content_type=content_type,
         metadata=metadata
     )
+    if custom_id:
+        restore_cached_image(image_id)
     
     print(f"GridFS: 패키지 화보 이미지 저장 완료 - ID: {image_id}, 크기: {len(img_binary)} bytes")
+    _create_variants_in_background(image_id, img_binary, resized_img.size[0])
     return image_id
 
 
-def _cleanup_cache():
-    """오래된 캐시 항목 정리 (LRU 방식)"""
-    global _image_cache, _cache_timestamps
-    
-    if len(_image_cache) <= IMAGE_CACHE_MAX_SIZE:
-        return
-    
-    now = datetime.now()
-    
-    # 만료된 항목 먼저 제거
-    expired_keys = [
-        k for k, v in _cache_timestamps.items()
-        if (now - v).total_seconds() > IMAGE_CACHE_TIMEOUT
-    ]
-    for k in expired_keys:
-        _image_cache.pop(k, None)
-        _cache_timestamps.pop(k, None)
-    
-    # 여전히 초과하면 가장 오래된 항목 제거
-    while len(_image_cache) > IMAGE_CACHE_MAX_SIZE:
-        oldest_key = min(_cache_timestamps, key=_cache_timestamps.get)
-        _image_cache.pop(oldest_key, None)
-        _cache_timestamps.pop(oldest_key, None)
+def _cacheable(result):
+    # 메모리에 읽은 이미지만 캐시 (없는 이미지, 스트리밍용 GridOut 제외)
+    return isinstance(result[0], bytes)
+
+
+def get_image_cache_stats():
+    """이미지 메모리 캐시 통계 (현재 프로세스) - 적중/미스/대기/제거 횟수, 사용 바이트"""
+    stats = _image_cache.stats()
+    stats['pid'] = os.getpid()
+    return stats
 
 
 def generate_etag(image_id, binary_data=None):
@@ -427,28 +441,62 @@ def generate_etag(image_id, binary_data=None):
     return hashlib.md5(image_id.encode()).hexdigest()
 
 
-def get_image_from_gridfs(image_id, use_cache=True):
+def _content_etag(key, binary_data=None, length=None):
     """
-    GridFS에서 이미지 조회 (메모리 캐싱 적용)
+    이미지 ETag - 스트리밍 대상 크기는 내용 대신 길이로 계산
     
-    Args:
-        image_id: 이미지 ID
-        use_cache: 캐시 사용 여부 (기본값: True)
+    청크를 읽지 않고도 계산할 수 있어, 같은 이미지를 메모리/스트림 어느 쪽으로 응답해도 ETag가 같다.
+    """
+    length = len(binary_data) if binary_data is not None else length
+    if length > IMAGE_STREAM_THRESHOLD:
+        return generate_etag(key, f"length:{length}".encode())
+    return generate_etag(key, binary_data)
+
+
+def _read_or_stream(grid_out, key):
+    """
+    GridOut → (body, content_type, etag)
+    
+    IMAGE_STREAM_THRESHOLD 이하는 읽어서 bytes로 (메모리 캐시 대상),
+    초과하면 GridOut을 그대로 반환 (호출한 쪽에서 청크 단위로 읽고 close)
+    """
+    content_type = grid_out.content_type or 'image/jpeg'
+    if grid_out.length > IMAGE_STREAM_THRESHOLD:
+        return grid_out, content_type, _content_etag(key, length=grid_out.length)
+    
+    binary_data = grid_out.read()
+    grid_out.close()
+    return binary_data, content_type, _content_etag(key, binary_data)
+
+
+def open_image_from_gridfs(image_id):
+    """
+    이미지 응답용 조회 - 큰 이미지는 메모리에 읽지 않고 스트리밍
+    
+    메모리 캐시 → GridFS (작은 이미지는 읽어서 캐시, 큰 이미지는 GridOut) → 레거시 컬렉션
     
     Returns:
-        (binary_data, content_type, etag) 튜플 또는 (None, None, None)
+        (body, content_type, etag) 튜플 또는 (None, None, None)
+        body는 bytes 또는 GridOut (GridOut이면 .length로 크기 확인, 다 읽은 뒤 close)
     """
-    # 1. 캐시에서 먼저 확인
-    if use_cache:
-        with _cache_lock:
-            if image_id in _image_cache:
-                cached = _image_cache[image_id]
-                cache_time = _cache_timestamps.get(image_id)
-                
-                # 캐시가 유효한지 확인
-                if cache_time and (datetime.now() - cache_time).total_seconds() < IMAGE_CACHE_TIMEOUT:
-                    return cached['data'], cached['content_type'], cached['etag']
+    def load():
+        gridfs, _, _ = get_mongo_connection()
+        if gridfs is None:
+            return None, None, None
+        try:
+            return _read_or_stream(gridfs.get(image_id), image_id)
+        except NoFile:
+            # GridFS에 없으면 기존 컬렉션에서 조회 (마이그레이션 전 데이터)
+            return _fetch_image(image_id)
+        except Exception as e:
+            print(f"GridFS: 이미지 조회 오류 - ID: {image_id}, 에러: {str(e)}")
+            return None, None, None
     
+    return _image_cache.get_or_set(image_id, load, cacheable=_cacheable)
+
+
+def _fetch_image(image_id):
+    """GridFS(없으면 레거시 컬렉션)에서 이미지 전체를 읽음 → (binary_data, content_type, etag)"""
     gridfs, db, legacy_collection = get_mongo_connection()
     
     if gridfs is None:
@@ -458,13 +506,13 @@ def get_image_from_gridfs(image_id, use_cache=True):
         binary_data = None
         content_type = 'image/jpeg'
         
-        # 2. GridFS에서 조회 시도
+        # 1. GridFS에서 조회 시도
         if gridfs.exists(image_id):
             grid_out = gridfs.get(image_id)
             binary_data = grid_out.read()
             content_type = grid_out.content_type or 'image/jpeg'
         
-        # 3. GridFS에 없으면 기존 컬렉션에서 조회 (마이그레이션 전 데이터)
+        # 2. GridFS에 없으면 기존 컬렉션에서 조회 (마이그레이션 전 데이터)
         elif legacy_collection is not None:
             legacy_doc = legacy_collection.find_one({'_id': image_id})
             if legacy_doc and 'binary_data' in legacy_doc:
@@ -474,27 +522,261 @@ def get_image_from_gridfs(image_id, use_cache=True):
         if binary_data is None:
             return None, None, None
         
-        # ETag 생성
-        etag = generate_etag(image_id, binary_data)
-        
-        # 4. 캐시에 저장
-        if use_cache:
-            with _cache_lock:
-                _image_cache[image_id] = {
-                    'data': binary_data,
-                    'content_type': content_type,
-                    'etag': etag
-                }
-                _cache_timestamps[image_id] = datetime.now()
-                _cleanup_cache()
-        
-        return binary_data, content_type, etag
+        return binary_data, content_type, _content_etag(image_id, binary_data)
         
     except Exception as e:
         print(f"GridFS: 이미지 조회 오류 - ID: {image_id}, 에러: {str(e)}")
         return None, None, None
 
 
+def get_image_from_gridfs(image_id, use_cache=True):
+    """
+    GridFS에서 이미지 조회 (메모리 캐싱 적용)
+    
+    Args:
+        image_id: 이미지 ID
+        use_cache: 캐시 사용 여부 (기본값: True)
+    
+    Returns:
+        (binary_data, content_type, etag) 튜플 또는 (None, None, None)
+    """
+    if not use_cache:
+        return _fetch_image(image_id)
+    # 같은 이미지의 동시 미스는 한 번만 조회 (나머지 스레드는 결과를 기다림)
+    return _image_cache.get_or_set(image_id, lambda: _fetch_image(image_id), cacheable=_cacheable)
+
+
+# ---------- 파생 이미지 (요청 크기별 리사이즈, WebP/AVIF) ----------
+
+def _get_variant_fs():
+    """파생 이미지 GridFS 버킷 (image_variants) - 원본 버킷 통계/목록과 분리"""
+    global _variant_fs, _variant_fs_pid
+    
+    if _variant_fs is not None and _variant_fs_pid == os.getpid():
+        return _variant_fs
+    gridfs, db, _ = get_mongo_connection()
+    if gridfs is None:
+        return None
+    with _connection_lock:
+        if _variant_fs is None or _variant_fs_pid != os.getpid():
+            _variant_fs = GridFS(db, collection='image_variants')
+            _variant_fs_pid = os.getpid()
+    return _variant_fs
+
+
+def variant_id(image_id, width=None, quality=None, fmt=None):
+    """파생 이미지 ID (예: 'abc@w320q75', 'abc@q75.webp', 'abc@w640q75.avif')"""
+    size = f"w{width}" if width else ''
+    return f"{image_id}@{size}q{quality or IMAGE_VARIANT_DEFAULT_QUALITY}" + (f".{fmt}" if fmt else '')
+
+
+def _check_variant(width, quality, fmt):
+    # 허용 목록 외 크기/품질/포맷은 생성하지 않음 (임의 크기 요청으로 저장소/CPU를 소모하지 않도록)
+    quality = quality or IMAGE_VARIANT_DEFAULT_QUALITY
+    if (width is not None and width not in IMAGE_VARIANT_WIDTHS) or quality not in IMAGE_VARIANT_QUALITIES:
+        raise ValueError(f"허용되지 않은 이미지 크기/품질: w={width}, q={quality}")
+    if fmt is not None and fmt not in IMAGE_MODERN_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 포맷: {fmt}")
+    if width is None and fmt is None:
+        raise ValueError("너비 또는 포맷이 필요합니다")
+
+
+def _render_variant(binary_data, width, quality, fmt=None):
+    """
+    원본을 지정 너비로 축소하고 인코딩 (fmt 지정 시 WebP/AVIF)
+    
+    Returns:
+        (binary_data, content_type, 크기) 또는 None (원본 그대로 사용 - GIF, 더 작은 원본, 용량이 줄지 않는 변환)
+    """
+    img = Image.open(io.BytesIO(binary_data))
+    if (img.format or '').upper() == 'GIF':
+        return None
+    resize = bool(width) and img.size[0] > width
+    if not resize and fmt is None:
+        return None
+    
+    resized_img = resize_image_for_storage(img, max_width=width, max_height=img.size[1]) if resize else img
+    has_alpha = resized_img.mode in ('RGBA', 'LA', 'P') and resized_img.convert('RGBA').split()[3].getextrema()[0] < 255
+    buffer = io.BytesIO()
+    if fmt:
+        # WebP/AVIF는 투명도를 지원하므로 알파 채널 유지
+        resized_img = resized_img.convert('RGBA' if has_alpha else 'RGB')
+        options = {'method': 4} if fmt == 'webp' else {}
+        resized_img.save(buffer, format=fmt.upper(), quality=quality, **options)
+        content_type = f'image/{fmt}'
+        if not resize and buffer.tell() >= len(binary_data):
+            return None
+    elif has_alpha:
+        # 실제 투명도가 있는 경우 PNG 유지
+        resized_img.save(buffer, format='PNG', optimize=True, compress_level=WEB_IMAGE_CONFIG['png_compression'])
+        content_type = 'image/png'
+    else:
+        if resized_img.mode != 'RGB':
+            resized_img = resized_img.convert('RGB')
+        resized_img.save(buffer, format='JPEG', quality=quality, optimize=True,
+                         progressive=WEB_IMAGE_CONFIG['progressive_jpeg'])
+        content_type = 'image/jpeg'
+    return buffer.getvalue(), content_type, resized_img.size
+
+
+def get_image_variant(image_id, width=None, quality=None, fmt=None, source_data=None, stream=False, create=True):
+    """
+    파생 이미지 조회 (메모리 캐시 → image_variants 버킷 → 첫 요청 시 생성 후 저장)
+    
+    Args:
+        image_id: 원본 이미지 ID
+        width: 너비 (IMAGE_VARIANT_WIDTHS 중 하나, None이면 원본 크기 - fmt 필요)
+        quality: 품질 (IMAGE_VARIANT_QUALITIES 중 하나, 기본 75)
+        fmt: 'webp'/'avif' (IMAGE_MODERN_FORMATS 중 하나, None이면 원본과 같은 JPEG/PNG)
+        source_data: 원본 바이트 (업로드 직후 등 이미 가진 경우 GridFS 재조회 생략)
+        stream: 저장된 파생 이미지가 IMAGE_STREAM_THRESHOLD보다 크면 GridOut으로 반환 (open_image_from_gridfs 참고)
+        create: False면 이미 저장된 파생 이미지만 반환 (없으면 생성하지 않고 (None, None, None))
+    
+    Returns:
+        (binary_data, content_type, etag) 튜플 또는 (None, None, None)
+        WebP/AVIF가 원본보다 크면 원본을 같은 키로 저장해 두고 원본을 반환한다.
+    
+    Raises:
+        ValueError: 허용 목록에 없는 크기/품질/포맷
+    """
+    quality = quality or IMAGE_VARIANT_DEFAULT_QUALITY
+    _check_variant(width, quality, fmt)
+    key = variant_id(image_id, width, quality, fmt)
+    
+    def load():
+        variant_fs = _get_variant_fs()
+        if variant_fs is None:
+            return None, None, None
+        try:
+            try:
+                grid_out = variant_fs.get(key)
+            except NoFile:
+                grid_out = None
+            
+            if grid_out is not None and stream:
+                return _read_or_stream(grid_out, key)
+            if grid_out is not None:
+                binary_data = grid_out.read()
+                return binary_data, grid_out.content_type or 'image/jpeg', _content_etag(key, binary_data)
+            if not create:
+                return None, None, None
+            return _create_variant(variant_fs, key, image_id, width, quality, fmt, source_data)
+        except Exception as e:
+            print(f"GridFS: 파생 이미지 오류 - ID: {key}, 에러: {str(e)}")
+            return None, None, None
+    
+    # 같은 파생 이미지의 동시 미스는 한 번만 생성 (나머지 스레드는 결과를 기다림)
+    return _image_cache.get_or_set(key, load, cacheable=_cacheable)
+
+
+def _create_variant(variant_fs, key, image_id, width, quality, fmt, source_data=None):
+    """원본에서 파생 이미지를 만들어 image_variants 버킷에 저장 → (binary_data, content_type, etag)"""
+    if source_data is not None:
+        original_data = source_data
+    else:
+        original_data, _, _ = get_image_from_gridfs(image_id, use_cache=False)
+    if original_data is None:
+        return None, None, None
+    
+    rendered = _render_variant(original_data, width, quality, fmt)
+    if rendered is None:
+        original_img = Image.open(io.BytesIO(original_data))
+        original_type = Image.MIME.get(original_img.format, 'image/jpeg')
+        if fmt is None or original_img.format == 'GIF':
+            # 요청 너비보다 작은 원본, GIF - 원본을 그대로 사용 (저장하지 않음)
+            return original_data, original_type, _content_etag(image_id, original_data)
+        # 변환해도 용량이 줄지 않음 - 매번 다시 인코딩하지 않도록 원본을 같은 키로 저장
+        rendered = (original_data, original_type, original_img.size)
+    
+    variant_data, content_type, size = rendered
+    try:
+        variant_fs.put(variant_data, _id=key, filename=key, content_type=content_type, metadata={
+            'source_id': image_id,
+            'width': size[0],
+            'height': size[1],
+            'quality': quality,
+            'format': content_type.split('/')[-1],
+            'created_at': datetime.now(),
+        })
+        print(f"GridFS: 파생 이미지 생성 - {key} ({len(original_data)/1024:.1f}KB → {len(variant_data)/1024:.1f}KB)")
+    except FileExists:
+        pass  # 다른 워커가 먼저 저장
+    return variant_data, content_type, _content_etag(key, variant_data)
+
+
+def open_image(image_id, width=None, quality=None, fmt=None, create=True):
+    """
+    이미지 응답용 조회 - 디스크 캐시 → 메모리 캐시 → GridFS (읽은 이미지는 디스크 캐시에 저장)
+    
+    Args:
+        width/quality/fmt: 지정하면 파생 이미지 (get_image_variant 참고), 모두 None이면 원본
+        create: False면 디스크/메모리 캐시나 image_variants 버킷에 이미 있는 파생 이미지만 (없으면 생성하지 않음)
+    
+    Returns:
+        (body, content_type, etag) 튜플 또는 (None, None, None)
+        body는 CachedImageFile(디스크 캐시 파일), bytes, 큰 이미지의 GridOut 중 하나 - 다 쓴 뒤 close
+    
+    Raises:
+        ValueError: 허용 목록에 없는 크기/품질/포맷
+    """
+    if width is None and fmt is None:
+        return open_cached_image(image_id, image_id, lambda: open_image_from_gridfs(image_id))
+    _check_variant(width, quality, fmt)
+    key = variant_id(image_id, width, quality, fmt)
+    return open_cached_image(image_id, key, lambda: get_image_variant(image_id, width, quality, fmt, stream=True, create=create))
+
+
+def create_modern_variants(image_id, source_data=None, widths=()):
+    """
+    원본 크기(+ 지정 너비)의 WebP/AVIF 파생 이미지 미리 생성 (업로드 직후, 일괄 백필)
+    
+    Returns:
+        생성(또는 이미 존재)한 파생 이미지 수
+    """
+    created = 0
+    for fmt in IMAGE_MODERN_FORMATS:
+        for width in (None, *widths):
+            binary_data, _, _ = get_image_variant(image_id, width, fmt=fmt, source_data=source_data)
+            if binary_data:
+                created += 1
+    return created
+
+
+def _create_variants_in_background(image_id, source_data, image_width):
+    """업로드 직후 WebP/AVIF 파생 이미지 생성 (업로드 응답을 기다리게 하지 않음)"""
+    if not IMAGE_MODERN_FORMATS:
+        return
+    widths = _variant_widths(image_width)
+    
+    def run():
+        try:
+            created = create_modern_variants(image_id, source_data, widths)
+            print(f"GridFS: {'/'.join(IMAGE_MODERN_FORMATS)} 파생 이미지 {created}개 준비 - ID: {image_id}")
+        except Exception as e:
+            print(f"GridFS: 파생 이미지 생성 오류 - ID: {image_id}, 에러: {str(e)}")
+    
+    threading.Thread(target=run, daemon=True).start()
+
+
+def delete_image_variants(image_id):
+    """원본 이미지의 파생 이미지 전체 삭제 (GridFS + 메모리 캐시)"""
+    for key in _image_cache.keys():
+        if key.startswith(f"{image_id}@"):
+            _image_cache.pop(key)
+    
+    variant_fs = _get_variant_fs()
+    if variant_fs is None:
+        return 0
+    deleted = 0
+    try:
+        for grid_out in variant_fs.find({'metadata.source_id': image_id}):
+            variant_fs.delete(grid_out._id)
+            deleted += 1
+    except Exception as e:
+        print(f"GridFS: 파생 이미지 삭제 오류 - ID: {image_id}, 에러: {str(e)}")
+    return deleted
+
+
 def get_image_from_gridfs_legacy(image_id):
     """
     GridFS에서 이미지 조회 (기존 호환성용 - 2개 반환값)
@@ -524,6 +806,11 @@ def delete_image_from_gridfs(image_id):
     if gridfs is None:
         return False
     
+    # 요청 크기별 파생 이미지도 함께 삭제 (이 워커의 메모리 캐시, 디스크 캐시 - 다른 서버는 공유 캐시의 삭제 표시로 정리)
+    delete_image_variants(image_id)
+    _image_cache.pop(image_id)
+    remove_cached_image(image_id)
+    
     try:
         # GridFS에서 삭제
         if gridfs.exists(image_id):
@@ -600,52 +887,64 @@ def migrate_legacy_to_gridfs(batch_size=50):
             no_cursor_timeout=True
         ).batch_size(batch_size)
         
-        for doc in cursor:
-            image_id = doc['_id']
+        fs_files = db['gallery_images.files']
+        
+        while True:
+            batch = list(islice(cursor, batch_size))
+            if not batch:
+                break
             
-            # 이미 GridFS에 있는지 확인
-            if gridfs.exists(image_id):
-                skip_count += 1
-                print(f"GridFS 마이그레이션: 건너뜀 (이미 존재) - ID: {image_id}")
-                continue
+            # 배치 단위로 GridFS 존재 여부를 한 번에 조회 (문서마다 exists() 호출하지 않음)
+            existing_ids = {
+                f['_id'] for f in fs_files.find({'_id': {'$in': [doc['_id'] for doc in batch]}}, {'_id': 1})
+            }
             
-            try:
-                # 메타데이터 추출
-                metadata = {
-                    'original_filename': doc.get('filename', 'unknown'),
-                    'content_type': doc.get('content_type', 'image/jpeg'),
-                    'created_at': doc.get('created_at', datetime.now()),
-                    'storage_type': 'gridfs',
-                    'migrated_from': 'legacy_binary_data'
-                }
+            for doc in batch:
+                image_id = doc['_id']
                 
-                if 'group_id' in doc:
-                    metadata['group_id'] = doc['group_id']
-                if 'order' in doc:
-                    metadata['order'] = doc['order']
+                # 이미 GridFS에 있는지 확인
+                if image_id in existing_ids:
+                    skip_count += 1
+                    print(f"GridFS 마이그레이션: 건너뜀 (이미 존재) - ID: {image_id}")
+                    continue
                 
-                # GridFS에 저장
-                gridfs.put(
-                    doc['binary_data'],
-                    _id=image_id,
-                    filename=doc.get('filename', 'unknown'),
-                    content_type=doc.get('content_type', 'image/jpeg'),
-                    metadata=metadata
-                )
+                try:
+                    # 메타데이터 추출
+                    metadata = {
+                        'original_filename': doc.get('filename', 'unknown'),
+                        'content_type': doc.get('content_type', 'image/jpeg'),
+                        'created_at': doc.get('created_at', datetime.now()),
+                        'storage_type': 'gridfs',
+                        'migrated_from': 'legacy_binary_data'
+                    }
                 
-                # 성공 시 기존 문서에서 binary_data 제거 (선택적)
-                # legacy_collection.update_one(
-                #     {'_id': image_id},
-                #     {'$unset': {'binary_data': ''}}
-                # )
+                    if 'group_id' in doc:
+                        metadata['group_id'] = doc['group_id']
+                    if 'order' in doc:
+                        metadata['order'] = doc['order']
                 
-                success_count += 1
-                print(f"GridFS 마이그레이션: 성공 - ID: {image_id}")
+                    # GridFS에 저장
+                    gridfs.put(
+                        doc['binary_data'],
+                        _id=image_id,
+                        filename=doc.get('filename', 'unknown'),
+                        content_type=doc.get('content_type', 'image/jpeg'),
+                        metadata=metadata
+                    )
                 
-            except Exception as e:
-                fail_count += 1
-                print(f"GridFS 마이그레이션: 실패 - ID: {image_id}, 에러: {str(e)}")
-        
+                    # 성공 시 기존 문서에서 binary_data 제거 (선택적)
+                    # legacy_collection.update_one(
+                    #     {'_id': image_id},
+                    #     {'$unset': {'binary_data': ''}}
+                    # )
+                
+                    success_count += 1
+                    print(f"GridFS 마이그레이션: 성공 - ID: {image_id}")
+                
+                except Exception as e:
+                    fail_count += 1
+                    print(f"GridFS 마이그레이션: 실패 - ID: {image_id}, 에러: {str(e)}")
+            
         cursor.close()
         
     except Exception as e:
@@ -655,6 +954,89 @@ def migrate_legacy_to_gridfs(batch_size=50):
     return success_count, fail_count, skip_count
 
 
+def _variant_widths(image_width, sized=True):
+    # 원본보다 좁은 허용 너비만 미리 생성 (넓은 요청은 원본 크기 파생 이미지와 같음)
+    return tuple(width for width in IMAGE_VARIANT_WIDTHS if width < image_width) if sized else ()
+
+
+def backfill_modern_variants(batch_size=50, sized=True, dry_run=False):
+    """
+    기존 GridFS 이미지의 WebP/AVIF 파생 이미지 일괄 생성 (이미 만든 이미지는 건너뜀)
+    
+    Args:
+        batch_size: 한 번에 처리할 이미지 수
+        sized: 원본 크기 외에 허용 너비(IMAGE_VARIANT_WIDTHS)별 파생 이미지도 생성
+        dry_run: 생성하지 않고 대상 수만 집계
+    
+    Returns:
+        (성공 수, 실패 수, 건너뛴 수) 튜플
+    """
+    gridfs, db, _ = get_mongo_connection()
+    
+    if gridfs is None:
+        print("파생 이미지 백필: MongoDB 연결이 설정되지 않았습니다.")
+        return 0, 0, 0
+    if not IMAGE_MODERN_FORMATS:
+        print("파생 이미지 백필: 인코딩 가능한 WebP/AVIF 포맷이 없습니다 (Pillow 빌드 확인).")
+        return 0, 0, 0
+    
+    success_count = 0
+    fail_count = 0
+    skip_count = 0
+    
+    try:
+        fs_files = db['gallery_images.files']
+        variant_files = db['image_variants.files']
+        cursor = fs_files.find({}, {'_id': 1, 'metadata.width': 1}, no_cursor_timeout=True).batch_size(batch_size)
+        
+        while True:
+            batch = list(islice(cursor, batch_size))
+            if not batch:
+                break
+            
+            # 배치 단위로 이미 만든 파생 이미지를 한 번에 조회
+            existing_ids = {
+                f['_id'] for f in variant_files.find(
+                    {'metadata.source_id': {'$in': [doc['_id'] for doc in batch]}}, {'_id': 1})
+            }
+            
+            for doc in batch:
+                image_id = doc['_id']
+                image_width = (doc.get('metadata') or {}).get('width')
+                if image_width:
+                    keys = [variant_id(image_id, width, None, fmt) for fmt in IMAGE_MODERN_FORMATS
+                            for width in (None, *_variant_widths(image_width, sized))]
+                    if all(key in existing_ids for key in keys):
+                        skip_count += 1
+                        continue
+                if dry_run:
+                    success_count += 1
+                    continue
+                
+                try:
+                    binary_data, _, _ = get_image_from_gridfs(image_id, use_cache=False)
+                    if binary_data is None:
+                        raise ValueError('원본을 읽을 수 없습니다')
+                    image_width = image_width or Image.open(io.BytesIO(binary_data)).size[0]
+                    widths = _variant_widths(image_width, sized)
+                    created = create_modern_variants(image_id, binary_data, widths)
+                    if created < len(IMAGE_MODERN_FORMATS) * (len(widths) + 1):
+                        raise ValueError(f"일부만 생성됨 ({created}개)")
+                    success_count += 1
+                    print(f"파생 이미지 백필: 성공 - ID: {image_id} ({created}개)")
+                except Exception as e:
+                    fail_count += 1
+                    print(f"파생 이미지 백필: 실패 - ID: {image_id}, 에러: {str(e)}")
+        
+        cursor.close()
+        
+    except Exception as e:
+        print(f"파생 이미지 백필 오류: {str(e)}")
+    
+    print(f"파생 이미지 백필 완료: 성공 {success_count}, 실패 {fail_count}, 건너뜀 {skip_count}")
+    return success_count, fail_count, skip_count
+
+
 def get_gridfs_stats():
     """
     GridFS 저장소 통계 조회
@@ -671,7 +1053,10 @@ def get_gridfs_stats():
         'gridfs_files_count': 0,
         'gridfs_total_size': 0,
         'legacy_count': 0,
-        'legacy_with_binary': 0
+        'legacy_with_binary': 0,
+        'variant_files_count': 0,
+        'variant_total_size': 0,
+        'variant_formats': list(IMAGE_MODERN_FORMATS)
     }
     
     try:
@@ -685,6 +1070,13 @@ def get_gridfs_stats():
         if result:
             stats['gridfs_total_size'] = result[0]['total']
         
+        # 파생 이미지 (요청 크기별, WebP/AVIF) 버킷
+        variant_files = db['image_variants.files']
+        stats['variant_files_count'] = variant_files.count_documents({})
+        result = list(variant_files.aggregate(pipeline))
+        if result:
+            stats['variant_total_size'] = result[0]['total']
+        
         # 레거시 컬렉션 통계
         if legacy_collection is not None:
             stats['legacy_count'] = legacy_collection.count_documents({})
@@ -0,0 +1,372 @@
+"""
+이미지 디스크 캐시 (워커 공유 2차 캐시)
+
+이미지 메모리 캐시는 워커마다 따로 채워지고 재시작하면 비워지므로, 미스는 항상 MongoDB(Atlas)까지 갑니다.
+GridFS에서 읽은 원본/파생 이미지를 instance/image_cache 에 파일로 저장해 두면
+모든 워커와 재시작 후의 워커가 같은 파일을 쓰고, 응답은 파이썬에서 바이트를 복사하지 않고
+wsgi.file_wrapper(gunicorn: sendfile)나 앞단 프록시(X-Accel-Redirect/X-Sendfile)가 파일을 직접 보냅니다.
+
+- 위치: <IMAGE_DISK_CACHE_DIR>/<md5(이미지 ID) 앞 2자리>/<md5(이미지 ID)>/<파생 이름>~<ETag>.<포맷>
+  (예: .../3f/3f2a.../w320q75.webp~c093fb53....webp, 원본은 original~<ETag>.jpeg)
+- 조회: open_cached_image(이미지 ID, 키, load) - 디스크에 없으면 load()(메모리 캐시/GridFS) 결과를 저장 후 파일로 응답
+- 삭제: remove_cached_image(이미지 ID) - 원본/파생 이미지 파일 전체 (delete_image_from_gridfs 에서 호출)
+  공유 캐시(extensions.cache)에 삭제 표시를 남겨, 디스크를 공유하지 않는 다른 서버도
+  조회 시 자기 디스크의 파일을 지우고 응답하지 않음 (같은 ID로 다시 저장하면 restore_cached_image로 해제)
+- 용량: 저장량이 한도의 1/10을 넘을 때마다 백그라운드에서 한도의 90%까지 최근에 쓰지 않은 파일부터 삭제
+- 정리: flask image-cache trim|clear
+
+환경 변수:
+    IMAGE_DISK_CACHE=0            디스크 캐시 비활성화 (기본: 활성)
+    IMAGE_DISK_CACHE_DIR          저장 위치 (기본: instance/image_cache)
+    IMAGE_DISK_CACHE_MAX_BYTES    총 용량 한도 (기본: 1GB)
+    IMAGE_SENDFILE                앞단 프록시가 파일을 보내게 할 방식 - x-accel (nginx) / x-sendfile (Apache, lighttpd)
+    IMAGE_ACCEL_PREFIX            x-accel 모드의 nginx internal location 경로 (기본: /_image_cache/)
+
+nginx 예시 (IMAGE_SENDFILE=x-accel):
+    location /_image_cache/ { internal; alias /app/instance/image_cache/; }
+"""
+
+import os
+import re
+import time
+import shutil
+import hashlib
+import threading
+import click
+from flask import has_app_context
+from flask.cli import AppGroup
+from extensions import cache
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMAGE_DISK_CACHE_ENABLED = os.environ.get('IMAGE_DISK_CACHE', '1').lower() not in ('0', 'false', 'off')
+IMAGE_DISK_CACHE_DIR = os.environ.get('IMAGE_DISK_CACHE_DIR') or os.path.join(_ROOT, 'instance', 'image_cache')
+IMAGE_DISK_CACHE_MAX_BYTES = int(os.environ.get('IMAGE_DISK_CACHE_MAX_BYTES', str(1024 * 1024 * 1024)))
+IMAGE_SENDFILE = os.environ.get('IMAGE_SENDFILE', '').lower()
+IMAGE_ACCEL_PREFIX = os.environ.get('IMAGE_ACCEL_PREFIX', '/_image_cache/')
+
+# 조회할 때 접근 시각(atime)을 이 간격(초)보다 오래됐을 때만 갱신 (용량 정리 순서용, noatime 마운트 대비)
+_TOUCH_SECONDS = 3600
+# 쓰다 만 임시 파일(프로세스 종료 등)을 정리할 때 기준 나이(초)
+_TEMP_MAX_AGE = 3600
+_SAFE_PART_RE = re.compile(r'^[0-9A-Za-z+.-]+$')
+# 삭제된 이미지 표시 키 접두사 (공유 캐시, 만료 없이 보관)
+_REMOVED_PREFIX = 'image-removed:'
+
+_stats = {'hits': 0, 'misses': 0, 'stored': 0, 'store_failed': 0, 'evictions': 0}
+_stats_lock = threading.Lock()
+_usage = {'bytes': None, 'files': None, 'scanned_at': None}  # 마지막 용량 정리 때 집계한 사용량
+
+_written_since_trim = 0  # 마지막 정리 이후 이 프로세스가 저장한 바이트
+_trim_running = False
+_trim_lock = threading.Lock()
+
+
+def _count(name, amount=1):
+    with _stats_lock:
+        _stats[name] += amount
+
+
+class CachedImageFile:
+    """디스크 캐시에서 연 이미지 파일 - 응답이 끝나면(또는 쓰지 않으면) close"""
+    
+    def __init__(self, path, file, length):
+        self.path = path
+        self.file = file
+        self.length = length
+    
+    def close(self):
+        self.file.close()
+
+
+def _image_dir(image_id):
+    digest = hashlib.md5(image_id.encode('utf-8')).hexdigest()
+    return os.path.join(IMAGE_DISK_CACHE_DIR, digest[:2], digest)
+
+
+def _variant_name(image_id, key):
+    # 'abc' → 'original', 'abc@w320q75.webp' → 'w320q75.webp'
+    return key[len(image_id) + 1:] if key.startswith(f"{image_id}@") else 'original'
+
+
+def _open(path, content_type, etag):
+    """파일을 열어 (CachedImageFile, content_type, etag) 반환 - 정리 중 삭제돼도 연 파일은 끝까지 읽힘"""
+    try:
+        file = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    stat = os.fstat(file.fileno())
+    now = time.time()
+    if now - stat.st_atime > _TOUCH_SECONDS:
+        try:
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+    return CachedImageFile(path, file, stat.st_size), content_type, etag
+
+
+def _lookup(image_id, key):
+    prefix = _variant_name(image_id, key) + '~'
+    try:
+        entries = os.scandir(_image_dir(image_id))
+    except FileNotFoundError:
+        return None
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(prefix):
+                etag, _, subtype = entry.name[len(prefix):].partition('.')
+                return _open(entry.path, f'image/{subtype}', etag)
+    return None
+
+
+def _store(image_id, key, body, content_type, etag):
+    """
+    bytes 또는 GridOut을 디스크에 저장 (임시 파일에 쓴 뒤 os.replace로 교체)
+    
+    Returns:
+        (CachedImageFile, content_type, etag) 또는 None (저장할 수 없는 형식, 디스크 오류 - GridOut은 처음 위치로 되돌림)
+    """
+    global _written_since_trim
+    subtype = (content_type or '').partition('/')[2]
+    if not (content_type or '').startswith('image/') or not _SAFE_PART_RE.match(subtype) or not _SAFE_PART_RE.match(etag or ''):
+        return None
+    
+    directory = _image_dir(image_id)
+    prefix = _variant_name(image_id, key) + '~'
+    name = f"{prefix}{etag}.{subtype}"
+    path = os.path.join(directory, name)
+    temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    file = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        file = open(temp_path, 'w+b')
+        if isinstance(body, bytes):
+            file.write(body)
+        else:
+            for chunk in iter(lambda: body.read(body.chunk_size), b''):
+                file.write(chunk)
+        file.flush()
+        os.replace(temp_path, path)
+    except Exception as e:
+        if file is not None:
+            file.close()
+        if not isinstance(e, OSError):
+            raise
+        _count('store_failed')
+        print(f"⚠️ 이미지 디스크 캐시 저장 실패 ({key}): {str(e)}")
+        if not isinstance(body, bytes):
+            body.seek(0)
+        return None
+    finally:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+    
+    if not isinstance(body, bytes):
+        body.close()
+    # 같은 파생 이미지의 이전 내용(다른 ETag) 정리
+    for other in os.listdir(directory):
+        if other.startswith(prefix) and other != name:
+            try:
+                os.remove(os.path.join(directory, other))
+            except FileNotFoundError:
+                pass
+    _count('stored')
+    
+    # 쓴 파일을 그대로 응답에 사용 (다시 열지 않으므로 그 사이 정리돼도 안전)
+    length = file.tell()
+    file.seek(0)
+    with _trim_lock:
+        _written_since_trim += length
+        start = _written_since_trim > IMAGE_DISK_CACHE_MAX_BYTES // 10 and not _trim_running
+    if start:
+        threading.Thread(target=_trim_in_background, daemon=True).start()
+    return CachedImageFile(path, file, length), content_type, etag
+
+
+def open_cached_image(image_id, key, load):
+    """
+    응답용 이미지 조회 - 디스크 캐시 → load() 후 디스크에 저장
+    
+    Args:
+        image_id: 원본 이미지 ID (파일 위치, 일괄 삭제 단위)
+        key: 캐시 키 (원본은 image_id, 파생 이미지는 variant_id 결과)
+        load: () -> (body, content_type, etag) - body는 bytes 또는 GridOut
+    
+    Returns:
+        (body, content_type, etag) - 디스크에 있거나 저장했으면 body는 CachedImageFile,
+        디스크 캐시를 쓸 수 없으면 load() 결과 그대로
+    """
+    if _is_removed(image_id):
+        # 다른 서버에서 삭제된 이미지 - 이 서버의 디스크 캐시도 지우고, 워커 메모리 캐시도 거치지 않음
+        shutil.rmtree(_image_dir(image_id), ignore_errors=True)
+        return None, None, None
+    if not IMAGE_DISK_CACHE_ENABLED:
+        return load()
+    
+    cached = _lookup(image_id, key)
+    if cached is not None:
+        _count('hits')
+        return cached
+    
+    _count('misses')
+    body, content_type, etag = load()
+    if body is None:
+        return None, None, None
+    return _store(image_id, key, body, content_type, etag) or (body, content_type, etag)
+
+
+def _is_removed(image_id):
+    # 앱 컨텍스트 밖(백그라운드 스레드 등)이거나 공유 캐시 오류면 표시가 없는 것으로 처리
+    if not has_app_context():
+        return False
+    try:
+        return cache.get(_REMOVED_PREFIX + image_id) is not None
+    except Exception:
+        return False
+
+
+def remove_cached_image(image_id):
+    """
+    원본/파생 이미지 디스크 캐시 삭제
+    
+    이 서버의 파일은 바로 지우고, 공유 캐시에 삭제 표시를 남겨 다른 서버는 다음 조회 때 지운다.
+    """
+    if has_app_context():
+        try:
+            cache.set(_REMOVED_PREFIX + image_id, int(time.time()), timeout=0)
+        except Exception as e:
+            print(f"⚠️ 이미지 삭제 표시 저장 실패 ({image_id}): {str(e)}")
+    shutil.rmtree(_image_dir(image_id), ignore_errors=True)
+
+
+def restore_cached_image(image_id):
+    """삭제 표시 해제 - 삭제했던 ID로 이미지를 다시 저장한 경우 (custom_id)"""
+    if has_app_context():
+        try:
+            cache.delete(_REMOVED_PREFIX + image_id)
+        except Exception as e:
+            print(f"⚠️ 이미지 삭제 표시 해제 실패 ({image_id}): {str(e)}")
+
+
+def sendfile_headers(image_file):
+    """
+    앞단 프록시가 파일을 직접 보내도록 하는 헤더 (IMAGE_SENDFILE 미설정이면 빈 dict)
+    
+    헤더로 응답하면 본문과 Range 처리는 프록시가 맡는다.
+    """
+    if IMAGE_SENDFILE == 'x-accel':
+        relative = os.path.relpath(image_file.path, IMAGE_DISK_CACHE_DIR).replace(os.sep, '/')
+        return {'X-Accel-Redirect': IMAGE_ACCEL_PREFIX.rstrip('/') + '/' + relative}
+    if IMAGE_SENDFILE == 'x-sendfile':
+        return {'X-Sendfile': os.path.abspath(image_file.path)}
+    return {}
+
+
+# ---------- 용량 정리 ----------
+
+def trim_disk_cache(max_bytes=None):
+    """
+    용량 한도를 넘으면 한도의 90%까지 최근에 쓰지 않은(atime) 파일부터 삭제
+    
+    Returns:
+        삭제한 파일 수
+    """
+    max_bytes = IMAGE_DISK_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    now = time.time()
+    files = []
+    total = 0
+    for root, dirs, names in os.walk(IMAGE_DISK_CACHE_DIR):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if name.startswith('.'):
+                # 쓰다 만 임시 파일
+                if now - stat.st_mtime > _TEMP_MAX_AGE:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                continue
+            files.append((stat.st_atime, stat.st_size, path))
+            total += stat.st_size
+    
+    removed = 0
+    if total > max_bytes:
+        target = max_bytes * 0.9
+        files.sort()
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            removed += 1
+            try:
+                os.rmdir(os.path.dirname(path))  # 비어 있으면 이미지 디렉토리도 삭제
+            except OSError:
+                pass
+    
+    _count('evictions', removed)
+    with _stats_lock:
+        _usage.update(bytes=total, files=len(files) - removed, scanned_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+    if removed:
+        print(f"🧹 이미지 디스크 캐시 정리: {removed}개 삭제 → {total / (1024 * 1024):.1f}MB")
+    return removed
+
+
+def _trim_in_background():
+    global _written_since_trim, _trim_running
+    with _trim_lock:
+        if _trim_running:
+            return
+        _trim_running = True
+        _written_since_trim = 0
+    try:
+        trim_disk_cache()
+    except Exception as e:
+        print(f"⚠️ 이미지 디스크 캐시 정리 오류: {str(e)}")
+    finally:
+        with _trim_lock:
+            _trim_running = False
+
+
+def get_image_disk_cache_stats():
+    """디스크 캐시 통계 - 적중/미스/저장/삭제 횟수는 현재 프로세스, 사용량은 마지막 정리 시점"""
+    with _stats_lock:
+        stats = dict(_stats, **_usage)
+    lookups = stats['hits'] + stats['misses']
+    stats.update(
+        enabled=IMAGE_DISK_CACHE_ENABLED,
+        maxbytes=IMAGE_DISK_CACHE_MAX_BYTES,
+        sendfile=IMAGE_SENDFILE or 'wsgi.file_wrapper',
+        hit_rate=round(stats['hits'] / lookups * 100, 1) if lookups else 0.0,
+        pid=os.getpid(),
+    )
+    return stats
+
+
+# ---------- Flask CLI ----------
+
+image_cache_cli = AppGroup('image-cache', help='이미지 디스크 캐시 정리/삭제')
+
+
+@image_cache_cli.command('trim')
+@click.option('--max-mb', type=int, default=None, help='이 용량(MB)까지 정리 (기본: IMAGE_DISK_CACHE_MAX_BYTES)')
+def trim_command(max_mb):
+    """용량 한도를 넘은 만큼 오래 쓰지 않은 이미지 파일 삭제"""
+    removed = trim_disk_cache(max_mb * 1024 * 1024 if max_mb is not None else None)
+    print(f"✅ 이미지 디스크 캐시: {_usage['files']}개, {_usage['bytes'] / (1024 * 1024):.1f}MB (삭제 {removed}개)")
+
+
+@image_cache_cli.command('clear')
+def clear_command():
+    """이미지 디스크 캐시 전체 삭제 (다음 요청부터 GridFS에서 다시 저장)"""
+    shutil.rmtree(IMAGE_DISK_CACHE_DIR, ignore_errors=True)
+    print(f"🧹 이미지 디스크 캐시 삭제: {IMAGE_DISK_CACHE_DIR}")
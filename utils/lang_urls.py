@@ -0,0 +1,154 @@
+"""
+언어 접두사 URL (/en/services, /ja/gallery/detail/3)
+
+기존 공개 페이지는 ?lang=, preferred_lang 쿠키, 세션, Accept-Language 순으로 언어를 정하고
+get_locale()이 일반 페이지 조회에서도 세션/쿠키를 기록하므로, 같은 URL의 응답이 방문자 쿠키마다 달라
+프록시/CDN이 캐시할 수 없습니다.
+언어 접두사 URL은 언어를 URL에서만 정하고 세션을 읽지도 쓰지도 않으므로 (Set-Cookie, Vary: Cookie 없음)
+공유 HTTP 캐시가 언어별로 한 부씩 보관할 수 있습니다. 기존 URL은 그대로 동작합니다.
+
+- 대상 페이지: localize_pages(엔드포인트, ...) - 같은 엔드포인트에 '/<언어>' 접두사 규칙 추가
+- 접두사 페이지 안의 url_for 링크는 자동으로 같은 접두사를 유지
+  (localize_links로 등록한 폼 페이지 등은 접두사 대신 ?lang= 을 붙여 언어 유지)
+- 템플릿: lang_alternates() → hreflang 링크 목록 (base.html)
+- 응답: Cache-Control: public, max-age=0, s-maxage=LANG_URL_SHARED_MAX_AGE (브라우저는 ETag로 재검증)
+- 페이지 캐시/조각 캐시/스냅샷은 링크가 다르므로 url_prefix()로 일반 URL과 따로 보관
+
+환경 변수:
+    LANG_URLS=0                  언어 접두사 URL 비활성화 (기본: 활성)
+    LANG_URL_SHARED_MAX_AGE      공유 캐시(s-maxage) 보관 시간(초) (기본: 300)
+"""
+
+import os
+import re
+from flask import g, request, url_for, has_app_context
+from flask.sessions import SecureCookieSessionInterface
+from werkzeug.routing import Rule
+from utils.translation import SUPPORTED_LANGUAGES
+
+LANG_URLS_ENABLED = os.environ.get('LANG_URLS', '1').lower() not in ('0', 'false', 'off')
+LANG_URL_SHARED_MAX_AGE = int(os.environ.get('LANG_URL_SHARED_MAX_AGE', '300'))
+
+_PREFIX_RE = re.compile(r'^/(?:%s)(?:/|$)' % '|'.join(SUPPORTED_LANGUAGES))
+
+_localized = set()  # 접두사 URL로도 제공하는 엔드포인트
+_query_lang = set()  # 접두사 페이지에서 링크할 때 ?lang= 을 붙이는 엔드포인트
+
+
+def localize_pages(*endpoints):
+    """언어 접두사 URL로도 제공할 공개 페이지 등록 (세션/쿠키 없이 응답 가능한 GET 페이지만)"""
+    _localized.update(endpoints)
+
+
+def localize_links(*endpoints):
+    """접두사 페이지에서 링크할 때 ?lang= 으로 언어를 넘길 페이지 등록 (세션을 쓰는 폼 페이지 등)"""
+    _query_lang.update(endpoints)
+
+
+def is_localized(endpoint):
+    return LANG_URLS_ENABLED and endpoint in _localized
+
+
+def url_lang():
+    """언어 접두사 URL 요청이면 URL의 언어 코드, 아니면 None"""
+    return g.get('url_lang') if has_app_context() else None
+
+
+def url_prefix():
+    """캐시 키 구분용 URL 접두사 ('/en' 또는 '')"""
+    lang = url_lang()
+    return f"/{lang}" if lang else ''
+
+
+def _is_lang_url_request(req):
+    return LANG_URLS_ENABLED and req.method in ('GET', 'HEAD') and _PREFIX_RE.match(req.path) is not None
+
+
+class LangUrlSessionInterface(SecureCookieSessionInterface):
+    """언어 접두사 URL 요청은 세션 쿠키를 읽지도 저장하지도 않음 (모든 방문자에게 같은 응답)"""
+    
+    def open_session(self, app, req):
+        if _is_lang_url_request(req):
+            # 요청 안에서만 쓰고 버리는 빈 세션 (플래시/로그인/언어 기록 모두 무시)
+            return self.session_class()
+        return super().open_session(app, req)
+    
+    def save_session(self, app, session, response):
+        if _is_lang_url_request(request):
+            return
+        super().save_session(app, session, response)
+
+
+def _pull_lang_code(endpoint, values):
+    # url_value_preprocessor - 뷰 인자에서 언어 코드를 꺼내 요청 언어로 고정
+    if values and 'lang_code' in values:
+        lang = values.pop('lang_code')
+        g.url_lang = lang
+        g.current_lang = lang
+
+
+def _add_lang_code(endpoint, values):
+    # url_defaults - 접두사 페이지 안의 링크는 같은 언어 URL로 (lang_code=None 지정 시 접두사 없는 URL)
+    lang = g.get('url_lang')
+    if not lang or 'lang_code' in values:
+        return
+    if endpoint in _localized:
+        values['lang_code'] = lang
+    elif endpoint in _query_lang:
+        values.setdefault('lang', lang)
+
+
+def _add_shared_cache_headers(response):
+    # after_request - 접두사 페이지는 공유 캐시 보관 허용 (블루프린트의 ETag/no-cache 설정 이후 실행)
+    # 조회 오류 대체 화면(shared_cache.mark_render_fallback)은 공유 캐시에 보관하지 않음
+    if g.get('render_fallback'):
+        return response
+    if g.get('url_lang') and request.endpoint in _localized and response.status_code in (200, 304):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 0
+        response.cache_control.s_maxage = LANG_URL_SHARED_MAX_AGE
+        response.vary.add('HX-Request')
+    return response
+
+
+def lang_alternates():
+    """
+    현재 페이지의 언어별 URL (hreflang 링크용)
+    
+    Returns:
+        [(hreflang, 절대 URL), ...] - 마지막은 x-default(접두사 없는 URL), 대상 페이지가 아니면 빈 목록
+    """
+    if not is_localized(request.endpoint):
+        return []
+    view_args = request.view_args or {}
+    links = [(code, url_for(request.endpoint, lang_code=code, _external=True, **view_args))
+             for code in SUPPORTED_LANGUAGES]
+    links.append(('x-default', url_for(request.endpoint, lang_code=None, _external=True, **view_args)))
+    return links
+
+
+def init_app(app):
+    """
+    언어 접두사 URL 규칙/훅 등록 (블루프린트 등록 후 호출)
+    
+    localize_pages로 등록된 엔드포인트의 모든 URL 규칙에 '/<언어>' 접두사 규칙을 추가한다.
+    """
+    app.jinja_env.globals['lang_alternates'] = lang_alternates
+    if not LANG_URLS_ENABLED:
+        return
+    
+    app.session_interface = LangUrlSessionInterface()
+    converter = 'any(%s)' % ', '.join(SUPPORTED_LANGUAGES)
+    added = 0
+    for rule in list(app.url_map.iter_rules()):
+        if rule.endpoint in _localized:
+            app.url_map.add(Rule(f"/<{converter}:lang_code>{rule.rule}", endpoint=rule.endpoint,
+                                 methods=rule.methods, defaults=rule.defaults,
+                                 strict_slashes=rule.strict_slashes))
+            added += 1
+    
+    app.url_value_preprocessor(_pull_lang_code)
+    app.url_defaults(_add_lang_code)
+    app.after_request(_add_shared_cache_headers)
+    print(f"🌐 언어 접두사 URL 규칙 {added}개 등록 (/{'|'.join(SUPPORTED_LANGUAGES)}/...)")
@@ -0,0 +1,82 @@
+"""
+지연 평가 템플릿 컨텍스트
+
+context_processor는 render_template 호출마다 실행되므로, 메뉴 데이터나 사이트 색상처럼
+일부 템플릿(base.html 레이아웃)만 쓰는 값도 관리자 페이지와 HTMX 조각 렌더링까지 매번 준비하게 됩니다.
+lazy_context()는 값을 바로 계산하지 않고 프록시를 돌려주며,
+템플릿이 실제로 값을 사용하는 순간 한 번만 계산해 요청의 g에 보관합니다.
+(같은 요청 안의 다른 render_template, 조각 캐시 적중으로 건너뛴 블록은 다시 계산하지 않음)
+
+사용법:
+    menu = lazy_context('menu_data', _get_cached_menu_data)
+    
+    @app.context_processor
+    def inject_menu_data():
+        return {'menu_categories': menu['menu_categories']}
+
+- 프록시는 속성/항목 접근, 반복, 비교, 문자열 변환 등을 원래 값으로 전달합니다 (werkzeug LocalProxy)
+- 템플릿에서 Python 함수나 DB 쿼리 인자로 넘기는 값(current_lang 등)은 프록시로 만들지 않습니다
+"""
+
+import os
+import threading
+from flask import g
+from werkzeug.local import LocalProxy
+
+_stats = {}  # {이름: {'offered': 값을 제공한 요청 수, 'resolved': 실제로 계산한 요청 수}}
+_stats_lock = threading.Lock()
+
+
+def _count(name, field):
+    with _stats_lock:
+        entry = _stats.setdefault(name, {'offered': 0, 'resolved': 0})
+        entry[field] += 1
+
+
+def _resolve(name, loader):
+    values = g.setdefault('_lazy_context', {})
+    if name not in values:
+        values[name] = loader()
+        _count(name, 'resolved')
+    return values[name]
+
+
+class LazyContext:
+    """
+    요청별로 한 번만 계산되는 컨텍스트 값
+    
+    Args:
+        name: g에 보관할 이름 (통계에도 사용)
+        loader: 값을 계산하는 함수 (인자 없음)
+    """
+    
+    def __init__(self, name, loader):
+        self.name = name
+        self.loader = loader
+    
+    def proxy(self, key=None):
+        """값(또는 값[key])을 처음 사용할 때 계산하는 프록시"""
+        offered = g.setdefault('_lazy_offered', set())
+        if self.name not in offered:
+            offered.add(self.name)
+            _count(self.name, 'offered')
+        if key is None:
+            return LocalProxy(lambda: _resolve(self.name, self.loader))
+        return LocalProxy(lambda: _resolve(self.name, self.loader)[key])
+    
+    def __getitem__(self, key):
+        return self.proxy(key)
+
+
+def lazy_context(name, loader):
+    """LazyContext 생성 (lazy_context(...)[key] 또는 .proxy()로 프록시 생성)"""
+    return LazyContext(name, loader)
+
+
+def get_lazy_context_stats():
+    """지연 컨텍스트 값별 제공/계산 횟수 (현재 프로세스)"""
+    with _stats_lock:
+        stats = {name: dict(entry) for name, entry in _stats.items()}
+    for entry in stats.values():
+        entry['skip_rate'] = round((1 - entry['resolved'] / entry['offered']) * 100, 1) if entry['offered'] else 0.0
+    return {'pid': os.getpid(), 'values': stats}
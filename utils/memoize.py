@@ -0,0 +1,198 @@
+"""
+프로세스 메모리 메모이제이션 (크기 제한 + TTL + LRU)
+
+요청마다 반복되는 계산(서비스 목록 그룹화, 메뉴/사이트 색상 컨텍스트 등)을 워커 메모리에 보관합니다.
+- 최대 항목 수(또는 maxbytes 지정 시 총 바이트)를 넘으면 가장 오래 쓰지 않은 항목부터 제거 (크롤러가 키를 많이 만들어도 메모리 일정)
+- 항목마다 TTL 적용
+- 같은 키의 동시 미스는 키별 락으로 한 번만 계산 (다른 키는 서로 막지 않음)
+- 적중/미스/만료/제거/대기 횟수 집계 (get_memoize_stats)
+
+워커 간 무효화가 필요한 값은 shared_cache.tagged_key()로 만든 키를 사용하면
+태그가 무효화될 때 키가 바뀌어 모든 워커에서 새로 계산됩니다 (이전 키는 LRU/TTL로 정리).
+
+사용법:
+    @memoize('get_all_services', maxsize=32, ttl=300, key=make_key)
+    def get_all_services(): ...
+    
+    menu_cache = TTLCache('menu', maxsize=16, ttl=300)
+    menu_cache.get_or_set(key, load_menu)
+    
+    image_cache = TTLCache('image', maxsize=1000, ttl=600, maxbytes=32 * 1024 * 1024, sizeof=lambda v: len(v[0]))
+"""
+
+import os
+import time
+import functools
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+_registry = {}  # {이름: TTLCache} - 통계 조회용
+_registry_lock = threading.Lock()
+
+
+class TTLCache:
+    """
+    스레드 안전한 크기 제한 TTL/LRU 캐시
+    
+    Args:
+        name: 통계에 표시할 이름
+        maxsize: 최대 항목 수
+        ttl: 항목 유효 시간(초)
+        maxbytes: 항목 크기 합계 상한 (None이면 항목 수만 제한)
+        sizeof: 값 -> 바이트 수 (maxbytes 사용 시 필요, 상한보다 큰 값은 저장하지 않음)
+    """
+    
+    def __init__(self, name, maxsize=128, ttl=300, maxbytes=None, sizeof=None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self._data = OrderedDict()  # {키: (만료 시각, 값, 바이트)} - 최근 사용 순
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks = {}  # {키: [Lock, 참조 수]} - 계산 중인 키만
+        self._stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0, 'waits': 0, 'oversize': 0}
+        with _registry_lock:
+            _registry[name] = self
+    
+    def _remove(self, key):
+        # self._lock 보유 상태에서 호출
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+        return entry
+    
+    def _lookup(self, key):
+        # self._lock 보유 상태에서 호출
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] <= time.monotonic():
+            self._remove(key)
+            self._stats['expired'] += 1
+            return _MISSING
+        self._data.move_to_end(key)
+        return entry[1]
+    
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self._stats['misses'] += 1
+                return default
+            self._stats['hits'] += 1
+            return value
+    
+    def set(self, key, value):
+        size = self.sizeof(value) if self.sizeof else 0
+        with self._lock:
+            self._remove(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                self._stats['oversize'] += 1
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+                _, entry = self._data.popitem(last=False)
+                self._bytes -= entry[2]
+                self._stats['evictions'] += 1
+    
+    def pop(self, key):
+        with self._lock:
+            entry = self._remove(key)
+        return entry[1] if entry is not None else None
+    
+    def keys(self):
+        """현재 키 목록 (복사본)"""
+        with self._lock:
+            return list(self._data)
+    
+    def get_or_set(self, key, compute, cacheable=None):
+        """
+        캐시된 값 반환, 없으면 compute()로 계산해 저장
+        
+        같은 키를 동시에 요청한 스레드는 먼저 온 스레드의 계산 결과를 기다린다.
+        cacheable(값)이 False면 저장하지 않는다 (없는 데이터, 스트림 등).
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._stats['hits'] += 1
+                return value
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = self._key_locks[key] = [threading.Lock(), 0]
+            key_lock[1] += 1
+        
+        try:
+            with key_lock[0]:
+                with self._lock:
+                    value = self._lookup(key)
+                    # 기다리는 동안 다른 스레드가 계산했으면 대기, 아니면 직접 계산(미스)
+                    self._stats['misses' if value is _MISSING else 'waits'] += 1
+                if value is not _MISSING:
+                    return value
+                value = compute()
+                if cacheable is None or cacheable(value):
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                key_lock[1] -= 1
+                if key_lock[1] == 0:
+                    self._key_locks.pop(key, None)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._data)
+            stats['bytes'] = self._bytes
+        served = stats['hits'] + stats['waits']
+        lookups = served + stats['misses']
+        stats.update(
+            maxsize=self.maxsize,
+            maxbytes=self.maxbytes,
+            ttl=self.ttl,
+            hit_rate=round(served / lookups * 100, 1) if lookups else 0.0,
+        )
+        return stats
+
+
+def memoize(name, maxsize=128, ttl=300, key=None):
+    """
+    함수 결과 메모이제이션 데코레이터
+    
+    Args:
+        name: 통계에 표시할 이름
+        maxsize: 최대 항목 수
+        ttl: 유효 시간(초)
+        key: (*args, **kwargs) -> 캐시 키 (기본: 인자 튜플, 인자는 해시 가능해야 함)
+    
+    원래 함수는 wrapper.__wrapped__, 캐시는 wrapper.cache 로 접근할 수 있다.
+    """
+    def decorator(func):
+        cache = TTLCache(name, maxsize=maxsize, ttl=ttl)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            return cache.get_or_set(cache_key, lambda: func(*args, **kwargs))
+        
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def get_memoize_stats():
+    """메모이제이션 캐시별 통계 (현재 프로세스)"""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {'pid': os.getpid(), 'caches': {cache.name: cache.stats() for cache in caches}}
@@ -0,0 +1,284 @@
+"""
+공유 MongoClient 레지스트리
+
+워커 프로세스마다 MongoClient 하나만 만들어 모든 모듈(모델, GridFS, 번역,
+방문자/AI 사용량 추적)이 같은 연결 풀을 사용하도록 합니다.
+- fork-safe: fork 이후 자식 프로세스에서는 새 클라이언트 생성
+- 풀 크기 설정: 환경 변수 MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE,
+  MONGO_MAX_IDLE_TIME_MS, MONGO_WAIT_QUEUE_TIMEOUT_MS
+- 풀 계측: 체크아웃 대기 시간, 사용 중 연결 수, 생성/종료 수
+- 쿼리 프로파일링: utils/mongo_profiler.py 의 CommandListener 등록
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from pymongo import MongoClient, monitoring
+from dotenv import load_dotenv
+from utils.mongo_profiler import get_event_listeners
+
+load_dotenv()
+
+DEFAULT_DB_NAME = 'STG-DB'
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 연결 풀 설정 (gthread 워커의 스레드 수보다 넉넉하게)
+MONGO_POOL_CONFIG = {
+    'maxPoolSize': _env_int('MONGO_MAX_POOL_SIZE', 20),
+    'minPoolSize': _env_int('MONGO_MIN_POOL_SIZE', 2),
+    'maxIdleTimeMS': _env_int('MONGO_MAX_IDLE_TIME_MS', 300000),  # 5분 유휴 연결 정리
+    'waitQueueTimeoutMS': _env_int('MONGO_WAIT_QUEUE_TIMEOUT_MS', 10000),
+}
+
+# 체크아웃 대기가 이 시간(ms)을 넘으면 '대기 발생'으로 집계
+SLOW_CHECKOUT_MS = _env_int('MONGO_SLOW_CHECKOUT_MS', 5)
+
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """연결 풀 이벤트로 체크아웃 대기 시간과 사용 중 연결 수를 집계"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.created = 0
+            self.closed = 0
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.in_use = 0
+            self.max_in_use = 0
+            self.waiting = 0
+            self.max_waiting = 0
+            self.slow_checkouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+            self.recent_waits = deque(maxlen=500)
+            self.pool_clears = 0
+    
+    # 체크아웃은 요청한 스레드에서 동기적으로 일어나므로 시작 시각을 스레드 로컬에 보관
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+    
+    def _finish_wait(self):
+        started = getattr(self._local, 'started', None)
+        self._local.started = None
+        return (time.perf_counter() - started) * 1000 if started is not None else 0.0
+    
+    def connection_checked_out(self, event):
+        wait_ms = self._finish_wait()
+        with self._lock:
+            self.waiting = max(0, self.waiting - 1)
+            self.checkouts += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            self.recent_waits.append(wait_ms)
+            if wait_ms >= SLOW_CHECKOUT_MS:
+                self.slow_checkouts += 1
+    
+    def connection_check_out_failed(self, event):
+        self._finish_wait()
+        with self._lock:
+            self.waiting = max(0, self.waiting - 1)
+            self.checkout_failures += 1
+    
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+    
+    def connection_created(self, event):
+        with self._lock:
+            self.created += 1
+    
+    def connection_closed(self, event):
+        with self._lock:
+            self.closed += 1
+    
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_ready(self, event):
+        pass
+    
+    def snapshot(self):
+        """현재 집계값 딕셔너리"""
+        with self._lock:
+            waits = sorted(self.recent_waits)
+            p95 = waits[int(len(waits) * 0.95) - 1] if len(waits) >= 20 else (waits[-1] if waits else 0.0)
+            return {
+                'connections_created': self.created,
+                'connections_closed': self.closed,
+                'connections_open': self.created - self.closed,
+                'checkouts': self.checkouts,
+                'checkout_failures': self.checkout_failures,
+                'in_use': self.in_use,
+                'max_in_use': self.max_in_use,
+                'waiting': self.waiting,
+                'max_waiting': self.max_waiting,
+                'slow_checkouts': self.slow_checkouts,
+                'avg_wait_ms': round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                'p95_wait_ms': round(p95, 3),
+                'max_wait_ms': round(self.max_wait_ms, 3),
+                'pool_clears': self.pool_clears,
+            }
+
+
+pool_stats = PoolStatsListener()
+
+
+def _reset_after_fork():
+    """fork 직후 자식 프로세스에서 부모의 클라이언트/통계를 버림 (부모 소켓 공유 방지)"""
+    global _client, _client_pid
+    _client = None
+    _client_pid = None
+    pool_stats.reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_client():
+    """
+    프로세스 공유 MongoClient 반환 (fork-safe, thread-safe)
+    
+    Raises:
+        Exception: MONGO_URI 미설정 또는 연결 실패
+    """
+    global _client, _client_pid
+    
+    current_pid = os.getpid()
+    
+    # 빠른 경로: 이미 이 프로세스의 클라이언트가 있으면 락 없이 반환
+    client = _client
+    if client is not None and _client_pid == current_pid:
+        return client
+    
+    with _client_lock:
+        if _client is not None and _client_pid == current_pid:
+            return _client
+        
+        if _client_pid is not None and _client_pid != current_pid:
+            print(f"MongoDB: Fork 감지 (기존 PID: {_client_pid}, 현재 PID: {current_pid}), 클라이언트 재생성")
+            pool_stats.reset()
+        
+        mongo_uri = os.environ.get('MONGO_URI')
+        if not mongo_uri:
+            raise Exception("MONGO_URI 환경 변수가 설정되지 않았습니다!")
+        
+        client = MongoClient(
+            mongo_uri,
+            serverSelectionTimeoutMS=30000,
+            connectTimeoutMS=20000,
+            socketTimeoutMS=20000,
+            retryWrites=True,
+            retryReads=True,
+            w='majority',
+            readPreference='primaryPreferred',
+            event_listeners=[pool_stats] + get_event_listeners(),
+            **MONGO_POOL_CONFIG
+        )
+        # 연결 확인 (프로세스당 한 번만)
+        client.admin.command('ping')
+        
+        _client = client
+        _client_pid = current_pid
+        print(f"MongoDB: 공유 클라이언트 연결 성공 (PID: {current_pid}, "
+              f"pool {MONGO_POOL_CONFIG['minPoolSize']}~{MONGO_POOL_CONFIG['maxPoolSize']})")
+        return _client
+
+
+def get_database(name=None):
+    """공유 클라이언트의 데이터베이스 반환 (기본: STG-DB)"""
+    return get_client()[name or DEFAULT_DB_NAME]
+
+
+def warm_pool(connections=None):
+    """
+    연결 풀 예열 - 여러 스레드에서 동시에 ping을 보내 연결을 미리 만들어 둠
+    
+    fork 직후(워커 부팅 시) 호출하면 첫 요청들이 TCP/TLS 핸드셰이크를 기다리지 않는다.
+    
+    Args:
+        connections: 예열할 연결 수 (기본: minPoolSize, 최소 1)
+    
+    Returns:
+        성공한 ping 수
+    """
+    count = max(1, connections or MONGO_POOL_CONFIG['minPoolSize'])
+    try:
+        client = get_client()
+    except Exception as e:
+        print(f"MongoDB: 연결 풀 예열 실패 - {str(e)}")
+        return 0
+    
+    succeeded = []
+    barrier = threading.Barrier(count)
+    
+    def ping():
+        try:
+            barrier.wait(timeout=5)
+        except threading.BrokenBarrierError:
+            pass
+        try:
+            client.admin.command('ping')
+            succeeded.append(1)
+        except Exception as e:
+            print(f"MongoDB: 예열 ping 실패 - {str(e)}")
+    
+    threads = [threading.Thread(target=ping, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    
+    print(f"🔥 MongoDB 연결 풀 예열 완료: {len(succeeded)}/{count} (PID: {os.getpid()})")
+    return len(succeeded)
+
+
+def warm_pool_in_background(connections=None):
+    """워커 부팅을 막지 않도록 백그라운드 스레드에서 예열"""
+    thread = threading.Thread(target=warm_pool, args=(connections,), daemon=True)
+    thread.start()
+    return thread
+
+
+def get_pool_stats():
+    """연결 풀 설정과 이 프로세스의 계측값 반환"""
+    stats = pool_stats.snapshot()
+    stats.update({
+        'pid': os.getpid(),
+        'connected': _client is not None and _client_pid == os.getpid(),
+        'config': dict(MONGO_POOL_CONFIG),
+        'slow_checkout_threshold_ms': SLOW_CHECKOUT_MS,
+    })
+    return stats
@@ -0,0 +1,254 @@
+"""
+MongoDB 인덱스 선언/동기화
+
+인덱스는 모델의 `indexes` 속성(또는 모델이 없는 컬렉션은 register_indexes)으로 선언하고,
+실제 생성/삭제는 배포 시 한 번 `flask db-indexes sync` 로 적용합니다.
+다른 인덱스로 대체되어 더 이상 필요 없는 인덱스는 retire_indexes로 선언하면 --drop 없이도 sync에서 삭제합니다.
+워커 부팅 시에는 check_indexes()로 누락 여부만 읽어서 경고합니다 (쓰기 없음).
+
+사용법:
+    flask db-indexes check          # 선언과 실제 인덱스 비교 (읽기 전용)
+    flask db-indexes sync           # 누락된 인덱스 생성
+    flask db-indexes sync --drop    # 선언되지 않은 인덱스 삭제 + 옵션이 다른 인덱스 재생성
+    flask db-indexes sync --dry-run # 적용할 작업만 출력
+"""
+
+import threading
+import click
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
+from flask.cli import AppGroup
+from utils.mongo_client import get_database
+
+# 비교 대상 인덱스 옵션 (그 외 옵션은 서버 기본값이므로 비교하지 않음)
+COMPARED_OPTIONS = ('unique', 'sparse', 'expireAfterSeconds', 'partialFilterExpression')
+
+_registry = {}  # {컬렉션명: [Index, ...]} - 모델이 없는 컬렉션용
+_retired = {}  # {컬렉션명: [Index, ...]} - sync 때 삭제할 대체된 인덱스
+_registry_lock = threading.Lock()
+
+
+class Index:
+    """
+    인덱스 선언
+    
+    Args:
+        keys: 필드명, 또는 (필드명, 방향) 튜플 목록
+        **options: create_index 옵션 (unique, sparse, expireAfterSeconds, partialFilterExpression)
+    """
+    
+    def __init__(self, keys, **options):
+        if isinstance(keys, str):
+            keys = [(keys, ASCENDING)]
+        self.keys = [(field, direction) for field, direction in keys]
+        self.options = options
+    
+    @property
+    def key_tuple(self):
+        return tuple(self.keys)
+    
+    def compared_options(self):
+        return {key: self.options[key] for key in COMPARED_OPTIONS if self.options.get(key)}
+    
+    def __repr__(self):
+        options = ', '.join(f"{key}={value!r}" for key, value in self.options.items())
+        return f"Index({self.keys}{', ' + options if options else ''})"
+
+
+def register_indexes(collection_name, indexes):
+    """모델 클래스가 없는 컬렉션(방문자, AI 사용량, 번역 등)의 인덱스 선언"""
+    with _registry_lock:
+        _registry[collection_name] = list(indexes)
+
+
+def retire_indexes(collection_name, indexes):
+    """
+    대체된 인덱스 선언 (예: 복합 인덱스의 접두사가 된 단일 필드 인덱스)
+    
+    쓰기마다 유지 비용만 드는 인덱스이므로 sync가 --drop 없이도 삭제한다.
+    """
+    with _registry_lock:
+        _retired.setdefault(collection_name, []).extend(indexes)
+
+
+def declared_indexes():
+    """
+    선언된 전체 인덱스
+    
+    Returns:
+        {컬렉션명: [Index, ...]} (모델 선언 + register_indexes 등록분)
+    """
+    from utils.mongo_models import MongoModel
+    
+    declared = {}
+    for model in MongoModel.__subclasses__():
+        if model.collection_name:
+            declared.setdefault(model.collection_name, []).extend(model.indexes)
+    with _registry_lock:
+        for collection_name, indexes in _registry.items():
+            declared.setdefault(collection_name, []).extend(indexes)
+    return declared
+
+
+def _normalize_key(key):
+    # 서버가 방향을 1.0 같은 float로 돌려주는 경우가 있어 정수로 맞춤
+    return tuple(
+        (field, int(direction) if isinstance(direction, (int, float)) else direction)
+        for field, direction in key
+    )
+
+
+def diff_indexes(db=None):
+    """
+    선언과 실제 인덱스 비교 (읽기 전용 - 컬렉션마다 listIndexes 1회)
+    
+    Returns:
+        {컬렉션명: {'missing': [Index], 'changed': [(Index, 기존 이름)], 'retired': [기존 이름], 'extra': [기존 이름]}}
+        (차이가 있는 컬렉션만 포함)
+    """
+    db = db if db is not None else get_database()
+    report = {}
+    with _registry_lock:
+        retired_keys = {name: {index.key_tuple for index in indexes} for name, indexes in _retired.items()}
+    for collection_name, indexes in sorted(declared_indexes().items()):
+        existing = {}
+        for name, info in db[collection_name].index_information().items():
+            if name == '_id_':
+                continue
+            options = {key: info[key] for key in COMPARED_OPTIONS if info.get(key)}
+            existing[_normalize_key(info['key'])] = (name, options)
+        
+        missing, changed = [], []
+        for index in indexes:
+            current = existing.pop(index.key_tuple, None)
+            if current is None:
+                missing.append(index)
+            elif current[1] != index.compared_options():
+                changed.append((index, current[0]))
+        retired = sorted(name for key, (name, _) in existing.items() if key in retired_keys.get(collection_name, ()))
+        extra = sorted(name for name, _ in existing.values() if name not in retired)
+        
+        if missing or changed or retired or extra:
+            report[collection_name] = {'missing': missing, 'changed': changed, 'retired': retired, 'extra': extra}
+    return report
+
+
+def sync_indexes(drop=False, dry_run=False, db=None):
+    """
+    선언된 인덱스 적용
+    
+    Args:
+        drop: True면 선언되지 않은 인덱스를 삭제하고 옵션이 다른 인덱스를 재생성
+        dry_run: True면 작업 내용만 출력
+    
+    Returns:
+        {'created': n, 'dropped': n, 'failed': n, 'skipped': n}
+    """
+    db = db if db is not None else get_database()
+    result = {'created': 0, 'dropped': 0, 'failed': 0, 'skipped': 0}
+    
+    def run(kind, label, action):
+        if dry_run:
+            print(f"  (dry-run) {label}")
+            return
+        try:
+            action()
+            print(f"  ✅ {label}")
+            result[kind] += 1
+        except PyMongoError as e:
+            print(f"  ❌ {label} - {str(e)}")
+            result['failed'] += 1
+    
+    for collection_name, diff in diff_indexes(db).items():
+        collection = db[collection_name]
+        print(f"📂 {collection_name}")
+        
+        for index in diff['missing']:
+            run('created', f"생성 {index}", lambda index=index: collection.create_index(index.keys, **index.options))
+        
+        for index, name in diff['changed']:
+            if not drop:
+                print(f"  ⚠️ 옵션 불일치 {name} → {index} (--drop 으로 재생성)")
+                result['skipped'] += 1
+                continue
+            run('dropped', f"삭제 {name} (옵션 변경)", lambda name=name: collection.drop_index(name))
+            run('created', f"생성 {index}", lambda index=index: collection.create_index(index.keys, **index.options))
+        
+        for name in diff['retired']:
+            run('dropped', f"삭제 {name} (대체된 인덱스)", lambda name=name: collection.drop_index(name))
+        
+        for name in diff['extra']:
+            if not drop:
+                print(f"  ℹ️ 선언되지 않은 인덱스 {name} (--drop 으로 삭제)")
+                result['skipped'] += 1
+                continue
+            run('dropped', f"삭제 {name}", lambda name=name: collection.drop_index(name))
+    
+    print(f"🗂️ 인덱스 동기화 완료: 생성 {result['created']}, 삭제 {result['dropped']}, "
+          f"실패 {result['failed']}, 건너뜀 {result['skipped']}")
+    return result
+
+
+def check_indexes(db=None):
+    """
+    부팅 시 인덱스 점검 (읽기 전용) - 누락/불일치가 있으면 경고만 출력
+    
+    Returns:
+        diff_indexes() 결과 (실패 시 None)
+    """
+    try:
+        report = diff_indexes(db)
+    except Exception as e:
+        print(f"⚠️ MongoDB 인덱스 점검 실패: {str(e)}")
+        return None
+    
+    missing = sum(len(diff['missing']) + len(diff['changed']) + len(diff['retired']) for diff in report.values())
+    if missing:
+        print(f"⚠️ MongoDB 인덱스 {missing}개 누락/불일치 "
+              f"({', '.join(name for name, diff in report.items() if diff['missing'] or diff['changed'] or diff['retired'])}) "
+              f"- 'flask db-indexes sync' 실행 필요")
+    else:
+        print("✅ MongoDB 인덱스 점검 완료 (선언과 일치)")
+    return report
+
+
+def check_indexes_in_background():
+    """워커 부팅을 막지 않도록 백그라운드 스레드에서 점검"""
+    thread = threading.Thread(target=check_indexes, daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------- Flask CLI ----------
+
+db_indexes_cli = AppGroup('db-indexes', help='MongoDB 인덱스 점검/동기화')
+
+
+@db_indexes_cli.command('check')
+def check_command():
+    """선언과 실제 인덱스 비교 (읽기 전용)"""
+    report = check_indexes()
+    if report is None:
+        raise SystemExit(1)
+    for collection_name, diff in report.items():
+        print(f"📂 {collection_name}")
+        for index in diff['missing']:
+            print(f"  ➕ 누락 {index}")
+        for index, name in diff['changed']:
+            print(f"  ⚠️ 옵션 불일치 {name} → {index}")
+        for name in diff['retired']:
+            print(f"  ➖ 대체됨 (sync 시 삭제) {name}")
+        for name in diff['extra']:
+            print(f"  ℹ️ 선언되지 않음 {name}")
+    if any(diff['missing'] or diff['changed'] or diff['retired'] for diff in report.values()):
+        raise SystemExit(1)
+
+
+@db_indexes_cli.command('sync')
+@click.option('--drop', is_flag=True, help='선언되지 않은 인덱스 삭제, 옵션이 다른 인덱스 재생성')
+@click.option('--dry-run', is_flag=True, help='적용할 작업만 출력')
+def sync_command(drop, dry_run):
+    """선언된 인덱스 적용 (누락 생성)"""
+    result = sync_indexes(drop=drop, dry_run=dry_run)
+    if result['failed']:
+        raise SystemExit(1)
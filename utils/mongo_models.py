@@ -3,151 +3,745 @@ MongoDB 모델 헬퍼 모듈
 SQLAlchemy와 유사한 인터페이스로 MongoDB를 사용할 수 있게 해주는 래퍼
 """
 import os
+import base64
+import operator
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from bson import ObjectId
-from pymongo import MongoClient, ASCENDING, DESCENDING
+import bson
+from bson import ObjectId, json_util
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, InsertOne, UpdateOne, DeleteOne
+from pymongo.errors import DuplicateKeyError, BulkWriteError
 from dotenv import load_dotenv
 from werkzeug.security import generate_password_hash, check_password_hash
+from utils.mongo_client import get_database
+from utils.mongo_indexes import Index
 import json
 
 load_dotenv()
 
-# MongoDB 연결 설정 (fork-safe)
-_mongo_client = None
-_mongo_db = None
-_connection_pid = None  # 연결이 생성된 프로세스 ID 추적
 
 def get_mongo_db():
-    """MongoDB 데이터베이스 연결 반환 (fork-safe)"""
-    global _mongo_client, _mongo_db, _connection_pid
-    
+    """MongoDB 데이터베이스 반환 (공유 클라이언트 레지스트리 사용, fork-safe)"""
+    return get_database()
+
+
+def init_collections():
+    """
+    선언된 인덱스 생성 (누락분만, 기존 인덱스는 건드리지 않음)
+    
+    워커 부팅 시에는 호출하지 않는다 - 배포 시 `flask db-indexes sync` 또는
+    마이그레이션 스크립트에서 한 번 실행 (컬렉션은 첫 인덱스 생성/insert 시 자동 생성됨)
+    """
+    from utils.mongo_indexes import sync_indexes
+    sync_indexes()
+
+
+# ==========================================
+# 정수 ID 할당기 (counters 컬렉션 기반)
+# ==========================================
+# find_one_and_update + $inc 로 원자적으로 ID를 발급하므로 여러 워커/스레드가
+# 동시에 저장해도 ID가 충돌하지 않는다.
+# MONGO_ID_BLOCK_SIZE > 1 이면 프로세스별로 ID 블록을 미리 확보해 두어
+# 대부분의 insert가 왕복 1회로 끝난다 (대신 재시작 시 ID에 빈 번호가 생길 수 있음).
+COUNTERS_COLLECTION = 'counters'
+ID_BLOCK_SIZE = max(1, int(os.environ.get('MONGO_ID_BLOCK_SIZE', '1')))
+
+_id_lock = threading.Lock()
+_id_blocks = {}  # {collection_name: [다음 ID, 블록 끝(미포함)]}
+_seeded_counters = set()  # 이 프로세스에서 기존 최대 _id로 초기화한 카운터
+_id_blocks_pid = None  # 블록을 확보한 프로세스 ID (fork 후 블록 공유 방지)
+
+
+def _seed_id_counter(db, collection_name):
+    """카운터를 컬렉션의 현재 최대 정수 _id 이상으로 맞춤 ($max라 동시 호출해도 안전)"""
+    max_doc = db[collection_name].find_one(
+        {'_id': {'$type': 'number'}},
+        projection={'_id': 1},
+        sort=[('_id', DESCENDING)]
+    )
+    max_id = int(max_doc['_id']) if max_doc else 0
+    try:
+        db[COUNTERS_COLLECTION].update_one(
+            {'_id': collection_name}, {'$max': {'seq': max_id}}, upsert=True
+        )
+    except DuplicateKeyError:
+        # 다른 워커가 동시에 카운터 문서를 만든 경우 - 다시 한 번 $max 적용
+        db[COUNTERS_COLLECTION].update_one({'_id': collection_name}, {'$max': {'seq': max_id}})
+
+
+def _reserve_id_range(collection_name, count):
+    """카운터에서 count개의 ID를 원자적으로 확보하고 마지막 ID 반환 (락 없이 호출 - MongoDB 왕복)"""
+    db = get_mongo_db()
+    if collection_name not in _seeded_counters:
+        # 동시에 여러 스레드가 초기화해도 $max라 안전
+        _seed_id_counter(db, collection_name)
+        with _id_lock:
+            _seeded_counters.add(collection_name)
+    counter = db[COUNTERS_COLLECTION].find_one_and_update(
+        {'_id': collection_name},
+        {'$inc': {'seq': count}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return counter['seq']
+
+
+def _take_from_block(collection_name, count):
+    # _id_lock 보유 상태에서 호출 - 확보해 둔 블록에서 최대 count개
+    global _id_blocks_pid
     current_pid = os.getpid()
+    if _id_blocks_pid != current_pid:
+        _id_blocks.clear()
+        _seeded_counters.clear()
+        _id_blocks_pid = current_pid
+    
+    ids = []
+    block = _id_blocks.get(collection_name)
+    while block and block[0] < block[1] and len(ids) < count:
+        ids.append(block[0])
+        block[0] += 1
+    return ids
+
+
+def allocate_ids(collection_name, count=1):
+    """
+    새 정수 _id를 count개 발급 (fork-safe, thread-safe)
+    
+    _id_lock은 메모리의 블록을 고치는 동안만 잡고, 카운터 왕복은 락 밖에서 하므로
+    한 컬렉션의 발급이 다른 컬렉션(같은 컬렉션의 다른 스레드) insert를 기다리게 하지 않는다.
+    
+    Args:
+        collection_name: 대상 컬렉션명
+        count: 발급할 ID 개수
+    
+    Returns:
+        오름차순 정수 ID 목록
+    """
+    with _id_lock:
+        ids = _take_from_block(collection_name, count)
+    
+    remaining = count - len(ids)
+    if remaining > 0:
+        reserve = max(remaining, ID_BLOCK_SIZE)
+        last_id = _reserve_id_range(collection_name, reserve)
+        first_id = last_id - reserve + 1
+        ids.extend(range(first_id, first_id + remaining))
+        if first_id + remaining <= last_id:
+            with _id_lock:
+                block = _id_blocks.get(collection_name)
+                # 그 사이 다른 스레드가 새 블록을 넣었으면 그 블록을 계속 사용 (남은 번호는 빈 번호가 됨)
+                if not block or block[0] >= block[1]:
+                    _id_blocks[collection_name] = [first_id + remaining, last_id + 1]
+    
+    return ids
+
+
+def resync_id_counter(collection_name):
+    """
+    카운터를 컬렉션의 실제 최대 _id에 다시 맞춤
+    
+    명시적 _id로 문서를 넣은 경우(마이그레이션 등) 호출한다.
+    """
+    with _id_lock:
+        _id_blocks.pop(collection_name, None)
+    _seed_id_counter(get_mongo_db(), collection_name)
+    with _id_lock:
+        _seeded_counters.add(collection_name)
+
+
+def sync_id_counters():
+    """모든 모델 컬렉션의 ID 카운터 재동기화"""
+    for model in MongoModel.__subclasses__():
+        if model.collection_name:
+            resync_id_counter(model.collection_name)
+    print("🔢 ID 카운터 동기화 완료")
+
+
+# ---------- 키셋(커서) 페이지네이션 ----------
+
+def encode_cursor(sort, doc):
+    """
+    정렬 키 값으로 불투명(opaque) 커서 문자열 생성
+    
+    Args:
+        sort: [(필드, 방향), ...] 정렬 지정 (마지막은 _id)
+        doc: 페이지의 마지막 문서
+    
+    Returns:
+        URL에 그대로 넣을 수 있는 base64 문자열
+    """
+    payload = {'k': [field for field, _ in sort], 'v': [doc.get(field) for field, _ in sort]}
+    raw = json_util.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, sort):
+    """
+    커서 문자열을 정렬 키 값 목록으로 복원
     
-    # fork 이후 새 프로세스에서 호출된 경우 연결 재생성
-    if _connection_pid is not None and _connection_pid != current_pid:
-        print(f"MongoDB 모델 헬퍼: Fork 감지 (기존 PID: {_connection_pid}, 현재 PID: {current_pid}), 연결 재생성")
-        _mongo_client = None
-        _mongo_db = None
-    
-    if _mongo_db is not None:
-        return _mongo_db
-    
-    mongo_uri = os.environ.get('MONGO_URI')
-    if not mongo_uri:
-        raise Exception("MONGO_URI 환경 변수가 설정되지 않았습니다!")
-    
+    Raises:
+        ValueError: 손상되었거나 다른 정렬에서 만든 커서
+    """
     try:
-        _mongo_client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=30000,
-            connectTimeoutMS=20000,
-            socketTimeoutMS=20000,
-            retryWrites=True,
-            retryReads=True,
-            w='majority',
-            readPreference='primaryPreferred'
-        )
-        # 연결 테스트
-        _mongo_client.server_info()
-        _mongo_db = _mongo_client['STG-DB']
-        _connection_pid = current_pid  # 연결 생성 시 PID 저장
-        print(f"MongoDB 모델 헬퍼: 데이터베이스 '{_mongo_db.name}' 연결 성공 (PID: {current_pid})")
-        return _mongo_db
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json_util.loads(raw.decode('utf-8'))
+    except Exception:
+        raise ValueError('잘못된 커서입니다.')
+    if not isinstance(payload, dict) or payload.get('k') != [field for field, _ in sort]:
+        raise ValueError('정렬 조건이 다른 커서입니다.')
+    values = payload.get('v')
+    # 값은 필터에 그대로 들어가므로 연산자 문서({'$ne': ...})나 배열은 거부
+    if not isinstance(values, list) or len(values) != len(sort) or any(isinstance(v, (dict, list)) for v in values):
+        raise ValueError('잘못된 커서입니다.')
+    return values
+
+
+def keyset_filter(sort, values, backward=False):
+    """
+    마지막 정렬 키 값 이후(backward면 이전) 문서를 찾는 필터 생성
+    
+    (a, b, _id) 정렬이면 a<v0 or (a=v0 and b<v1) or (a=v0 and b=v1 and _id<v2) 형태로
+    복합 인덱스를 그대로 타고, null은 MongoDB 정렬 순서(가장 작은 값)대로 처리한다.
+    """
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        prefix = {f: v for (f, _), v in zip(sort[:i], values[:i])}
+        value = values[i]
+        ascending = (direction == ASCENDING) != backward
+        if value is None:
+            # null 다음에는 null이 아닌 값이 온다 (오름차순일 때만)
+            if ascending:
+                clauses.append({**prefix, field: {'$ne': None}})
+            continue
+        clauses.append({**prefix, field: {'$gt' if ascending else '$lt': value}})
+        if not ascending:
+            # 내림차순에서는 null/누락 값이 가장 뒤에 온다
+            clauses.append({**prefix, field: None})
+    return {'$or': clauses} if clauses else {'_id': {'$in': []}}
+
+
+def with_id_tiebreaker(sort):
+    """정렬 키가 유일하도록 _id를 마지막 정렬 키로 추가"""
+    sort = list(sort)
+    if not any(field == '_id' for field, _ in sort):
+        sort.append(('_id', sort[-1][1] if sort else ASCENDING))
+    return sort
+
+
+# ==========================================
+# 모델 조회 캐시 (read-through, 컬렉션 버전 검증)
+# ==========================================
+# QuerySet.cached()로 명시한 조회만 프로세스 메모리에 보관한다.
+# 항목마다 조회 시점의 컬렉션 버전을 함께 저장하고, 읽을 때 현재 버전과 다르면 다시 조회한다.
+# 버전은 공유 캐시(extensions.cache - Redis 또는 파일 캐시)에 태그 세대('collection:<이름>')로 기록하며
+# save/delete/bulk_* 가 저장 후 갱신하므로 모든 워커(다른 인스턴스 포함)가 다음 조회부터 바로 새 데이터를 본다.
+# 버전 확인은 요청당 한 번 공유 캐시에서 읽으며 (utils.shared_cache.tag_versions), DB 왕복은 없다.
+# 앱 컨텍스트 밖(독립 스크립트 등)이라 공유 캐시를 쓸 수 없으면 캐시를 건너뛰고 항상 DB를 조회한다.
+MODEL_CACHE_MAX_ENTRIES = max(1, int(os.environ.get('MODEL_CACHE_MAX_ENTRIES', '256')))
+
+_query_cache = OrderedDict()  # {조회 키: (버전 튜플, BSON 인코딩된 문서 목록)}
+_query_cache_lock = threading.Lock()
+_query_cache_stats = {'hits': 0, 'misses': 0, 'bypass': 0}
+
+
+def collection_tag(collection_name):
+    """컬렉션 버전 태그 (페이지 캐시 태그와 같은 세대 방식)"""
+    return f"collection:{collection_name}"
+
+
+def bump_collection_version(collection_name):
+    """
+    컬렉션 버전 갱신 - 이 컬렉션을 읽은 모든 워커의 캐시 항목이 무효화됨
+    
+    모델 메서드를 거치지 않고 컬렉션에 직접 쓴 경우에도 호출해야 한다.
+    앱 컨텍스트 밖에서는 공유 캐시에 기록할 수 없으므로, 스크립트에서 직접 쓴 경우 flask shell 등 앱 컨텍스트 안에서 호출한다.
+    """
+    from utils.shared_cache import invalidate_tags  # 순환 임포트 방지
+    try:
+        invalidate_tags(collection_tag(collection_name))
     except Exception as e:
-        print(f"MongoDB 연결 오류: {str(e)}")
-        raise
+        print(f"⚠️ 모델 캐시 버전 갱신 실패 ({collection_name}): {str(e)}")
 
 
-def init_collections():
-    """컬렉션 초기화 및 인덱스 생성"""
-    db = get_mongo_db()
+def get_collection_versions(collection_names):
+    """현재 컬렉션 버전 튜플 (공유 캐시를 쓸 수 없으면 None)"""
+    from utils.shared_cache import tag_versions  # 순환 임포트 방지
+    tags = [collection_tag(name) for name in collection_names]
+    try:
+        versions = tag_versions(tags)
+    except Exception:
+        return None
+    return tuple(versions[tag] for tag in tags)
+
+
+def get_collection_version(collection_name):
+    """현재 컬렉션 버전 (공유 캐시를 쓸 수 없으면 None)"""
+    versions = get_collection_versions([collection_name])
+    return versions[0] if versions else None
+
+
+def cached_query(key, collection_names, loader):
+    """
+    read-through 조회 - 컬렉션 버전이 그대로면 캐시된 문서, 아니면 loader() 결과를 저장 후 반환
+    
+    문서는 BSON으로 인코딩해 보관하고 매번 새로 디코딩하므로,
+    호출한 쪽이 반환된 문서(중첩 리스트/딕셔너리 포함)를 수정해도 캐시에 영향이 없다.
+    
+    Args:
+        key: 조회 키 (해시 가능 값)
+        collection_names: 결과가 의존하는 컬렉션 이름 목록
+        loader: 문서 목록을 반환하는 함수 (캐시 미스 시 호출)
+    
+    Returns:
+        문서 목록
+    """
+    versions = get_collection_versions(collection_names)
+    if versions is None:
+        with _query_cache_lock:
+            _query_cache_stats['bypass'] += 1
+        return list(loader())
+    
+    with _query_cache_lock:
+        entry = _query_cache.get(key)
+        if entry is not None and entry[0] == versions:
+            _query_cache.move_to_end(key)
+            _query_cache_stats['hits'] += 1
+            payload = entry[1]
+        else:
+            _query_cache_stats['misses'] += 1
+            payload = None
+    
+    if payload is not None:
+        return bson.decode(payload)['d']
+    
+    # 버전은 조회 전에 읽어 두었으므로, 조회 도중 쓰기가 끝나면 다음 조회에서 버전 불일치로 다시 읽는다
+    docs = list(loader())
+    payload = bson.encode({'d': docs})
+    with _query_cache_lock:
+        _query_cache[key] = (versions, payload)
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > MODEL_CACHE_MAX_ENTRIES:
+            _query_cache.popitem(last=False)
+    return docs
+
+
+def clear_model_cache():
+    """이 프로세스의 모델 조회 캐시 비우기 (다른 워커에는 bump_collection_version 사용)"""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+def get_model_cache_stats():
+    """모델 조회 캐시 적중/미스 통계 (현재 프로세스)"""
+    with _query_cache_lock:
+        stats = dict(_query_cache_stats)
+        stats['entries'] = len(_query_cache)
+    total = stats['hits'] + stats['misses']
+    stats['hit_rate'] = round(stats['hits'] / total * 100, 1) if total else 0.0
+    stats['pid'] = os.getpid()
+    return stats
+
+
+class QuerySet:
+    """
+    MongoModel용 지연(lazy) 쿼리셋
+    
+    filter/order_by/limit/only 등을 체이닝해도 서버에 요청하지 않고,
+    반복·슬라이싱·count 시점에 limit/skip/projection/count를 서버로 내려보낸다.
+    
+    사용 예:
+        GalleryGroup.query_ordered().limit(6)
+        Inquiry.query_set(is_spam=True).count()
+        Booking.query_set().order_by('-created_at').only('name', 'status').iterator()
+        Service.query_set().order_by('_id').prefetch('options').cached().all()
+    """
+    
+    def __init__(self, model, filter_dict=None):
+        self.model = model
+        self._filter = dict(filter_dict or {})
+        self._sort = []
+        self._skip = 0
+        self._limit = None
+        self._fields = None
+        self._prefetch = []
+        self._cached = False
+        self._result_cache = None
+    
+    def _clone(self):
+        qs = QuerySet(self.model, self._filter)
+        qs._sort = list(self._sort)
+        qs._skip = self._skip
+        qs._limit = self._limit
+        qs._fields = list(self._fields) if self._fields is not None else None
+        qs._prefetch = list(self._prefetch)
+        qs._cached = self._cached
+        return qs
+    
+    # ---------- 체이닝 메서드 ----------
+    
+    def filter(self, filter_dict=None, **kwargs):
+        """필터 조건 추가 (기존 조건과 AND 결합)"""
+        conditions = dict(filter_dict or {})
+        conditions.update(kwargs)
+        qs = self._clone()
+        if not qs._filter:
+            qs._filter = conditions
+        elif conditions:
+            qs._filter = {'$and': [qs._filter, conditions]}
+        return qs
+    
+    def order_by(self, *keys):
+        """정렬 지정 ('field', '-field' 또는 (field, 방향) 튜플)"""
+        qs = self._clone()
+        qs._sort = []
+        for key in keys:
+            if isinstance(key, tuple):
+                qs._sort.append(key)
+            elif key.startswith('-'):
+                qs._sort.append((key[1:], DESCENDING))
+            else:
+                qs._sort.append((key, ASCENDING))
+        return qs
+    
+    def skip(self, count):
+        qs = self._clone()
+        qs._skip = max(0, int(count))
+        return qs
+    
+    def limit(self, count):
+        qs = self._clone()
+        qs._limit = int(count) if count else None
+        return qs
+    
+    def only(self, *fields):
+        """지정한 필드만 조회 (projection). 반환 객체는 해당 필드만 저장 가능"""
+        qs = self._clone()
+        qs._fields = list(fields)
+        return qs
+    
+    def prefetch(self, *relations):
+        """관계 데이터 일괄 로드 (MongoModel.prefetch_related 참고)"""
+        qs = self._clone()
+        qs._prefetch.extend(relations)
+        return qs
+    
+    def cached(self):
+        """
+        모델 조회 캐시 사용 (cached_query 참고)
+        
+        자주 읽고 드물게 바뀌는 컬렉션(설정, 서비스 등)에만 사용한다.
+        prefetch 관계 조회도 대상 컬렉션 버전으로 검증해 함께 캐시한다.
+        """
+        qs = self._clone()
+        qs._cached = True
+        return qs
+    
+    # ---------- 실행 메서드 ----------
+    
+    def _cursor(self):
+        projection = None
+        if self._fields is not None:
+            projection = {field: 1 for field in self._fields}
+        cursor = self.model.get_collection().find(self._filter, projection)
+        if self._sort:
+            cursor = cursor.sort(self._sort)
+        if self._skip:
+            cursor = cursor.skip(self._skip)
+        if self._limit:
+            cursor = cursor.limit(self._limit)
+        return cursor
+    
+    def _hydrate(self, doc):
+        obj = self.model.from_doc(doc)
+        if self._fields is not None:
+            obj._loaded_fields = set(self._fields)
+        return obj
     
-    # users 컬렉션
-    if 'users' not in db.list_collection_names():
-        db.create_collection('users')
-    db.users.create_index('username', unique=True)
-    
-    # services 컬렉션
-    if 'services' not in db.list_collection_names():
-        db.create_collection('services')
-    db.services.create_index('category')
-    
-    # service_options 컬렉션
-    if 'service_options' not in db.list_collection_names():
-        db.create_collection('service_options')
-    db.service_options.create_index('service_id')
-    
-    # gallery_groups 컬렉션
-    if 'gallery_groups' not in db.list_collection_names():
-        db.create_collection('gallery_groups')
-    db.gallery_groups.create_index([('is_pinned', DESCENDING), ('display_order', DESCENDING), ('created_at', DESCENDING)])
-    
-    # galleries 컬렉션
-    if 'galleries' not in db.list_collection_names():
-        db.create_collection('galleries')
-    db.galleries.create_index('group_id')
-    
-    # bookings 컬렉션
-    if 'bookings' not in db.list_collection_names():
-        db.create_collection('bookings')
-    db.bookings.create_index([('created_at', DESCENDING)])
-    
-    # inquiries 컬렉션
-    if 'inquiries' not in db.list_collection_names():
-        db.create_collection('inquiries')
-    db.inquiries.create_index([('created_at', DESCENDING)])
-    
-    # collage_texts 컬렉션
-    if 'collage_texts' not in db.list_collection_names():
-        db.create_collection('collage_texts')
-    db.collage_texts.create_index('order')
-    
-    # site_settings 컬렉션
-    if 'site_settings' not in db.list_collection_names():
-        db.create_collection('site_settings')
-    
-    # terms_of_service 컬렉션
-    if 'terms_of_service' not in db.list_collection_names():
-        db.create_collection('terms_of_service')
-    
-    # privacy_policy 컬렉션
-    if 'privacy_policy' not in db.list_collection_names():
-        db.create_collection('privacy_policy')
-    
-    # company_info 컬렉션
-    if 'company_info' not in db.list_collection_names():
-        db.create_collection('company_info')
-    
-    # about_content 컬렉션
-    if 'about_content' not in db.list_collection_names():
-        db.create_collection('about_content')
-    
-    # admin_notification_emails 컬렉션
-    if 'admin_notification_emails' not in db.list_collection_names():
-        db.create_collection('admin_notification_emails')
-    db.admin_notification_emails.create_index('email', unique=True)
-    db.admin_notification_emails.create_index('is_active')
-    
-    # package_photos 컬렉션
-    if 'package_photos' not in db.list_collection_names():
-        db.create_collection('package_photos')
-    db.package_photos.create_index('service_option_id')
-    db.package_photos.create_index([('service_option_id', ASCENDING), ('category', ASCENDING)])
-    db.package_photos.create_index([('service_option_id', ASCENDING), ('display_order', ASCENDING)])
-    
-    print("MongoDB 컬렉션 및 인덱스 초기화 완료")
-
-
-class MongoModel:
+    def _cache_key(self):
+        return (
+            self.model.collection_name,
+            json_util.dumps(self._filter),
+            tuple(self._sort),
+            self._skip,
+            self._limit,
+            tuple(self._fields) if self._fields is not None else None,
+        )
+    
+    def _fetch_docs(self):
+        if self._cached:
+            return cached_query(self._cache_key(), [self.model.collection_name], self._cursor)
+        return self._cursor()
+    
+    def _fetch_all(self):
+        if self._result_cache is None:
+            objs = [self._hydrate(doc) for doc in self._fetch_docs()]
+            self._result_cache = self.model.prefetch_related(objs, self._prefetch, cached=self._cached)
+        return self._result_cache
+    
+    def all(self):
+        """결과 전체를 리스트로 반환"""
+        return list(self._fetch_all())
+    
+    def iterator(self, chunk_size=100):
+        """결과를 캐싱하지 않고 순회 (prefetch는 chunk 단위로 수행)"""
+        chunk = []
+        for doc in self._cursor().batch_size(chunk_size):
+            chunk.append(self._hydrate(doc))
+            if len(chunk) >= chunk_size:
+                yield from self.model.prefetch_related(chunk, self._prefetch)
+                chunk = []
+        if chunk:
+            yield from self.model.prefetch_related(chunk, self._prefetch)
+    
+    def first(self):
+        """첫 번째 결과 또는 None"""
+        if self._result_cache is not None:
+            return self._result_cache[0] if self._result_cache else None
+        results = self.limit(1).all()
+        return results[0] if results else None
+    
+    def count(self):
+        """서버 측 count (skip/limit 반영)"""
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        kwargs = {}
+        if self._skip:
+            kwargs['skip'] = self._skip
+        if self._limit:
+            kwargs['limit'] = self._limit
+        return self.model.get_collection().count_documents(self._filter, **kwargs)
+    
+    def exists(self):
+        """조건에 맞는 문서 존재 여부"""
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        return self.model.get_collection().find_one(self._filter, {'_id': 1}) is not None
+    
+    def __iter__(self):
+        return iter(self._fetch_all())
+    
+    def __len__(self):
+        return len(self._fetch_all())
+    
+    def __bool__(self):
+        return bool(self._fetch_all())
+    
+    def cursor_values(self, cursor):
+        """
+        커서를 이 쿼리셋 정렬의 키 값 목록으로 복원 (조회 전에 요청 파라미터를 검증할 때도 사용)
+        
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        return decode_cursor(cursor, with_id_tiebreaker(self._sort))
+    
+    def keyset_page(self, per_page, cursor=None):
+        """
+        키셋(커서) 페이지네이션 - skip 없이 이전 페이지의 마지막 정렬 키 이후만 조회
+        
+        Args:
+            per_page: 페이지당 개수
+            cursor: 이전 호출이 돌려준 커서 (None이면 첫 페이지)
+        
+        Returns:
+            (객체 목록, 다음 페이지 커서 또는 None)
+        
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        sort = with_id_tiebreaker(self._sort)
+        qs = self.filter(keyset_filter(sort, self.cursor_values(cursor))) if cursor else self._clone()
+        qs._sort = sort
+        qs._skip = 0
+        qs._limit = per_page + 1
+        if qs._fields is not None:
+            qs._fields = list(dict.fromkeys(qs._fields + [field for field, _ in sort]))
+        
+        docs = list(qs._cursor())
+        next_cursor = encode_cursor(sort, docs[per_page - 1]) if len(docs) > per_page else None
+        objs = [self._hydrate(doc) for doc in docs[:per_page]]
+        return self.model.prefetch_related(objs, self._prefetch, cached=self._cached), next_cursor
+    
+    def __getitem__(self, index):
+        if self._result_cache is not None:
+            return self._result_cache[index]
+        if isinstance(index, slice):
+            if index.step is not None or (index.start or 0) < 0 or (index.stop is not None and index.stop < 0):
+                return self.all()[index]
+            start = index.start or 0
+            qs = self.skip(self._skip + start)
+            if index.stop is not None:
+                stop = index.stop - start
+                if self._limit:
+                    stop = min(stop, self._limit - start)
+                if stop <= 0:
+                    return []
+                qs = qs.limit(stop)
+            elif self._limit:
+                qs = qs.limit(self._limit - start) if self._limit > start else None
+                if qs is None:
+                    return []
+            return qs.all()
+        if index < 0:
+            return self.all()[index]
+        results = self[index:index + 1]
+        if not results:
+            raise IndexError('QuerySet index out of range')
+        return results[0]
+    
+    def __repr__(self):
+        return f"<QuerySet {self.model.__name__} filter={self._filter} sort={self._sort} skip={self._skip} limit={self._limit}>"
+
+
+def _normalize_ref_id(value):
+    """참조 ID 정규화 (숫자 문자열은 int로 변환, get_by_id와 동일 규칙)"""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+def _ref_key(value):
+    """관계 매칭용 키 - 숫자 문자열은 int, ObjectId는 문자열로 맞춰 저장 형식이 달라도 같은 키가 되게 함"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    return _normalize_ref_id(value)
+
+
+def _ref_variants(key):
+    """_ref_key 결과가 문서에 저장되어 있을 수 있는 형식 ($in 조회용)"""
+    variants = [key]
+    if isinstance(key, int) and not isinstance(key, bool):
+        variants.append(str(key))
+    elif isinstance(key, str) and ObjectId.is_valid(key):
+        variants.append(ObjectId(key))
+    return variants
+
+
+class Field:
+    """
+    모델 필드 선언
+    
+    Args:
+        default: 기본값 (호출 가능한 객체면 처음 접근할 때 호출해서 기본값 생성)
+        convert: 문서/인자에서 읽은 값 변환 함수 (None 포함 모든 값에 적용)
+    """
+    __slots__ = ('default', 'convert')
+    
+    def __init__(self, default=None, convert=None):
+        self.default = default
+        self.convert = convert
+    
+    def make_default(self):
+        return self.default() if callable(self.default) else self.default
+
+
+class ModelMeta(type):
+    """
+    모델 메타클래스 - fields 선언으로 __slots__ 클래스를 생성
+    
+    fields에 선언한 필드와 relations의 캐시 속성만 슬롯으로 만들어
+    인스턴스마다 __dict__를 두지 않는다. 상위 클래스의 필드 선언은 상속된다.
+    """
+    
+    def __new__(mcs, name, bases, namespace):
+        declared = {
+            key: value if isinstance(value, Field) else Field(value)
+            for key, value in namespace.get('fields', {}).items()
+        }
+        
+        inherited_slots = set()
+        for base in bases:
+            for klass in base.__mro__:
+                inherited_slots.update(klass.__dict__.get('__slots__', ()))
+        
+        if '__slots__' not in namespace:
+            caches = [spec['cache'] for spec in namespace.get('relations', {}).values()]
+            namespace['__slots__'] = tuple(
+                slot for slot in dict.fromkeys(list(declared) + caches)
+                if slot not in inherited_slots
+            )
+        
+        cls = super().__new__(mcs, name, bases, namespace)
+        
+        # 상속된 스키마 + 이 클래스의 선언
+        schema = {}
+        for base in reversed(cls.__mro__[1:]):
+            schema.update(base.__dict__.get('_schema', {}))
+        schema.update(declared)
+        cls._schema = schema
+        cls._field_names = tuple(schema)
+        cls._field_getter = operator.attrgetter(*schema) if len(schema) > 1 else None
+        cls._converters = {key: f.convert for key, f in schema.items() if f.convert}
+        
+        # 값이 아직 없는 슬롯의 지연 기본값 (관계 캐시 등은 None)
+        lazy_defaults = {'_id': Field(), '_extra': Field(), '_loaded_fields': Field()}
+        for spec in cls.relations.values():
+            lazy_defaults[spec['cache']] = Field()
+        lazy_defaults.update(schema)
+        cls._lazy_defaults = lazy_defaults
+        return cls
+
+
+class MongoModel(metaclass=ModelMeta):
     """MongoDB 모델 기본 클래스"""
+    __slots__ = ('_id', '_extra', '_loaded_fields')
     collection_name = None
     
+    # 필드 선언 {필드명: 기본값 또는 Field(기본값, convert=변환 함수)}
+    # 선언한 필드는 __slots__로 생성되고, 문서에 없는 필드는 처음 접근할 때 기본값으로 채워진다.
+    # 선언하지 않은 문서 키는 _extra에 보관했다가 저장 시 그대로 다시 기록한다.
+    fields = {}
+    
+    # 관계 정의 (prefetch용)
+    # {관계명: {'cache': 캐시 속성, 'model': 대상 모델 클래스명,
+    #           'local': 로컬 키 속성, 'foreign': 대상 컬렉션 필드, 'many': 다건 여부}}
+    relations = {}
+    
+    # 인덱스 선언 [Index(...), ...] - `flask db-indexes sync`로 적용 (utils/mongo_indexes.py)
+    indexes = []
+    
     def __init__(self, **kwargs):
-        self._id = kwargs.get('_id') or kwargs.get('id')
-        self.id = self._id
-        for key, value in kwargs.items():
-            if key != '_id':
+        self._load(kwargs)
+        if self._id is None:
+            self._id = kwargs.get('id')
+    
+    def _load(self, doc):
+        """문서 키를 한 번 순회하며 필드 슬롯에 채움 (선언되지 않은 키는 _extra에 보관)"""
+        schema = self._schema
+        converters = self._converters
+        extra = None
+        self._id = doc.get('_id')
+        for key, value in doc.items():
+            if key in schema:
+                if key in converters:
+                    value = converters[key](value)
                 setattr(self, key, value)
+            elif key != '_id' and key != 'id':
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+    
+    def __getattr__(self, name):
+        # 슬롯에 값이 없을 때만 호출됨 - 선언된 기본값을 채워 넣고 반환
+        field = type(self)._lazy_defaults.get(name)
+        if field is not None:
+            value = field.make_default()
+            setattr(self, name, value)
+            return value
+        extra = self._extra
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    @property
+    def id(self):
+        return self._id
+    
+    @id.setter
+    def id(self, value):
+        self._id = value
     
     @classmethod
     def get_collection(cls):
@@ -156,18 +750,75 @@ class MongoModel:
         return db[cls.collection_name]
     
     @classmethod
-    def query_all(cls):
+    def query_set(cls, filter_dict=None, **kwargs):
+        """지연 쿼리셋 반환 (실제 조회는 순회/슬라이싱/count 시점에 수행)"""
+        return QuerySet(cls).filter(filter_dict, **kwargs)
+    
+    @classmethod
+    def query_all(cls, prefetch=None):
         """모든 문서 조회"""
-        collection = cls.get_collection()
-        docs = collection.find()
-        return [cls.from_doc(doc) for doc in docs]
+        return cls.query_set().prefetch(*(prefetch or [])).all()
     
     @classmethod
-    def query_filter(cls, **kwargs):
+    def query_filter(cls, prefetch=None, **kwargs):
         """필터 조건으로 조회"""
-        collection = cls.get_collection()
-        docs = collection.find(kwargs)
-        return [cls.from_doc(doc) for doc in docs]
+        return cls.query_set(**kwargs).prefetch(*(prefetch or [])).all()
+    
+    @classmethod
+    def prefetch_related(cls, objs, relations, cached=False):
+        """
+        관계 데이터를 결과 전체에 대해 한 번에 로드 (N+1 쿼리 방지)
+        
+        관계마다 $in 쿼리 1회로 대상 문서를 가져와 각 객체의 캐시 속성
+        (_options, _images, _service 등)을 채운다.
+        
+        Args:
+            objs: 모델 객체 목록
+            relations: 관계명 목록 (예: ['options'])
+            cached: 관계 조회에 모델 조회 캐시 사용 여부
+        
+        Returns:
+            전달받은 objs (캐시 속성이 채워진 상태)
+        """
+        if not objs or not relations:
+            return objs
+        
+        for name in relations:
+            spec = cls.relations.get(name)
+            if spec is None:
+                raise ValueError(f"{cls.__name__}에 '{name}' 관계가 정의되어 있지 않습니다.")
+            
+            target = globals()[spec['model']]
+            many = spec.get('many', False)
+            
+            # 양쪽 값을 같은 규칙으로 맞춤 (int/숫자 문자열, ObjectId/문자열) - 중복 제거는 dict로
+            keys = {}
+            for obj in objs:
+                key = _ref_key(getattr(obj, spec['local'], None))
+                if key is not None:
+                    keys[key] = None
+            
+            grouped = {}
+            if keys:
+                values = [variant for key in keys for variant in _ref_variants(key)]
+                query = target.query_set({spec['foreign']: {'$in': values}})
+                docs = query.cached()._fetch_docs() if cached else query._cursor()
+                for doc in docs:
+                    item = target.from_doc(doc)
+                    ref = _ref_key(doc.get(spec['foreign']))
+                    if many:
+                        grouped.setdefault(ref, []).append(item)
+                    else:
+                        grouped[ref] = item
+            
+            for obj in objs:
+                key = _ref_key(getattr(obj, spec['local'], None))
+                if many:
+                    setattr(obj, spec['cache'], grouped.get(key, []))
+                else:
+                    setattr(obj, spec['cache'], grouped.get(key))
+        
+        return objs
     
     @classmethod
     def get_by_id(cls, doc_id):
@@ -190,25 +841,35 @@ class MongoModel:
     
     @classmethod
     def from_doc(cls, doc):
-        """MongoDB 문서를 모델 객체로 변환"""
+        """MongoDB 문서를 모델 객체로 변환 (__init__을 거치지 않고 문서를 한 번만 순회)"""
         if doc is None:
             return None
-        obj = cls(**doc)
-        obj._id = doc.get('_id')
-        obj.id = doc.get('_id')
+        obj = cls.__new__(cls)
+        obj._load(doc)
         return obj
     
     def to_doc(self):
         """모델 객체를 MongoDB 문서로 변환"""
         doc = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_') or key == '_id':
-                if key == '_id' and value is not None:
-                    doc['_id'] = value
-                elif key != 'id':
-                    doc[key] = value
+        if self._id is not None:
+            doc['_id'] = self._id
+        if self._extra:
+            doc.update(self._extra)
+        if self._field_getter is not None:
+            doc.update(zip(self._field_names, self._field_getter(self)))
+        else:
+            for key in self._field_names:
+                doc[key] = getattr(self, key)
         return doc
     
+    def _update_fields(self, doc):
+        """update용 필드 ($set 대상) - only()로 일부만 조회한 객체는 조회한 필드만 저장"""
+        loaded_fields = getattr(self, '_loaded_fields', None)
+        return {
+            k: v for k, v in doc.items()
+            if k != '_id' and (loaded_fields is None or k in loaded_fields)
+        }
+    
     def save(self):
         """문서 저장 (insert 또는 update)"""
         collection = self.get_collection()
@@ -216,32 +877,192 @@ class MongoModel:
         
         if self._id is not None:
             # 업데이트 - _id는 제외하고 업데이트 (MongoDB에서 _id 수정 불가)
-            update_doc = {k: v for k, v in doc.items() if k != '_id'}
+            update_doc = self._update_fields(doc)
             result = collection.update_one({'_id': self._id}, {'$set': update_doc}, upsert=True)
             print(f"📝 MongoDB update: matched={result.matched_count}, modified={result.modified_count}, _id={self._id}")
         else:
-            # 새로운 ID 생성 (auto-increment 시뮬레이션)
-            max_doc = collection.find_one(sort=[('_id', DESCENDING)])
-            new_id = (max_doc['_id'] + 1) if max_doc and isinstance(max_doc.get('_id'), int) else 1
-            doc['_id'] = new_id
-            collection.insert_one(doc)
-            self._id = new_id
-            self.id = new_id
+            new_id = self._insert_with_new_id(collection, doc)
             print(f"📝 MongoDB insert: new_id={new_id}")
         
+        bump_collection_version(collection.name)
         return self
     
+    def _insert_with_new_id(self, collection, doc):
+        """카운터에서 새 ID를 받아 insert (카운터가 뒤처져 있으면 재동기화 후 1회 재시도)"""
+        for attempt in range(2):
+            new_id = allocate_ids(collection.name)[0]
+            doc['_id'] = new_id
+            try:
+                collection.insert_one(doc)
+                break
+            except DuplicateKeyError:
+                if attempt:
+                    raise
+                print(f"⚠️ ID 충돌 감지 ({collection.name}, _id={new_id}) - 카운터 재동기화")
+                resync_id_counter(collection.name)
+        self._id = new_id
+        return new_id
+    
+    @classmethod
+    def _bulk_write(cls, operations):
+        """
+        bulk_write(ordered=False) 실행
+        
+        Returns:
+            {작업 인덱스: writeError} 딕셔너리 (실패한 작업만 포함)
+        """
+        if not operations:
+            return {}
+        try:
+            cls.get_collection().bulk_write(operations, ordered=False)
+            return {}
+        except BulkWriteError as e:
+            return {err['index']: err for err in e.details.get('writeErrors', [])}
+        finally:
+            # 일부만 성공했어도 컬렉션이 바뀌었을 수 있으므로 항상 버전 갱신
+            bump_collection_version(cls.collection_name)
+    
+    @classmethod
+    def bulk_save(cls, objs):
+        """
+        여러 객체를 한 번의 bulk_write로 저장 (insert 또는 update)
+        
+        새 객체의 ID는 카운터에서 한 번에 발급한다.
+        카운터가 뒤처져 ID가 충돌한 항목은 재동기화 후 1회 재시도한다.
+        
+        Args:
+            objs: 저장할 모델 객체 목록
+        
+        Returns:
+            항목별 결과 목록 [{'id', 'ok', 'inserted', 'error'}, ...] (objs 순서와 동일)
+        """
+        objs = list(objs)
+        collection_name = cls.collection_name
+        docs = [obj.to_doc() for obj in objs]
+        results = [
+            {'id': obj._id, 'ok': True, 'inserted': obj._id is None, 'error': None}
+            for obj in objs
+        ]
+        
+        # 기존 문서 업데이트 + 새 문서 insert를 한 번에 전송
+        operations, op_items = [], []
+        for i, (obj, doc) in enumerate(zip(objs, docs)):
+            if obj._id is not None:
+                update_doc = obj._update_fields(doc)
+                if update_doc:
+                    operations.append(UpdateOne({'_id': obj._id}, {'$set': update_doc}, upsert=True))
+                    op_items.append(i)
+        
+        pending = [i for i, obj in enumerate(objs) if obj._id is None]
+        for attempt in range(2):
+            if pending:
+                for i, new_id in zip(pending, allocate_ids(collection_name, len(pending))):
+                    docs[i]['_id'] = new_id
+                    operations.append(InsertOne(docs[i]))
+                    op_items.append(i)
+            
+            errors = cls._bulk_write(operations)
+            
+            retry = []
+            for op_index, i in enumerate(op_items):
+                err = errors.get(op_index)
+                if err is None:
+                    continue
+                if results[i]['inserted'] and err.get('code') == 11000 and not attempt:
+                    retry.append(i)
+                else:
+                    results[i]['ok'] = False
+                    results[i]['error'] = err.get('errmsg', str(err))
+            
+            if not retry:
+                break
+            print(f"⚠️ ID 충돌 감지 ({collection_name}, {len(retry)}개) - 카운터 재동기화 후 재시도")
+            resync_id_counter(collection_name)
+            operations, op_items, pending = [], [], retry
+        
+        for i, obj in enumerate(objs):
+            if results[i]['inserted'] and results[i]['ok']:
+                obj._id = docs[i]['_id']
+            results[i]['id'] = obj._id
+        
+        failed = sum(1 for r in results if not r['ok'])
+        print(f"📦 MongoDB bulk_save ({collection_name}): {len(objs) - failed}개 성공, {failed}개 실패")
+        return results
+    
+    @classmethod
+    def bulk_update(cls, objs, fields):
+        """
+        여러 객체의 지정 필드만 한 번의 bulk_write로 업데이트
+        
+        Args:
+            objs: 업데이트할 모델 객체 목록 (_id 필수)
+            fields: $set 할 필드명 목록
+        
+        Returns:
+            항목별 결과 목록 [{'id', 'ok', 'error'}, ...] (objs 순서와 동일)
+        """
+        objs = list(objs)
+        results = [{'id': obj._id, 'ok': True, 'error': None} for obj in objs]
+        
+        operations, op_items = [], []
+        for i, obj in enumerate(objs):
+            if obj._id is None:
+                results[i]['ok'] = False
+                results[i]['error'] = '_id가 없는 객체는 업데이트할 수 없습니다.'
+                continue
+            doc = obj.to_doc()
+            operations.append(UpdateOne(
+                {'_id': obj._id},
+                {'$set': {field: doc.get(field) for field in fields}}
+            ))
+            op_items.append(i)
+        
+        errors = cls._bulk_write(operations)
+        for op_index, err in errors.items():
+            i = op_items[op_index]
+            results[i]['ok'] = False
+            results[i]['error'] = err.get('errmsg', str(err))
+        
+        failed = sum(1 for r in results if not r['ok'])
+        print(f"📦 MongoDB bulk_update ({cls.collection_name}, {list(fields)}): {len(objs) - failed}개 성공, {failed}개 실패")
+        return results
+    
+    @classmethod
+    def bulk_delete(cls, ids):
+        """
+        여러 문서를 한 번의 bulk_write로 삭제
+        
+        Args:
+            ids: 삭제할 문서 ID 목록 (숫자 문자열은 int로 변환)
+        
+        Returns:
+            항목별 결과 목록 [{'id', 'ok', 'error'}, ...] (ids 순서와 동일)
+        """
+        ids = [_normalize_ref_id(doc_id) for doc_id in ids]
+        results = [{'id': doc_id, 'ok': True, 'error': None} for doc_id in ids]
+        
+        errors = cls._bulk_write([DeleteOne({'_id': doc_id}) for doc_id in ids])
+        for i, err in errors.items():
+            results[i]['ok'] = False
+            results[i]['error'] = err.get('errmsg', str(err))
+        
+        failed = len(errors)
+        print(f"📦 MongoDB bulk_delete ({cls.collection_name}): {len(ids) - failed}개 성공, {failed}개 실패")
+        return results
+    
     def delete(self):
         """문서 삭제"""
         collection = self.get_collection()
         if self._id is not None:
             collection.delete_one({'_id': self._id})
+            bump_collection_version(collection.name)
     
     @classmethod
     def delete_by_id(cls, doc_id):
         """ID로 문서 삭제"""
         collection = cls.get_collection()
         collection.delete_one({'_id': int(doc_id) if isinstance(doc_id, str) and doc_id.isdigit() else doc_id})
+        bump_collection_version(collection.name)
     
     @classmethod
     def count(cls, filter_dict=None):
@@ -254,15 +1075,21 @@ class User(MongoModel):
     """사용자 모델"""
     collection_name = 'users'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.username = kwargs.get('username', '')
-        self.email = kwargs.get('email')
-        self.password_hash = kwargs.get('password_hash', '')
-        self.is_admin = kwargs.get('is_admin', False)
-        self.is_active = True
-        self.is_authenticated = True
-        self.is_anonymous = False
+    indexes = [
+        Index('username', unique=True),
+    ]
+    
+    fields = {
+        'username': '',
+        'email': None,
+        'password_hash': '',
+        'is_admin': False,
+    }
+    
+    # Flask-Login 속성 (문서에 저장하지 않음)
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
     
     def set_password(self, password):
         self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
@@ -284,15 +1111,21 @@ class User(MongoModel):
 class Service(MongoModel):
     """서비스 모델"""
     collection_name = 'services'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = kwargs.get('name', '')
-        self.description = kwargs.get('description', '')
-        self.category = kwargs.get('category')
-        self.details = kwargs.get('details')
-        self.packages = kwargs.get('packages')
-        self._options = None
+    relations = {
+        'options': {'cache': '_options', 'model': 'ServiceOption', 'local': '_id', 'foreign': 'service_id', 'many': True},
+    }
+    
+    indexes = [
+        Index('category'),
+    ]
+    
+    fields = {
+        'name': '',
+        'description': '',
+        'category': None,
+        'details': None,
+        'packages': None,
+    }
     
     @property
     def options(self):
@@ -302,33 +1135,37 @@ class Service(MongoModel):
         return self._options
     
     @classmethod
-    def query_all(cls):
-        """모든 서비스 조회"""
-        collection = cls.get_collection()
-        docs = collection.find().sort('_id', ASCENDING)
-        return [cls.from_doc(doc) for doc in docs]
+    def query_all(cls, prefetch=None):
+        """모든 서비스 조회 (모델 조회 캐시 사용)"""
+        return cls.query_set().order_by('_id').prefetch(*(prefetch or [])).cached().all()
 
 
 class ServiceOption(MongoModel):
     """서비스 옵션 모델"""
     collection_name = 'service_options'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.service_id = kwargs.get('service_id')
-        self.name = kwargs.get('name', '')
-        self.description = kwargs.get('description', '')
-        self.detailed_description = kwargs.get('detailed_description', '')
-        self.details = kwargs.get('details')
-        self.packages = kwargs.get('packages')
-        self.booking_method = kwargs.get('booking_method')
-        self.payment_info = kwargs.get('payment_info')
-        self.guide_info = kwargs.get('guide_info')
-        self.refund_policy = kwargs.get('refund_policy')
-        self.refund_policy_text = kwargs.get('refund_policy_text')
-        self.refund_policy_table = kwargs.get('refund_policy_table')
-        self.overtime_charge_table = kwargs.get('overtime_charge_table')
-        self._service = None
+    relations = {
+        'service': {'cache': '_service', 'model': 'Service', 'local': 'service_id', 'foreign': '_id'},
+    }
+    
+    indexes = [
+        Index('service_id'),
+    ]
+    
+    fields = {
+        'service_id': None,
+        'name': '',
+        'description': '',
+        'detailed_description': '',
+        'details': None,
+        'packages': None,
+        'booking_method': None,
+        'payment_info': None,
+        'guide_info': None,
+        'refund_policy': None,
+        'refund_policy_text': None,
+        'refund_policy_table': None,
+        'overtime_charge_table': None,
+    }
     
     @property
     def service(self):
@@ -338,27 +1175,31 @@ class ServiceOption(MongoModel):
         return self._service
     
     @classmethod
-    def query_all(cls):
-        """모든 서비스 옵션 조회"""
-        collection = cls.get_collection()
-        docs = collection.find().sort('_id', ASCENDING)
-        return [cls.from_doc(doc) for doc in docs]
+    def query_all(cls, prefetch=None):
+        """모든 서비스 옵션 조회 (모델 조회 캐시 사용)"""
+        return cls.query_set().order_by('_id').prefetch(*(prefetch or [])).cached().all()
 
 
 class GalleryGroup(MongoModel):
     """갤러리 그룹 모델"""
     collection_name = 'gallery_groups'
+    relations = {
+        'images': {'cache': '_images', 'model': 'Gallery', 'local': '_id', 'foreign': 'group_id', 'many': True},
+    }
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.title = kwargs.get('title', '')
+    indexes = [
+        # 정렬 키 끝에 _id까지 포함 - 키셋(커서) 페이지네이션이 인덱스 순서 그대로 이어서 읽음
+        Index([('is_pinned', DESCENDING), ('display_order', DESCENDING), ('created_at', DESCENDING), ('_id', DESCENDING)]),
+    ]
+    
+    fields = {
+        'title': '',
         # display_order가 None인 경우도 처리
-        display_order_val = kwargs.get('display_order')
-        self.display_order = int(display_order_val) if display_order_val is not None else 0
-        self.is_pinned = kwargs.get('is_pinned', False)
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
-        self._images = None
+        'display_order': Field(0, convert=lambda value: int(value) if value is not None else 0),
+        'is_pinned': False,
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     def to_doc(self):
         """MongoDB 문서로 변환 (display_order 필드 명시적 포함)"""
@@ -382,7 +1223,7 @@ class GalleryGroup(MongoModel):
         
         if self._id is not None:
             # 업데이트 - _id는 제외하고 업데이트
-            update_doc = {k: v for k, v in doc.items() if k != '_id'}
+            update_doc = self._update_fields(doc)
             result = collection.update_one({'_id': self._id}, {'$set': update_doc}, upsert=True)
             print(f"📝 GalleryGroup update: matched={result.matched_count}, modified={result.modified_count}, _id={self._id}, display_order={self.display_order}")
             
@@ -390,15 +1231,10 @@ class GalleryGroup(MongoModel):
             updated_doc = collection.find_one({'_id': self._id})
             print(f"✅ GalleryGroup 저장 후 확인: display_order={updated_doc.get('display_order') if updated_doc else 'NOT FOUND'}")
         else:
-            # 새로운 ID 생성
-            max_doc = collection.find_one(sort=[('_id', DESCENDING)])
-            new_id = (max_doc['_id'] + 1) if max_doc and isinstance(max_doc.get('_id'), int) else 1
-            doc['_id'] = new_id
-            collection.insert_one(doc)
-            self._id = new_id
-            self.id = new_id
+            new_id = self._insert_with_new_id(collection, doc)
             print(f"📝 GalleryGroup insert: new_id={new_id}, display_order={self.display_order}")
         
+        bump_collection_version(collection.name)
         return self
     
     @property
@@ -409,7 +1245,16 @@ class GalleryGroup(MongoModel):
         return self._images
     
     @classmethod
-    def query_all_ordered(cls):
+    def query_ordered(cls):
+        """상단 고정, 표출 순서, 생성일 순으로 정렬된 지연 쿼리셋"""
+        return cls.query_set().order_by(
+            ('is_pinned', DESCENDING),
+            ('display_order', DESCENDING),
+            ('created_at', DESCENDING)
+        )
+    
+    @classmethod
+    def query_all_ordered(cls, prefetch=None):
         """정렬된 모든 갤러리 그룹 조회"""
         collection = cls.get_collection()
         docs = list(collection.find().sort([
@@ -418,38 +1263,44 @@ class GalleryGroup(MongoModel):
             ('created_at', DESCENDING)
         ]))
         
-        # 디버깅: MongoDB에서 조회된 원본 문서 출력
-        print(f"🗂️ MongoDB에서 조회된 갤러리 그룹 원본 데이터:")
-        for doc in docs:
-            print(f"  - _id={doc.get('_id')}, title={doc.get('title')}, display_order={doc.get('display_order')}")
-        
-        return [cls.from_doc(doc) for doc in docs]
+        return cls.prefetch_related([cls.from_doc(doc) for doc in docs], prefetch)
     
     @classmethod
-    def query_paginated(cls, page=1, per_page=9):
+    def query_paginated(cls, page=1, per_page=9, prefetch=None):
         """페이지네이션된 갤러리 그룹 조회"""
-        collection = cls.get_collection()
         skip = (page - 1) * per_page
-        docs = collection.find().sort([
-            ('is_pinned', DESCENDING),
-            ('display_order', DESCENDING),
-            ('created_at', DESCENDING)
-        ]).skip(skip).limit(per_page)
-        return [cls.from_doc(doc) for doc in docs]
+        return cls.query_ordered().skip(skip).limit(per_page).prefetch(*(prefetch or [])).all()
+    
+    @classmethod
+    def query_keyset(cls, cursor=None, per_page=9, prefetch=None):
+        """
+        커서 기반 갤러리 그룹 조회 ((is_pinned, display_order, created_at, _id) 키셋)
+        
+        Returns:
+            (갤러리 그룹 목록, 다음 페이지 커서 또는 None)
+        """
+        return cls.query_ordered().prefetch(*(prefetch or [])).keyset_page(per_page, cursor)
 
 
 class Gallery(MongoModel):
     """갤러리 이미지 모델"""
     collection_name = 'galleries'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.image_path = kwargs.get('image_path', '')
-        self.caption = kwargs.get('caption')
-        self.order = kwargs.get('order', 0)
-        self.group_id = kwargs.get('group_id')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self._group = None
+    relations = {
+        'group': {'cache': '_group', 'model': 'GalleryGroup', 'local': 'group_id', 'foreign': '_id'},
+    }
+    
+    indexes = [
+        # query_by_group의 필터 + 정렬 (group_id 단일 인덱스 대체)
+        Index([('group_id', ASCENDING), ('order', ASCENDING), ('_id', ASCENDING)]),
+    ]
+    
+    fields = {
+        'image_path': '',
+        'caption': None,
+        'order': 0,
+        'group_id': None,
+        'created_at': datetime.utcnow,
+    }
     
     @property
     def group(self):
@@ -469,34 +1320,41 @@ class Gallery(MongoModel):
 class Booking(MongoModel):
     """예약 모델"""
     collection_name = 'bookings'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = kwargs.get('name', '')
-        self.phone = kwargs.get('phone', '')  # 휴대폰 번호 추가
-        self.email = kwargs.get('email', '')
-        self.service_id = kwargs.get('service_id')
-        self.message = kwargs.get('message', '')
-        self.status = kwargs.get('status', '대기')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self._service = None
+    relations = {
+        'service': {'cache': '_service', 'model': 'Service', 'local': 'service_id', 'foreign': '_id'},
+    }
+    
+    indexes = [
+        Index([('created_at', DESCENDING)]),
+        Index('status'),  # 대시보드 대기 건수
+    ]
+    
+    fields = {
+        'name': '',
+        'phone': '',  # 휴대폰 번호 추가
+        'email': '',
+        'service_id': None,
+        'message': '',
+        'status': '대기',
+        'created_at': datetime.utcnow,
         
         # AI 처리 관련 필드
-        self.is_spam = kwargs.get('is_spam', False)  # 스팸 여부
-        self.spam_reason = kwargs.get('spam_reason', '')  # 스팸 판단 이유
-        self.is_irrelevant = kwargs.get('is_irrelevant', False)  # RAG와 관련 없는 내용 여부
-        self.irrelevant_reason = kwargs.get('irrelevant_reason', '')  # 관련 없는 내용 판단 이유
-        self.detected_language = kwargs.get('detected_language', '')  # 감지된 언어
-        self.sentiment = kwargs.get('sentiment', '')  # 감성
-        self.sentiment_detail = kwargs.get('sentiment_detail', '')  # 감성 상세
-        self.ai_response = kwargs.get('ai_response', '')  # AI가 생성한 응답
-        self.translated_message = kwargs.get('translated_message', '')  # 번역된 원문
-        self.response_sent = kwargs.get('response_sent', False)  # 응답 전송 여부
-        self.response_sent_at = kwargs.get('response_sent_at')  # 응답 발송 시간
-        self.response_email_subject = kwargs.get('response_email_subject', '')  # 발송된 이메일 제목
-        self.admin_notified = kwargs.get('admin_notified', False)  # 관리자 알림 여부
-        self.ai_processed = kwargs.get('ai_processed', False)  # AI 처리 완료 여부
-        self.ai_processed_at = kwargs.get('ai_processed_at')  # AI 처리 시간
+        'is_spam': False,  # 스팸 여부
+        'spam_reason': '',  # 스팸 판단 이유
+        'is_irrelevant': False,  # RAG와 관련 없는 내용 여부
+        'irrelevant_reason': '',  # 관련 없는 내용 판단 이유
+        'detected_language': '',  # 감지된 언어
+        'sentiment': '',  # 감성
+        'sentiment_detail': '',  # 감성 상세
+        'ai_response': '',  # AI가 생성한 응답
+        'translated_message': '',  # 번역된 원문
+        'response_sent': False,  # 응답 전송 여부
+        'response_sent_at': None,  # 응답 발송 시간
+        'response_email_subject': '',  # 발송된 이메일 제목
+        'admin_notified': False,  # 관리자 알림 여부
+        'ai_processed': False,  # AI 처리 완료 여부
+        'ai_processed_at': None,  # AI 처리 시간
+    }
     
     @property
     def service(self):
@@ -532,7 +1390,7 @@ class Booking(MongoModel):
         return parts[0] if parts else ''
     
     @classmethod
-    def query_all_ordered(cls, limit=None):
+    def query_all_ordered(cls, limit=None, prefetch=None):
         """생성일 기준 내림차순 정렬된 예약 조회"""
         collection = cls.get_collection()
         cursor = collection.find().sort('created_at', DESCENDING)
@@ -546,40 +1404,48 @@ class Booking(MongoModel):
                     results.append(booking)
             except Exception as e:
                 print(f"⚠️ 예약 문서 로드 오류 (건너뜀): _id={doc.get('_id')}, error={str(e)}")
-        return results
+        return cls.prefetch_related(results, prefetch)
 
 
 class Inquiry(MongoModel):
     """문의 모델"""
     collection_name = 'inquiries'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = kwargs.get('name', '')
-        self.phone = kwargs.get('phone', '')
-        self.email = kwargs.get('email', '')
-        self.service_id = kwargs.get('service_id')
-        self.message = kwargs.get('message', '')
-        self.status = kwargs.get('status', '대기')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self._service = None
+    relations = {
+        'service': {'cache': '_service', 'model': 'Service', 'local': 'service_id', 'foreign': '_id'},
+    }
+    
+    indexes = [
+        Index([('created_at', DESCENDING)]),
+        Index([('is_spam', ASCENDING), ('created_at', DESCENDING)]),  # query_spam / query_non_spam
+        Index([('status', ASCENDING), ('is_spam', ASCENDING)]),  # 대시보드 대기 건수
+    ]
+    
+    fields = {
+        'name': '',
+        'phone': '',
+        'email': '',
+        'service_id': None,
+        'message': '',
+        'status': '대기',
+        'created_at': datetime.utcnow,
         
         # AI 처리 관련 필드
-        self.is_spam = kwargs.get('is_spam', False)  # 스팸 여부
-        self.spam_reason = kwargs.get('spam_reason', '')  # 스팸 판단 이유
-        self.is_irrelevant = kwargs.get('is_irrelevant', False)  # RAG와 관련 없는 내용 여부
-        self.irrelevant_reason = kwargs.get('irrelevant_reason', '')  # 관련 없는 내용 판단 이유
-        self.detected_language = kwargs.get('detected_language', '')  # 감지된 언어 (ko, en, ja, zh 등)
-        self.sentiment = kwargs.get('sentiment', '')  # 감성 (positive, neutral, negative)
-        self.sentiment_detail = kwargs.get('sentiment_detail', '')  # 감성 상세 (formal, casual, urgent 등)
-        self.ai_response = kwargs.get('ai_response', '')  # AI가 생성한 응답
-        self.translated_message = kwargs.get('translated_message', '')  # 번역된 원문 (한국어로)
-        self.response_sent = kwargs.get('response_sent', False)  # 고객에게 응답 전송 여부
-        self.response_sent_at = kwargs.get('response_sent_at')  # 응답 발송 시간
-        self.response_email_subject = kwargs.get('response_email_subject', '')  # 발송된 이메일 제목
-        self.admin_notified = kwargs.get('admin_notified', False)  # 관리자에게 알림 전송 여부
-        self.ai_processed = kwargs.get('ai_processed', False)  # AI 처리 완료 여부
-        self.ai_processed_at = kwargs.get('ai_processed_at')  # AI 처리 시간
+        'is_spam': False,  # 스팸 여부
+        'spam_reason': '',  # 스팸 판단 이유
+        'is_irrelevant': False,  # RAG와 관련 없는 내용 여부
+        'irrelevant_reason': '',  # 관련 없는 내용 판단 이유
+        'detected_language': '',  # 감지된 언어 (ko, en, ja, zh 등)
+        'sentiment': '',  # 감성 (positive, neutral, negative)
+        'sentiment_detail': '',  # 감성 상세 (formal, casual, urgent 등)
+        'ai_response': '',  # AI가 생성한 응답
+        'translated_message': '',  # 번역된 원문 (한국어로)
+        'response_sent': False,  # 고객에게 응답 전송 여부
+        'response_sent_at': None,  # 응답 발송 시간
+        'response_email_subject': '',  # 발송된 이메일 제목
+        'admin_notified': False,  # 관리자에게 알림 전송 여부
+        'ai_processed': False,  # AI 처리 완료 여부
+        'ai_processed_at': None,  # AI 처리 시간
+    }
     
     @property
     def service(self):
@@ -601,7 +1467,7 @@ class Inquiry(MongoModel):
         return self._service
     
     @classmethod
-    def query_all_ordered(cls, limit=None):
+    def query_all_ordered(cls, limit=None, prefetch=None):
         """생성일 기준 내림차순 정렬된 문의 조회"""
         collection = cls.get_collection()
         cursor = collection.find().sort('created_at', DESCENDING)
@@ -615,10 +1481,10 @@ class Inquiry(MongoModel):
                     results.append(inquiry)
             except Exception as e:
                 print(f"⚠️ 문의 문서 로드 오류 (건너뜀): _id={doc.get('_id')}, error={str(e)}")
-        return results
+        return cls.prefetch_related(results, prefetch)
     
     @classmethod
-    def query_spam(cls, limit=None):
+    def query_spam(cls, limit=None, prefetch=None):
         """스팸으로 분류된 문의 조회"""
         collection = cls.get_collection()
         cursor = collection.find({'is_spam': True}).sort('created_at', DESCENDING)
@@ -632,10 +1498,10 @@ class Inquiry(MongoModel):
                     results.append(inquiry)
             except Exception as e:
                 print(f"⚠️ 스팸 문의 문서 로드 오류 (건너뜀): _id={doc.get('_id')}, error={str(e)}")
-        return results
+        return cls.prefetch_related(results, prefetch)
     
     @classmethod
-    def query_non_spam(cls, limit=None):
+    def query_non_spam(cls, limit=None, prefetch=None):
         """정상 문의 조회 (스팸 제외)"""
         collection = cls.get_collection()
         cursor = collection.find({'$or': [{'is_spam': False}, {'is_spam': {'$exists': False}}]}).sort('created_at', DESCENDING)
@@ -649,59 +1515,61 @@ class Inquiry(MongoModel):
                     results.append(inquiry)
             except Exception as e:
                 print(f"⚠️ 문의 문서 로드 오류 (건너뜀): _id={doc.get('_id')}, error={str(e)}")
-        return results
+        return cls.prefetch_related(results, prefetch)
 
 
 class CollageText(MongoModel):
     """Fade Text 모델"""
     collection_name = 'collage_texts'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.text = kwargs.get('text', '')
-        self.order = kwargs.get('order', 0)
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    indexes = [
+        Index('order'),
+    ]
+    
+    fields = {
+        'text': '',
+        'order': 0,
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def query_all_ordered(cls):
-        """순서별 정렬된 텍스트 조회"""
-        collection = cls.get_collection()
-        docs = collection.find().sort('order', ASCENDING)
-        return [cls.from_doc(doc) for doc in docs]
+        """순서별 정렬된 텍스트 조회 (모델 조회 캐시 사용)"""
+        return cls.query_set().order_by('order').cached().all()
 
 
 class SiteSettings(MongoModel):
     """사이트 설정 모델"""
     collection_name = 'site_settings'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # 사이트 모드: Light mode 전용 (dark mode 제거됨)
-        self.site_mode = 'light'
+    # 사이트 모드: Light mode 전용 (dark mode 제거됨, 문서에 저장하지 않음)
+    site_mode = 'light'
+    
+    fields = {
         # Light Mode 색상 설정 (admin의 '사이트 색상 관리' 값)
         # 기본값: Neon Lavender #B57EDC
-        self.main_color_r = kwargs.get('main_color_r', 181)
-        self.main_color_g = kwargs.get('main_color_g', 126)
-        self.main_color_b = kwargs.get('main_color_b', 220)
+        'main_color_r': 181,
+        'main_color_g': 126,
+        'main_color_b': 220,
         # 기본값: Electric Violet #8A2BE2
-        self.sub_color_r = kwargs.get('sub_color_r', 138)
-        self.sub_color_g = kwargs.get('sub_color_g', 43)
-        self.sub_color_b = kwargs.get('sub_color_b', 226)
+        'sub_color_r': 138,
+        'sub_color_g': 43,
+        'sub_color_b': 226,
         # 기본값: White #FFFFFF (라이트 모드용 배경)
-        self.background_color_r = kwargs.get('background_color_r', 255)
-        self.background_color_g = kwargs.get('background_color_g', 255)
-        self.background_color_b = kwargs.get('background_color_b', 255)
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+        'background_color_r': 255,
+        'background_color_g': 255,
+        'background_color_b': 255,
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def get_current_settings(cls):
-        """현재 사이트 설정 가져오기"""
-        collection = cls.get_collection()
-        doc = collection.find_one()
-        if doc:
-            return cls.from_doc(doc)
+        """현재 사이트 설정 가져오기 (모델 조회 캐시 사용 - 모든 페이지 렌더링에서 호출됨)"""
+        settings = cls.query_set().cached().first()
+        if settings:
+            return settings
         # 기본 설정 생성
         settings = cls()
         settings.save()
@@ -730,19 +1598,18 @@ class TermsOfService(MongoModel):
     """이용약관 모델"""
     collection_name = 'terms_of_service'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.content = kwargs.get('content', '')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    fields = {
+        'content': '',
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def get_current_content(cls):
-        """현재 이용약관 가져오기"""
-        collection = cls.get_collection()
-        doc = collection.find_one()
-        if doc:
-            return cls.from_doc(doc)
+        """현재 이용약관 가져오기 (모델 조회 캐시 사용)"""
+        current = cls.query_set().cached().first()
+        if current:
+            return current
         # 기본 이용약관 생성
         terms = cls(content='이용약관 내용을 입력해주세요.')
         terms.save()
@@ -753,19 +1620,18 @@ class PrivacyPolicy(MongoModel):
     """개인정보처리방침 모델"""
     collection_name = 'privacy_policy'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.content = kwargs.get('content', '')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    fields = {
+        'content': '',
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def get_current_content(cls):
-        """현재 개인정보처리방침 가져오기"""
-        collection = cls.get_collection()
-        doc = collection.find_one()
-        if doc:
-            return cls.from_doc(doc)
+        """현재 개인정보처리방침 가져오기 (모델 조회 캐시 사용)"""
+        current = cls.query_set().cached().first()
+        if current:
+            return current
         # 기본 개인정보처리방침 생성
         policy = cls(content='개인정보처리방침 내용을 입력해주세요.')
         policy.save()
@@ -776,25 +1642,23 @@ class CompanyInfo(MongoModel):
     """회사 정보 모델 (RAG 컨텍스트용)"""
     collection_name = 'company_info'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.company_name = kwargs.get('company_name', '스타일그래퍼 (Stylegrapher)')
-        self.email = kwargs.get('email', 'ysg.stylegrapher@gmail.com')
-        self.business_type = kwargs.get('business_type', '개인 스타일링, 이미지 컨설팅, 프로필 사진 촬영')
-        self.service_areas = kwargs.get('service_areas', 'AI 분석, 컨설팅 프로그램, 원데이 스타일링, 프리미엄 화보 제작')
-        self.customer_service_principles = kwargs.get('customer_service_principles', 
-            '친절하고 전문적인 응대, 고객의 요구사항을 정확히 파악, 맞춤형 서비스 안내, 신속한 답변 제공')
-        self.additional_info = kwargs.get('additional_info', '')
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    fields = {
+        'company_name': '스타일그래퍼 (Stylegrapher)',
+        'email': 'ysg.stylegrapher@gmail.com',
+        'business_type': '개인 스타일링, 이미지 컨설팅, 프로필 사진 촬영',
+        'service_areas': 'AI 분석, 컨설팅 프로그램, 원데이 스타일링, 프리미엄 화보 제작',
+        'customer_service_principles': '친절하고 전문적인 응대, 고객의 요구사항을 정확히 파악, 맞춤형 서비스 안내, 신속한 답변 제공',
+        'additional_info': '',
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def get_current_info(cls):
-        """현재 회사 정보 가져오기"""
-        collection = cls.get_collection()
-        doc = collection.find_one()
-        if doc:
-            return cls.from_doc(doc)
+        """현재 회사 정보 가져오기 (모델 조회 캐시 사용)"""
+        info = cls.query_set().cached().first()
+        if info:
+            return info
         # 기본 회사 정보 생성
         info = cls()
         info.save()
@@ -830,27 +1694,26 @@ class AboutContent(MongoModel):
 
 기술이나 기능은 언제든 따라 잡힐 수 있지만 철학과 가치는 쉽게 흉내 낼 수 없습니다. 스타일그래퍼는 고객 한 분 한 분에 대한 애정과 깊은 이해를 바탕으로 고객의 이름으로 고객 한 분만의 스타일과 아름다움을 찾아 드리기 위해 끝까지 노력하겠습니다.'''
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.hero_title = kwargs.get('hero_title', self.DEFAULT_HERO_TITLE)
-        self.hero_subtitle = kwargs.get('hero_subtitle', self.DEFAULT_HERO_SUBTITLE)
-        self.hero_description = kwargs.get('hero_description', self.DEFAULT_HERO_DESCRIPTION)
-        self.hero_message = kwargs.get('hero_message', self.DEFAULT_HERO_MESSAGE)
-        self.brand_philosophy = kwargs.get('brand_philosophy', self.DEFAULT_BRAND_PHILOSOPHY)
-        self.fashion_icons = kwargs.get('fashion_icons', self.DEFAULT_FASHION_ICONS)
-        self.current_era = kwargs.get('current_era', self.DEFAULT_CURRENT_ERA)
-        self.experience = kwargs.get('experience', self.DEFAULT_EXPERIENCE)
-        self.mission = kwargs.get('mission', self.DEFAULT_MISSION)
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    fields = {
+        'hero_title': DEFAULT_HERO_TITLE,
+        'hero_subtitle': DEFAULT_HERO_SUBTITLE,
+        'hero_description': DEFAULT_HERO_DESCRIPTION,
+        'hero_message': DEFAULT_HERO_MESSAGE,
+        'brand_philosophy': DEFAULT_BRAND_PHILOSOPHY,
+        'fashion_icons': DEFAULT_FASHION_ICONS,
+        'current_era': DEFAULT_CURRENT_ERA,
+        'experience': DEFAULT_EXPERIENCE,
+        'mission': DEFAULT_MISSION,
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def get_current_content(cls):
-        """현재 About 페이지 콘텐츠 가져오기"""
-        collection = cls.get_collection()
-        doc = collection.find_one()
-        if doc:
-            return cls.from_doc(doc)
+        """현재 About 페이지 콘텐츠 가져오기 (모델 조회 캐시 사용)"""
+        current = cls.query_set().cached().first()
+        if current:
+            return current
         # 기본 콘텐츠 생성
         content = cls()
         content.save()
@@ -874,18 +1737,26 @@ class AboutContent(MongoModel):
 class PackagePhoto(MongoModel):
     """패키지 화보 모델 - 서비스 옵션별 화보 갤러리"""
     collection_name = 'package_photos'
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.service_option_id = kwargs.get('service_option_id')  # 연결된 서비스 옵션 ID
-        self.category = kwargs.get('category', '')  # 분류 (예: 환생 화보, 린's Pick 화보)
-        self.concept = kwargs.get('concept', '')  # 컨셉명
-        self.images = kwargs.get('images', [])  # GridFS 이미지 ID 목록
-        self.display_order = kwargs.get('display_order', 0)  # 표시 순서
-        self.is_active = kwargs.get('is_active', True)  # 활성화 상태
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
-        self._service_option = None
+    relations = {
+        'service_option': {'cache': '_service_option', 'model': 'ServiceOption', 'local': 'service_option_id', 'foreign': '_id'},
+    }
+    
+    indexes = [
+        Index('service_option_id'),
+        Index([('service_option_id', ASCENDING), ('category', ASCENDING)]),
+        Index([('service_option_id', ASCENDING), ('display_order', ASCENDING)]),
+    ]
+    
+    fields = {
+        'service_option_id': None,  # 연결된 서비스 옵션 ID
+        'category': '',  # 분류 (예: 환생 화보, 린's Pick 화보)
+        'concept': '',  # 컨셉명
+        'images': list,  # GridFS 이미지 ID 목록
+        'display_order': 0,  # 표시 순서
+        'is_active': True,  # 활성화 상태
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @property
     def service_option(self):
@@ -938,13 +1809,18 @@ class PackagePhotoCategory(MongoModel):
     """패키지 화보 카테고리 모델 - 분류별 표출 순서 관리"""
     collection_name = 'package_photo_categories'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.service_option_id = kwargs.get('service_option_id')  # 연결된 서비스 옵션 ID
-        self.name = kwargs.get('name', '')  # 카테고리명 (예: 린님 화보, 환생 화보)
-        self.display_order = kwargs.get('display_order', 0)  # 표시 순서
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    indexes = [
+        Index([('service_option_id', ASCENDING), ('display_order', ASCENDING)]),
+        Index([('service_option_id', ASCENDING), ('name', ASCENDING)]),
+    ]
+    
+    fields = {
+        'service_option_id': None,  # 연결된 서비스 옵션 ID
+        'name': '',  # 카테고리명 (예: 린님 화보, 환생 화보)
+        'display_order': 0,  # 표시 순서
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def query_by_service_option(cls, service_option_id):
@@ -999,15 +1875,20 @@ class AdminNotificationEmail(MongoModel):
     """관리자 알림 이메일 모델"""
     collection_name = 'admin_notification_emails'
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.email = kwargs.get('email', '')
-        self.name = kwargs.get('name', '')  # 담당자 이름 (선택)
-        self.is_active = kwargs.get('is_active', True)  # 활성화 상태
-        self.receive_inquiries = kwargs.get('receive_inquiries', True)  # 문의 알림 수신
-        self.receive_bookings = kwargs.get('receive_bookings', True)  # 예약 알림 수신
-        self.created_at = kwargs.get('created_at', datetime.utcnow())
-        self.updated_at = kwargs.get('updated_at', datetime.utcnow())
+    indexes = [
+        Index('email', unique=True),
+        Index('is_active'),
+    ]
+    
+    fields = {
+        'email': '',
+        'name': '',  # 담당자 이름 (선택)
+        'is_active': True,  # 활성화 상태
+        'receive_inquiries': True,  # 문의 알림 수신
+        'receive_bookings': True,  # 예약 알림 수신
+        'created_at': datetime.utcnow,
+        'updated_at': datetime.utcnow,
+    }
     
     @classmethod
     def query_all_ordered(cls):
@@ -1060,8 +1941,5 @@ class AdminNotificationEmail(MongoModel):
 
 # 편의 함수들
 def get_next_id(collection_name):
-    """다음 ID 값 생성 (auto-increment 시뮬레이션)"""
-    db = get_mongo_db()
-    collection = db[collection_name]
-    max_doc = collection.find_one(sort=[('_id', DESCENDING)])
-    return (max_doc['_id'] + 1) if max_doc and isinstance(max_doc.get('_id'), int) else 1
+    """다음 ID 값 발급 (counters 컬렉션 기반 원자적 할당)"""
+    return allocate_ids(collection_name)[0]
@@ -0,0 +1,255 @@
+"""
+MongoDB 쿼리 프로파일러
+
+공유 MongoClient에 CommandListener로 등록되어 모든 명령의 소요 시간, 컬렉션,
+명령 종류, 반환 문서 수, 호출한 Flask 엔드포인트를 집계합니다.
+- 엔드포인트별 요청당 왕복 횟수 (N+1 패턴 탐지)
+- 엔드포인트 × 컬렉션 × 명령별 누적/최대 시간
+- 느린 쿼리 로그 (최근 N건, 필터 값은 '?'로 가려서 구조만 보관)
+
+환경 변수:
+    MONGO_PROFILER=0          프로파일러 비활성화 (기본: 활성)
+    MONGO_SLOW_QUERY_MS       느린 쿼리 기준 (기본: 100)
+    MONGO_SLOW_LOG_SIZE       느린 쿼리 로그 보관 수 (기본: 200)
+
+집계값은 워커 프로세스별 메모리에 보관됩니다 (/admin/db-profile 에서 확인).
+"""
+
+import os
+import json
+import threading
+from collections import deque
+from datetime import datetime
+from pymongo import monitoring
+from flask import g, has_request_context, request
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+PROFILER_ENABLED = os.environ.get('MONGO_PROFILER', '1').lower() not in ('0', 'false', 'off')
+SLOW_QUERY_MS = _env_int('MONGO_SLOW_QUERY_MS', 100)
+SLOW_LOG_SIZE = _env_int('MONGO_SLOW_LOG_SIZE', 200)
+
+# 집계에서 제외할 명령 (연결/인증/세션 관리)
+IGNORED_COMMANDS = frozenset({
+    'ping', 'hello', 'ismaster', 'isMaster', 'buildinfo', 'buildInfo',
+    'saslStart', 'saslContinue', 'authenticate', 'endSessions', 'killCursors',
+})
+
+# 커서 응답의 배치 키 / 명령별 컬렉션 인자
+_BATCH_KEYS = ('firstBatch', 'nextBatch')
+_SHAPE_ARGS = ('filter', 'query', 'sort', 'pipeline', 'projection', 'key')
+
+
+def _shape(value, depth=0):
+    """쿼리 구조만 남기고 값은 '?'로 가림 (개인정보가 로그에 남지 않도록)"""
+    if depth > 6:
+        return '…'
+    if isinstance(value, dict):
+        return {key: _shape(item, depth + 1) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return []
+        shaped = [_shape(value[0], depth + 1)]
+        if len(value) > 1:
+            shaped.append(f'…+{len(value) - 1}')
+        return shaped
+    return '?'
+
+
+def _command_shape(command_name, command):
+    shape = {}
+    for arg in _SHAPE_ARGS:
+        if arg in command:
+            # sort/projection은 필드와 방향 자체가 구조 정보이므로 그대로 보관
+            shape[arg] = dict(command[arg]) if arg in ('sort', 'projection') else _shape(command[arg])
+    for arg in ('updates', 'deletes', 'documents'):
+        if arg in command:
+            shape[arg] = len(command[arg])
+    for arg in ('limit', 'skip'):
+        if command.get(arg):
+            shape[arg] = command[arg]
+    text = json.dumps(shape, ensure_ascii=False, default=str)
+    return text if len(text) <= 300 else text[:300] + '…'
+
+
+def _collection_of(command_name, command):
+    if command_name == 'getMore':
+        return command.get('collection', '')
+    target = command.get(command_name)
+    return target if isinstance(target, str) else ''
+
+
+def _documents_of(command_name, reply):
+    cursor = reply.get('cursor')
+    if isinstance(cursor, dict):
+        for key in _BATCH_KEYS:
+            if key in cursor:
+                return len(cursor[key])
+    if command_name == 'distinct':
+        return len(reply.get('values', []))
+    n = reply.get('n')
+    return n if isinstance(n, int) else 0
+
+
+class QueryProfiler(monitoring.CommandListener):
+    """명령 시작/완료 이벤트로 쿼리 통계와 느린 쿼리 로그를 수집"""
+    
+    def __init__(self, slow_ms=SLOW_QUERY_MS, slow_log_size=SLOW_LOG_SIZE):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._pending = {}  # {request_id: (명령, 컬렉션, 엔드포인트, 구조)}
+        self._slow_log = deque(maxlen=slow_log_size)
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self._operations = {}  # {(엔드포인트, 컬렉션, 명령): 집계}
+            self._endpoints = {}  # {엔드포인트: 요청 단위 집계}
+            self._slow_log.clear()
+            self._started_at = datetime.now()
+    
+    # ---------- CommandListener ----------
+    
+    def started(self, event):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        endpoint = '(background)'
+        if has_request_context():
+            endpoint = request.endpoint or request.path
+            g._mongo_roundtrips = g.get('_mongo_roundtrips', 0) + 1
+        command = event.command
+        self._pending[event.request_id] = (
+            event.command_name,
+            _collection_of(event.command_name, command),
+            endpoint,
+            _command_shape(event.command_name, command),
+        )
+    
+    def succeeded(self, event):
+        self._finish(event, _documents_of(event.command_name, event.reply), failed=False)
+    
+    def failed(self, event):
+        self._finish(event, 0, failed=True)
+    
+    def _finish(self, event, documents, failed):
+        pending = self._pending.pop(event.request_id, None)
+        if pending is None:
+            return
+        command_name, collection, endpoint, shape = pending
+        duration_ms = event.duration_micros / 1000
+        
+        if has_request_context():
+            g._mongo_ms = g.get('_mongo_ms', 0.0) + duration_ms
+        
+        with self._lock:
+            stats = self._operations.get((endpoint, collection, command_name))
+            if stats is None:
+                stats = self._operations[(endpoint, collection, command_name)] = {
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'documents': 0, 'failures': 0,
+                }
+            stats['count'] += 1
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            stats['documents'] += documents
+            if failed:
+                stats['failures'] += 1
+            
+            if duration_ms >= self.slow_ms:
+                self._slow_log.appendleft({
+                    'time': datetime.now(),
+                    'endpoint': endpoint,
+                    'collection': collection,
+                    'command': command_name,
+                    'duration_ms': round(duration_ms, 1),
+                    'documents': documents,
+                    'failed': failed,
+                    'shape': shape,
+                })
+        
+        if duration_ms >= self.slow_ms:
+            print(f"🐢 느린 쿼리 {duration_ms:.0f}ms - {command_name} {collection} ({endpoint}) {shape}")
+    
+    # ---------- 요청 단위 집계 ----------
+    
+    def record_request(self, endpoint, roundtrips, db_ms):
+        """요청 하나가 끝났을 때 엔드포인트별 왕복 횟수/DB 시간 누적"""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = {
+                    'requests': 0, 'roundtrips': 0, 'max_roundtrips': 0, 'db_ms': 0.0, 'max_db_ms': 0.0,
+                }
+            stats['requests'] += 1
+            stats['roundtrips'] += roundtrips
+            stats['max_roundtrips'] = max(stats['max_roundtrips'], roundtrips)
+            stats['db_ms'] += db_ms
+            stats['max_db_ms'] = max(stats['max_db_ms'], db_ms)
+    
+    def snapshot(self, limit=50):
+        """관리자 페이지용 집계 (엔드포인트는 요청당 왕복 수, 명령은 누적 시간 순)"""
+        with self._lock:
+            endpoints = [
+                {
+                    'endpoint': endpoint,
+                    'requests': stats['requests'],
+                    'avg_roundtrips': round(stats['roundtrips'] / stats['requests'], 1),
+                    'max_roundtrips': stats['max_roundtrips'],
+                    'avg_db_ms': round(stats['db_ms'] / stats['requests'], 1),
+                    'max_db_ms': round(stats['max_db_ms'], 1),
+                }
+                for endpoint, stats in self._endpoints.items()
+            ]
+            operations = [
+                {
+                    'endpoint': endpoint,
+                    'collection': collection,
+                    'command': command_name,
+                    'count': stats['count'],
+                    'total_ms': round(stats['total_ms'], 1),
+                    'avg_ms': round(stats['total_ms'] / stats['count'], 2),
+                    'max_ms': round(stats['max_ms'], 1),
+                    'avg_documents': round(stats['documents'] / stats['count'], 1),
+                    'failures': stats['failures'],
+                }
+                for (endpoint, collection, command_name), stats in self._operations.items()
+            ]
+            slow_queries = list(self._slow_log)
+            started_at = self._started_at
+        
+        endpoints.sort(key=lambda item: item['avg_roundtrips'], reverse=True)
+        operations.sort(key=lambda item: item['total_ms'], reverse=True)
+        return {
+            'pid': os.getpid(),
+            'enabled': PROFILER_ENABLED,
+            'started_at': started_at,
+            'slow_query_ms': self.slow_ms,
+            'endpoints': endpoints[:limit],
+            'operations': operations[:limit],
+            'slow_queries': slow_queries,
+        }
+
+
+query_profiler = QueryProfiler()
+
+
+def get_event_listeners():
+    """공유 MongoClient에 등록할 프로파일러 리스너 목록 (비활성화 시 빈 목록)"""
+    return [query_profiler] if PROFILER_ENABLED else []
+
+
+def init_app(app):
+    """요청 단위 왕복 횟수 집계 훅 등록"""
+    if not PROFILER_ENABLED:
+        return
+    
+    @app.teardown_request
+    def _record_mongo_roundtrips(exc):
+        endpoint = request.endpoint
+        if endpoint and endpoint != 'static':
+            query_profiler.record_request(endpoint, g.get('_mongo_roundtrips', 0), g.get('_mongo_ms', 0.0))
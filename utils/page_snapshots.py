@@ -0,0 +1,539 @@
+"""
+공개 페이지 정적 스냅샷
+
+관리자가 수정할 때만 바뀌는 공개 페이지(/, /services, /service_option/<id>, /gallery, /about 등)를
+지원 언어별로 미리 렌더링해 instance/snapshots 에 저장하고 (gzip/brotli 사전 압축 포함),
+요청 시에는 뷰와 MongoDB를 거치지 않고 파일을 그대로 응답합니다.
+
+- 대상 페이지: register_snapshot_page(엔드포인트, 태그 함수, 변형 목록 함수)
+- 응답: serve_snapshot() - 쿼리 파라미터/플래시 메시지가 없는 GET/HEAD 요청만
+- 갱신: invalidate_snapshots(tags) - 태그에 의존하는 스냅샷만 즉시 삭제하고 백그라운드에서 다시 렌더링
+  (routes.main.invalidate_page_cache 에서 호출되므로 관리자 저장 직후 반영)
+- 전체 빌드: flask snapshots build (워커 부팅 시에는 없는 스냅샷만 한 워커가 백그라운드에서 빌드)
+- 언어 접두사 URL(/en/services, utils/lang_urls.py) 페이지도 별도 스냅샷으로 빌드
+- 조건부 요청: 같은 태그 세대로 ETag/Last-Modified를 계산해, 바뀌지 않았으면 렌더링 없이 304 응답
+- 조회 오류로 빈 목록을 렌더링한 결과(mark_render_fallback)는 저장하지 않고,
+  SNAPSHOT_MAX_AGE보다 오래된 스냅샷은 미스로 처리한 뒤 백그라운드에서 다시 렌더링
+  (무효화 누락/실패가 있어도 오래된 페이지가 계속 제공되지 않도록)
+
+스냅샷은 템플릿/번역 파일 지문별 디렉토리에 저장되므로 배포로 템플릿이 바뀌면 자동으로 새로 빌드됩니다.
+
+환경 변수:
+    PAGE_SNAPSHOTS=0     스냅샷 비활성화 (기본: 활성)
+    SNAPSHOT_DIR         저장 위치 (기본: instance/snapshots)
+    SITE_URL             렌더링 기준 URL - canonical/og:url (기본: https://www.stylegrapher.com)
+    SNAPSHOT_MAX_AGE     스냅샷 최대 보관 시간(초, 기본: 21600 = 6시간, 0이면 무제한)
+"""
+
+import os
+import gzip
+import time
+import shutil
+import hashlib
+import threading
+from datetime import datetime, timezone
+import click
+from flask import g, request, session, send_file, current_app
+from flask.cli import AppGroup
+from extensions import cache
+from utils.shared_cache import tag_versions, tags_last_modified, is_render_fallback
+from utils.translation import SUPPORTED_LANGUAGES
+from utils.translation_helper import get_current_language
+from utils.lang_urls import is_localized, url_lang
+
+try:
+    import brotli  # Flask-Compress 의존성 (없으면 gzip만 생성)
+except ImportError:
+    brotli = None
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNAPSHOT_ENABLED = os.environ.get('PAGE_SNAPSHOTS', '1').lower() not in ('0', 'false', 'off')
+SNAPSHOT_DIR = os.environ.get('SNAPSHOT_DIR') or os.path.join(_ROOT, 'instance', 'snapshots')
+SITE_URL = os.environ.get('SITE_URL', 'https://www.stylegrapher.com')
+SNAPSHOT_MAX_AGE = int(os.environ.get('SNAPSHOT_MAX_AGE', '21600'))
+
+# 응답 우선순위 (Accept-Encoding에 있으면 앞에서부터 사용)
+_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+_BUILD_LOCK_KEY = 'snapshot-build-lock'
+_BUILD_LOCK_SECONDS = 600
+
+_pages = {}  # {엔드포인트: (태그 함수, 변형 목록 함수)}
+_release = None  # (템플릿/번역 파일 지문, 가장 최근 수정 시각) - 프로세스당 한 번 계산
+_release_lock = threading.Lock()
+
+_pending_tags = set()  # 재빌드 대기 중인 태그
+_pending_pages = set()  # 재빌드 대기 중인 페이지 (만료된 스냅샷) - (엔드포인트, view_args 항목, 언어, 언어 접두사 여부)
+_builder_running = False
+_builder_lock = threading.Lock()
+
+_stats = {'hit': 0, 'miss': 0, 'expired': 0, 'not_modified': 0, 'built': 0, 'build_failed': 0, 'discarded': 0,
+          'removed': 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name, amount=1):
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def register_snapshot_page(endpoint, tags, variants=None):
+    """
+    스냅샷 대상 페이지 등록
+    
+    Args:
+        endpoint: 엔드포인트 (예: 'main.index')
+        tags: (lang, **view_args) -> 페이지가 의존하는 캐시 태그 튜플
+        variants: () -> [view_args, ...] (URL 인자가 있는 페이지만, 예: 옵션 ID 목록)
+    """
+    _pages[endpoint] = (tags, variants)
+
+
+def _release_info():
+    """템플릿/번역(.mo) 파일 지문과 최근 수정 시각 - 배포로 바뀌면 다른 디렉토리에 새로 빌드"""
+    global _release
+    with _release_lock:
+        if _release is None:
+            digest = hashlib.md5()
+            latest = 0
+            for folder in ('templates', 'translations'):
+                for root, dirs, files in os.walk(os.path.join(_ROOT, folder)):
+                    dirs.sort()
+                    for name in sorted(files):
+                        path = os.path.join(root, name)
+                        stat = os.stat(path)
+                        digest.update(f"{os.path.relpath(path, _ROOT)}:{stat.st_size}:{int(stat.st_mtime)};".encode('utf-8'))
+                        latest = max(latest, int(stat.st_mtime))
+            _release = (digest.hexdigest()[:12], latest)
+        return _release
+
+
+def _release_id():
+    return _release_info()[0]
+
+
+def _snapshot_path(path, lang):
+    name = path.strip('/').replace('/', '__') or 'index'
+    return os.path.join(SNAPSHOT_DIR, _release_id(), lang, name + '.html')
+
+
+def _remove_snapshot(html_path):
+    removed = False
+    for suffix in ('', '.gz', '.br'):
+        try:
+            os.remove(html_path + suffix)
+            removed = True
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def _write_snapshot(html_path, body):
+    """원본 + 사전 압축본 저장 (임시 파일에 쓴 뒤 os.replace로 교체)"""
+    os.makedirs(os.path.dirname(html_path), exist_ok=True)
+    variants = [('', body), ('.gz', gzip.compress(body, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(body, quality=11)))
+    for suffix, data in variants:
+        temp_path = f"{html_path}{suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, html_path + suffix)
+
+
+# ---------- 조건부 요청 (ETag / Last-Modified) ----------
+
+def page_validators():
+    """
+    현재 요청 페이지의 검증자 - 렌더링 없이 페이지 태그 세대로 계산 (요청당 한 번)
+    
+    ETag는 템플릿 지문 + 언어 + URL + 태그 세대의 해시이므로, 관리자 저장/번역 완료로
+    태그가 무효화되거나 배포로 템플릿이 바뀔 때만 달라진다.
+    
+    Returns:
+        (ETag 값, Last-Modified epoch 초) 또는 None (대상 페이지가 아닌 경우)
+    """
+    if 'page_validators' in g:
+        return g.page_validators
+    
+    validators = None
+    if request.method in ('GET', 'HEAD') and request.endpoint in _pages and not session.get('_flashes'):
+        lang = get_current_language()
+        tags = _pages[request.endpoint][0](lang, **(request.view_args or {}))
+        versions = tag_versions(tags)
+        release, release_mtime = _release_info()
+        fragment = 'hx' if request.headers.get('HX-Request') else 'full'
+        source = '|'.join([release, lang, request.full_path, fragment] + [f"{tag}={versions[tag]}" for tag in tags])
+        etag = hashlib.md5(source.encode('utf-8')).hexdigest()[:20]
+        validators = (etag, max(tags_last_modified(tags) or 0, release_mtime))
+    g.page_validators = validators
+    return validators
+
+
+def not_modified_response():
+    """
+    before_request 훅 - 클라이언트 사본이 최신이면 304 응답
+    
+    If-None-Match가 있으면 그것만 비교하고 (압축 응답의 ':gzip'/':br' 접미사는 무시),
+    없을 때만 If-Modified-Since를 비교한다.
+    """
+    validators = page_validators()
+    if validators is None:
+        return None
+    etag, last_modified = validators
+    
+    matched = None
+    if request.if_none_match:
+        if request.if_none_match.star_tag:
+            matched = etag
+        else:
+            for tag in request.if_none_match.as_set(include_weak=True):
+                if tag.split(':')[0] == etag:
+                    matched = tag
+                    break
+    elif request.if_modified_since and last_modified:
+        if request.if_modified_since >= datetime.fromtimestamp(last_modified, timezone.utc):
+            matched = etag
+    if matched is None:
+        return None
+    
+    response = current_app.response_class(status=304)
+    response.headers['ETag'] = f'"{matched}"'
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    response.vary.add('Accept-Encoding')
+    _count('not_modified')
+    return response
+
+
+def add_page_validators(response):
+    """
+    after_request 훅 - 200 응답에 ETag/Last-Modified 추가 (브라우저는 매번 재검증)
+    
+    조회 오류로 대체 화면을 렌더링한 응답(mark_render_fallback)에는 검증자를 붙이지 않고
+    저장도 막는다. 정상 페이지와 같은 ETag를 주면 복구 후에도 304로 오류 화면이 유지되기 때문.
+    """
+    if is_render_fallback():
+        response.cache_control.no_store = True
+        return response
+    validators = g.get('page_validators')
+    if validators and response.status_code == 200:
+        etag, last_modified = validators
+        # 사전 압축 스냅샷은 인코딩별로 바이트가 다르므로 Flask-Compress와 같은 형식의 접미사 추가
+        encoding = response.headers.get('Content-Encoding')
+        response.headers['ETag'] = f'"{etag}:{encoding}"' if encoding else f'"{etag}"'
+        if last_modified:
+            response.last_modified = last_modified
+        response.cache_control.no_cache = True
+    return response
+
+
+# ---------- 응답 ----------
+
+def serve_snapshot():
+    """
+    before_request 훅 - 스냅샷이 있으면 바로 응답
+    
+    Returns:
+        응답 객체 (스냅샷이 없거나 대상이 아니면 None → 일반 렌더링)
+    """
+    if not SNAPSHOT_ENABLED or request.method not in ('GET', 'HEAD'):
+        return None
+    # 쿼리 파라미터(?lang=, 커서), HTMX 조각, 플래시 메시지가 있는 요청은 직접 렌더링
+    if request.endpoint not in _pages or request.args or request.headers.get('HX-Request'):
+        return None
+    if session.get('_flashes'):
+        return None
+    
+    lang = get_current_language()
+    html_path = _snapshot_path(request.path, lang)
+    if SNAPSHOT_MAX_AGE > 0:
+        try:
+            age = time.time() - os.stat(html_path).st_mtime
+        except FileNotFoundError:
+            age = 0  # 아래에서 미스로 처리
+        if age > SNAPSHOT_MAX_AGE:
+            # 오래된 스냅샷은 지우고 이번 요청은 일반 렌더링, 이 페이지만 백그라운드에서 다시 빌드
+            _remove_snapshot(html_path)
+            _count('expired')
+            view_args = tuple(sorted((request.view_args or {}).items()))
+            _schedule_rebuild(current_app._get_current_object(),
+                              pages=[(request.endpoint, view_args, lang, url_lang() is not None)])
+            return None
+    
+    candidates = [(encoding, html_path + suffix) for encoding, suffix in _ENCODINGS
+                  if request.accept_encodings[encoding]]
+    candidates.append((None, html_path))
+    
+    for encoding, path in candidates:
+        try:
+            response = send_file(path, mimetype='text/html', conditional=False, etag=False)
+        except FileNotFoundError:
+            continue
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        _count('hit')
+        return response
+    
+    _count('miss')
+    return None
+
+
+# ---------- 빌드 ----------
+
+def _page_variants(endpoint):
+    variants = _pages[endpoint][1]
+    return variants() if variants else [{}]
+
+
+def _page_path(app, endpoint, view_args, lang, localized):
+    # 언어 접두사 URL(/en/...)은 URL 규칙의 lang_code 인자로 생성
+    return app.url_map.bind('localhost').build(endpoint, dict(view_args, lang_code=lang) if localized else view_args)
+
+
+def render_snapshot(app, endpoint, view_args, lang, localized=False):
+    """
+    페이지 하나를 한 언어로 렌더링해 저장
+    
+    요청 훅(방문자 기록 등)과 페이지 캐시를 거치지 않고 뷰 함수를 직접 호출한다.
+    렌더링 전에 읽은 태그 세대가 저장 직후에도 같을 때만 스냅샷을 남긴다.
+    (다른 워커가 렌더링 도중 invalidate_snapshots 하면 이전 데이터로 만든 파일이 남지 않도록)
+    
+    Args:
+        localized: True면 언어 접두사 URL(/en/...) 페이지 (쿠키 없이 URL로 언어 결정)
+    
+    Returns:
+        저장 여부 (문자열이 아닌 응답 - 리다이렉트/404 등과 오류 대체 화면은 저장하지 않음)
+    """
+    path = _page_path(app, endpoint, view_args, lang, localized)
+    html_path = _snapshot_path(path, lang)
+    headers = {} if localized else {'Cookie': f'preferred_lang={lang}'}
+    tags = _pages[endpoint][0](lang, **view_args)
+    try:
+        # 언어/태그 메모가 g에 남으므로 페이지마다 새 앱 컨텍스트에서 렌더링
+        with app.app_context(), app.test_request_context(path, base_url=SITE_URL, headers=headers):
+            # url_value_preprocessor (언어 접두사 → g.url_lang, view_args에서 lang_code 제거)
+            for preprocess in app.url_value_preprocessors.get(None, ()):
+                preprocess(request.endpoint, request.view_args)
+            versions = tag_versions(tags)
+            view = app.view_functions[endpoint]
+            html = getattr(view, '__wrapped__', view)(**request.view_args)
+            fallback = is_render_fallback()
+    except Exception as e:
+        _remove_snapshot(html_path)
+        _count('build_failed')
+        print(f"⚠️ 스냅샷 렌더링 실패 ({lang} {path}): {str(e)}")
+        return False
+    
+    if fallback:
+        # 조회 오류로 빈 목록/기본값이 렌더링됨 - 이전 스냅샷도 지우고 일반 렌더링으로 응답
+        _remove_snapshot(html_path)
+        _count('build_failed')
+        print(f"⚠️ 스냅샷 렌더링 중 조회 오류 - 저장하지 않음 ({lang} {path})")
+        return False
+    
+    if not isinstance(html, str):
+        _remove_snapshot(html_path)
+        return False
+    _write_snapshot(html_path, html.encode('utf-8'))
+    written = os.stat(html_path).st_ino
+    # 무효화는 태그 세대를 바꾼 뒤 파일을 지우므로, 저장 후 세대를 다시 확인하면
+    # 렌더링 중에 일어난 무효화를 놓치지 않는다 (바뀌었으면 새 세대의 재빌드에 맡김)
+    with app.app_context():
+        current = tag_versions(tags)
+    if current != versions:
+        # 그 사이 다른 스레드가 새 세대로 다시 저장했으면 그 파일은 그대로 둠
+        try:
+            if os.stat(html_path).st_ino == written:
+                _remove_snapshot(html_path)
+        except FileNotFoundError:
+            pass
+        _count('discarded')
+        return False
+    _count('built')
+    return True
+
+
+def build_snapshots(app, tags=None, missing_only=False):
+    """
+    스냅샷 빌드
+    
+    Args:
+        tags: 지정하면 이 태그에 의존하는 페이지만 (None이면 전체)
+        missing_only: True면 파일이 없는 스냅샷만
+    
+    Returns:
+        저장한 스냅샷 수
+    """
+    started = time.time()
+    tags = set(tags) if tags is not None else None
+    built = 0
+    with app.app_context():
+        for endpoint in list(_pages):
+            tags_of = _pages[endpoint][0]
+            try:
+                variants = _page_variants(endpoint)
+            except Exception as e:
+                print(f"⚠️ 스냅샷 대상 조회 실패 ({endpoint}): {str(e)}")
+                continue
+            url_forms = (False, True) if is_localized(endpoint) else (False,)
+            for view_args in variants:
+                for lang in SUPPORTED_LANGUAGES:
+                    if tags is not None and not tags & set(tags_of(lang, **view_args)):
+                        continue
+                    for localized in url_forms:
+                        if missing_only:
+                            path = _page_path(app, endpoint, view_args, lang, localized)
+                            if os.path.exists(_snapshot_path(path, lang)):
+                                continue
+                        if render_snapshot(app, endpoint, view_args, lang, localized):
+                            built += 1
+    if built:
+        print(f"📸 스냅샷 {built}개 빌드 ({time.time() - started:.1f}s)")
+    return built
+
+
+def _iter_snapshot_files(app):
+    """현재 릴리스의 스냅샷 파일 → (html 경로, 엔드포인트, view_args, 언어)"""
+    release_dir = os.path.join(SNAPSHOT_DIR, _release_id())
+    adapter = app.url_map.bind('localhost')
+    for lang in SUPPORTED_LANGUAGES:
+        lang_dir = os.path.join(release_dir, lang)
+        if not os.path.isdir(lang_dir):
+            continue
+        for name in os.listdir(lang_dir):
+            if not name.endswith('.html'):
+                continue
+            path = '/' + ('' if name == 'index.html' else name[:-len('.html')].replace('__', '/'))
+            try:
+                endpoint, view_args = adapter.match(path)
+            except Exception:
+                endpoint, view_args = None, {}
+            view_args.pop('lang_code', None)  # 언어 접두사 URL 스냅샷
+            yield os.path.join(lang_dir, name), endpoint, view_args, lang
+
+
+def invalidate_snapshots(tags):
+    """
+    태그에 의존하는 스냅샷을 즉시 삭제하고 백그라운드 재빌드 예약
+    
+    삭제는 요청 안에서 바로 하므로 재빌드가 끝나기 전까지는 모든 워커가 일반 렌더링으로 응답한다.
+    (삭제된 옵션처럼 더 이상 대상이 아닌 페이지의 스냅샷도 함께 정리됨)
+    """
+    if not SNAPSHOT_ENABLED or not tags:
+        return
+    app = current_app._get_current_object()
+    tags = set(tags)
+    
+    removed = 0
+    for html_path, endpoint, view_args, lang in _iter_snapshot_files(app):
+        if endpoint not in _pages or tags & set(_pages[endpoint][0](lang, **view_args)):
+            if _remove_snapshot(html_path):
+                removed += 1
+    _count('removed', removed)
+    _schedule_rebuild(app, tags=tags)
+
+
+def _schedule_rebuild(app, tags=(), pages=()):
+    """재빌드 대기열에 태그/페이지를 추가하고, 재빌드 스레드가 없으면 시작"""
+    global _builder_running
+    with _builder_lock:
+        _pending_tags.update(tags)
+        _pending_pages.update(pages)
+        if _builder_running:
+            return
+        _builder_running = True
+    threading.Thread(target=_rebuild_pending, args=(app,), daemon=True).start()
+
+
+def _rebuild_pending(app):
+    """대기 중인 태그/페이지를 모아서 재빌드 (연속 저장은 한 번에 처리)"""
+    global _builder_running
+    while True:
+        with _builder_lock:
+            tags = set(_pending_tags)
+            pages = set(_pending_pages)
+            _pending_tags.clear()
+            _pending_pages.clear()
+            if not tags and not pages:
+                _builder_running = False
+                return
+        try:
+            if tags:
+                build_snapshots(app, tags=tags)
+            for endpoint, view_args, lang, localized in pages:
+                render_snapshot(app, endpoint, dict(view_args), lang, localized)
+        except Exception as e:
+            print(f"⚠️ 스냅샷 재빌드 오류: {str(e)}")
+
+
+def _remove_old_releases():
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return
+    current = _release_id()
+    for name in os.listdir(SNAPSHOT_DIR):
+        if name != current:
+            shutil.rmtree(os.path.join(SNAPSHOT_DIR, name), ignore_errors=True)
+
+
+def build_snapshots_in_background(app):
+    """
+    워커 부팅 시 없는 스냅샷만 빌드 (백그라운드)
+    
+    cache.add 락으로 여러 워커 중 한 워커만 빌드한다.
+    """
+    if not SNAPSHOT_ENABLED:
+        return None
+    
+    def run():
+        with app.app_context():
+            if not cache.add(_BUILD_LOCK_KEY, os.getpid(), timeout=_BUILD_LOCK_SECONDS):
+                return
+            try:
+                _remove_old_releases()
+                build_snapshots(app, missing_only=True)
+            except Exception as e:
+                print(f"⚠️ 스냅샷 빌드 오류: {str(e)}")
+            finally:
+                cache.delete(_BUILD_LOCK_KEY)
+    
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def get_snapshot_stats():
+    """스냅샷 응답/빌드 통계 (응답 수는 현재 프로세스 기준)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    release_dir = os.path.join(SNAPSHOT_DIR, _release_id())
+    files = 0
+    for lang in SUPPORTED_LANGUAGES:
+        lang_dir = os.path.join(release_dir, lang)
+        if os.path.isdir(lang_dir):
+            files += sum(1 for name in os.listdir(lang_dir) if name.endswith('.html'))
+    stats.update(enabled=SNAPSHOT_ENABLED, release=_release_id(), snapshots=files,
+                 brotli=brotli is not None, pid=os.getpid())
+    return stats
+
+
+# ---------- Flask CLI ----------
+
+snapshots_cli = AppGroup('snapshots', help='공개 페이지 정적 스냅샷 빌드/삭제')
+
+
+@snapshots_cli.command('build')
+@click.option('--missing', is_flag=True, help='없는 스냅샷만 빌드')
+def build_command(missing):
+    """전체 공개 페이지 × 지원 언어 스냅샷 빌드"""
+    _remove_old_releases()
+    built = build_snapshots(current_app._get_current_object(), missing_only=missing)
+    print(f"✅ 스냅샷 빌드 완료: {built}개 → {os.path.join(SNAPSHOT_DIR, _release_id())}")
+
+
+@snapshots_cli.command('clear')
+def clear_command():
+    """모든 스냅샷 삭제 (다음 요청부터 일반 렌더링)"""
+    shutil.rmtree(SNAPSHOT_DIR, ignore_errors=True)
+    print(f"🧹 스냅샷 삭제: {SNAPSHOT_DIR}")
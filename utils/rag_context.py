@@ -14,7 +14,7 @@ def get_services_context() -> str:
     context_parts = []
     context_parts.append("=== 스타일그래퍼 서비스 정보 ===\n")
     
-    services = Service.query_all()
+    services = Service.query_all(prefetch=['options'])
     
     for service in services:
         context_parts.append(f"\n## 카테고리: {service.name}")
@@ -0,0 +1,356 @@
+"""
+워커 간 공유 캐시 설정 및 태그 기반 무효화
+
+gunicorn 워커마다 SimpleCache를 따로 두면 관리자 수정 후 캐시를 지워도
+요청을 처리한 워커만 비워지고, 다른 워커는 만료(5분)까지 이전 페이지를 제공합니다.
+페이지 캐시(extensions.cache)를 모든 워커가 함께 쓰는 저장소에 두고,
+캐시 항목은 의존하는 데이터를 태그('gallery', 'service_option:11', 'lang:en' 등)로 표시하고,
+무효화는 태그의 세대(generation) 값을 바꾸는 방식으로 모든 워커에 즉시 반영합니다.
+(키 목록을 훑거나 cache.clear()로 전체를 지우지 않음)
+
+백엔드 선택 (위에서부터 우선):
+    CACHE_TYPE          명시하면 그대로 사용 (예: SimpleCache - 로컬 개발용 단일 프로세스)
+    CACHE_REDIS_URL     Redis(또는 호환 서버) 사용 - redis 패키지 필요
+    (기본)              FileSystemCache - instance/page_cache (CACHE_DIR로 변경 가능)
+
+페이지 캐시는 cached_page 데코레이터를 사용합니다 (만료 후 stale-while-revalidate, 동시 미스 single-flight).
+"""
+
+import os
+import time
+import uuid
+import hashlib
+import functools
+import threading
+from flask import g, has_app_context, request, current_app
+from extensions import cache
+from utils.lang_urls import url_prefix
+from utils.translation_helper import get_current_language
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instance', 'page_cache'
+)
+
+# 태그 세대 키 접두사 (만료 없이 보관)
+_TAG_PREFIX = 'tag:'
+
+
+def _new_tag_version():
+    # 앞 8자리는 세대가 바뀐 시각(16진수 epoch 초) - Last-Modified 계산용
+    return f"{int(time.time()):08x}{uuid.uuid4().hex[:8]}"
+
+
+def configure_cache(app):
+    """
+    앱 캐시 백엔드 설정 후 cache.init_app 호출
+    
+    Returns:
+        사용한 CACHE_TYPE
+    """
+    global _lock_dir
+    app.config.setdefault('CACHE_DEFAULT_TIMEOUT', 300)  # 5분
+    cache_type = os.environ.get('CACHE_TYPE')
+    redis_url = os.environ.get('CACHE_REDIS_URL')
+    
+    if not cache_type and redis_url:
+        try:
+            import redis  # noqa: F401 (선택 의존성)
+            cache_type = 'RedisCache'
+            app.config['CACHE_REDIS_URL'] = redis_url
+            app.config['CACHE_KEY_PREFIX'] = os.environ.get('CACHE_KEY_PREFIX', 'stylegrapher:')
+        except ImportError:
+            print("⚠️ CACHE_REDIS_URL이 설정되었지만 redis 패키지가 없습니다 - 파일 캐시 사용")
+    
+    if not cache_type:
+        cache_type = 'FileSystemCache'
+    
+    _lock_dir = None
+    if cache_type == 'FileSystemCache':
+        cache_dir = os.environ.get('CACHE_DIR') or DEFAULT_CACHE_DIR
+        os.makedirs(cache_dir, exist_ok=True)
+        app.config['CACHE_DIR'] = cache_dir
+        app.config['CACHE_THRESHOLD'] = int(os.environ.get('CACHE_THRESHOLD', '2000'))
+        # 파일 캐시의 add는 확인 후 쓰기라 원자적이지 않으므로 렌더링 락은 별도 락 파일로 (캐시 디렉토리 밖)
+        _lock_dir = cache_dir.rstrip(os.sep) + '.locks'
+        os.makedirs(_lock_dir, exist_ok=True)
+    
+    app.config['CACHE_TYPE'] = cache_type
+    cache.init_app(app)
+    print(f"🗄️ 페이지 캐시 백엔드: {cache_type}"
+          + (f" ({app.config['CACHE_DIR']})" if cache_type == 'FileSystemCache' else ''))
+    return cache_type
+
+
+def tag_versions(tags):
+    """
+    태그별 현재 세대 값 (캐시 키에 포함)
+    
+    요청 안에서는 g에 보관하고, 처음 보는 태그만 get_many 한 번으로 읽는다.
+    
+    Returns:
+        {태그: 세대 값}
+    """
+    memo = g.setdefault('_cache_tags', {}) if has_app_context() else {}
+    missing = [tag for tag in tags if tag not in memo]
+    if missing:
+        values = cache.get_many(*[_TAG_PREFIX + tag for tag in missing])
+        for tag, version in zip(missing, values):
+            if version is None:
+                version = _new_tag_version()
+                # 동시에 처음 만든 워커가 있으면 먼저 기록된 값을 따름
+                if not cache.add(_TAG_PREFIX + tag, version, timeout=0):
+                    version = cache.get(_TAG_PREFIX + tag) or version
+            memo[tag] = version
+    return {tag: memo[tag] for tag in tags}
+
+
+def lang_tag(lang):
+    """언어별 태그 (번역이 바뀌면 해당 언어 캐시만 무효화)"""
+    return f"lang:{lang}"
+
+
+def tagged_key(tags, *parts):
+    """
+    태그 세대를 포함한 캐시 키 (예: 'service_option:ko:3@service_option:3=ab12,lang:ko=cd34')
+    
+    태그 중 하나라도 invalidate_tags 되면 키가 바뀌어 모든 워커에서 캐시 미스가 된다.
+    """
+    versions = tag_versions(tags)
+    return ':'.join(str(part) for part in parts) + '@' + ','.join(f"{tag}={versions[tag]}" for tag in tags)
+
+
+def tags_last_modified(tags):
+    """
+    태그 중 가장 최근에 세대가 바뀐 시각 (epoch 초)
+    
+    Returns:
+        int (이전 형식의 세대 값만 있으면 None)
+    """
+    times = []
+    for version in tag_versions(tags).values():
+        if not isinstance(version, str) or len(version) != 16:
+            return None
+        times.append(int(version[:8], 16))
+    return max(times) if times else None
+
+
+def invalidate_tags(*tags):
+    """태그 세대 변경 - 해당 태그가 붙은 캐시 항목만 모든 워커에서 무효화"""
+    if not tags:
+        return
+    cache.set_many({_TAG_PREFIX + tag: _new_tag_version() for tag in tags}, timeout=0)
+    if has_app_context():
+        memo = g.get('_cache_tags', {})
+        for tag in tags:
+            memo.pop(tag, None)
+
+
+# ---------- 페이지 캐시 (stale-while-revalidate + single-flight) ----------
+
+# 만료 후에도 이 시간(초) 동안은 이전 페이지를 바로 응답하고 백그라운드에서 다시 렌더링
+PAGE_CACHE_STALE_SECONDS = int(os.environ.get('PAGE_CACHE_STALE_SECONDS', '3600'))
+# 다른 워커가 렌더링 중인 페이지를 기다리는 최대 시간(초) - 넘으면 직접 렌더링
+PAGE_CACHE_WAIT_SECONDS = float(os.environ.get('PAGE_CACHE_WAIT_SECONDS', '5'))
+_RENDER_LOCK_SECONDS = 30
+
+_lock_dir = None  # FileSystemCache일 때 렌더링 락 파일 위치 (configure_cache에서 설정)
+_inflight = {}  # {캐시 키: threading.Event} - 이 프로세스에서 렌더링 중인 키
+_inflight_lock = threading.Lock()
+_page_stats = {'fresh': 0, 'stale': 0, 'miss': 0, 'waited': 0, 'refreshed': 0, 'refresh_failed': 0, 'fallback': 0}
+_page_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _page_stats_lock:
+        _page_stats[name] += 1
+
+
+def get_page_cache_stats():
+    """페이지 캐시 응답 통계 (현재 프로세스)"""
+    with _page_stats_lock:
+        stats = dict(_page_stats)
+    stats['pid'] = os.getpid()
+    return stats
+
+
+def mark_render_fallback():
+    """
+    뷰가 조회 오류를 삼키고 빈 목록/기본값으로 렌더링했음을 표시
+    
+    표시된 렌더링 결과는 페이지 캐시, 스냅샷, ETag/Last-Modified 어디에도 남기지 않는다
+    (일시적인 DB 오류 화면이 다음 무효화까지 고정되지 않도록).
+    """
+    if has_app_context():
+        g.render_fallback = True
+
+
+def is_render_fallback():
+    """현재 렌더링이 mark_render_fallback()으로 표시되었는지 여부"""
+    return has_app_context() and g.get('render_fallback', False)
+
+
+def _acquire_render_lock(cache_key):
+    """
+    워커 간 렌더링 락 (한 워커만 True)
+    
+    Redis는 cache.add(SET NX)가 원자적이므로 그대로 쓰고, 파일 캐시는 O_CREAT|O_EXCL 락 파일을 만든다.
+    _RENDER_LOCK_SECONDS보다 오래된 락 파일은 비정상 종료한 워커의 것으로 보고 다시 잡는다.
+    """
+    if _lock_dir is None:
+        return cache.add('render-lock:' + cache_key, os.getpid(), timeout=_RENDER_LOCK_SECONDS)
+    
+    path = os.path.join(_lock_dir, hashlib.md5(cache_key.encode('utf-8')).hexdigest())
+    for _ in range(2):
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(path).st_mtime < _RENDER_LOCK_SECONDS:
+                    return False
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        except OSError as e:
+            print(f"⚠️ 렌더링 락 파일 생성 실패 ({path}): {str(e)}")
+            return True
+    return False
+
+
+def _release_render_lock(cache_key):
+    if _lock_dir is None:
+        cache.delete('render-lock:' + cache_key)
+        return
+    try:
+        os.remove(os.path.join(_lock_dir, hashlib.md5(cache_key.encode('utf-8')).hexdigest()))
+    except FileNotFoundError:
+        pass
+
+
+def _store(cache_key, value, timeout):
+    # 만료 시각은 항목 안에 기록하고, 저장소 TTL은 stale 구간까지 늘려 둠
+    cache.set(cache_key, {'value': value, 'expires': time.time() + timeout},
+              timeout=timeout + PAGE_CACHE_STALE_SECONDS)
+
+
+def _render_single_flight(cache_key, render, timeout):
+    """
+    같은 키의 동시 미스를 렌더링 1회로 합침
+    
+    - 같은 프로세스: 먼저 온 스레드가 렌더링하고 나머지는 Event로 대기
+    - 다른 워커: cache.add 렌더링 락을 잡은 워커만 렌더링, 나머지는 저장될 때까지 폴링
+    """
+    with _inflight_lock:
+        event = _inflight.get(cache_key)
+        leader = event is None
+        if leader:
+            event = _inflight[cache_key] = threading.Event()
+    
+    if not leader:
+        _count('waited')
+        event.wait(PAGE_CACHE_WAIT_SECONDS)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            return entry['value']
+        return render()
+    
+    locked = _acquire_render_lock(cache_key)
+    try:
+        if not locked:
+            # 다른 워커가 렌더링 중 - 결과가 저장되기를 잠시 기다림
+            _count('waited')
+            deadline = time.time() + PAGE_CACHE_WAIT_SECONDS
+            while time.time() < deadline:
+                time.sleep(0.05)
+                entry = cache.get(cache_key)
+                if entry is not None:
+                    return entry['value']
+        
+        value = render()
+        if is_render_fallback():
+            _count('fallback')
+        elif isinstance(value, str):
+            _store(cache_key, value, timeout)
+        return value
+    finally:
+        if locked:
+            _release_render_lock(cache_key)
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+        event.set()
+
+
+def _refresh_in_background(cache_key, view, args, kwargs, timeout):
+    """
+    만료된 항목을 백그라운드 스레드에서 다시 렌더링 (워커 전체에서 한 번만)
+    
+    응답이 끝난 뒤에도 실행되므로 방문자의 요청 컨텍스트(세션, g)를 공유하지 않고,
+    render_snapshot처럼 같은 URL/언어의 새 요청 컨텍스트에서 렌더링한다 (방문자 쿠키/세션 없음).
+    """
+    if not _acquire_render_lock(cache_key):
+        return
+    
+    app = current_app._get_current_object()
+    path = request.full_path if request.query_string else request.path
+    base_url = request.host_url
+    headers = {'Cookie': f'preferred_lang={get_current_language()}'}
+    if request.headers.get('HX-Request'):
+        headers['HX-Request'] = request.headers['HX-Request']
+    
+    def refresh():
+        try:
+            with app.app_context(), app.test_request_context(path, base_url=base_url, headers=headers):
+                # url_value_preprocessor (언어 접두사 → g.url_lang)
+                for preprocess in app.url_value_preprocessors.get(None, ()):
+                    preprocess(request.endpoint, dict(request.view_args or {}))
+                value = view(*args, **kwargs)
+                if is_render_fallback():
+                    # 이전 항목을 그대로 두고 다음 요청에서 다시 갱신
+                    _count('fallback')
+                elif isinstance(value, str):
+                    _store(cache_key, value, timeout)
+                    _count('refreshed')
+        except Exception as e:
+            _count('refresh_failed')
+            print(f"⚠️ 페이지 캐시 갱신 실패 ({cache_key}): {str(e)}")
+        finally:
+            _release_render_lock(cache_key)
+    
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def cached_page(timeout=300, key_prefix=None):
+    """
+    페이지 캐시 데코레이터 (@cache.cached 대체)
+    
+    - 만료 전: 캐시된 페이지 응답
+    - 만료 후 PAGE_CACHE_STALE_SECONDS 이내: 이전 페이지를 바로 응답하고 백그라운드에서 한 번만 다시 렌더링
+    - 캐시 없음(첫 요청, 태그 무효화 직후): 동시 요청을 렌더링 1회로 합침
+    
+    문자열 응답(render_template 결과)만 캐시하며, GET/HEAD 이외 요청은 그대로 통과한다.
+    
+    Args:
+        timeout: 신선 기간(초)
+        key_prefix: 캐시 키를 반환하는 함수 (tagged_key 사용 권장)
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+            
+            # 언어 접두사 URL(/en/...) 페이지는 링크가 다르므로 일반 URL과 따로 보관
+            cache_key = 'page:' + url_prefix() + (key_prefix() if callable(key_prefix) else (key_prefix or request.path))
+            entry = cache.get(cache_key)
+            if entry is not None:
+                if entry['expires'] > time.time():
+                    _count('fresh')
+                else:
+                    _count('stale')
+                    _refresh_in_background(cache_key, view, args, kwargs, timeout)
+                return entry['value']
+            
+            _count('miss')
+            return _render_single_flight(cache_key, lambda: view(*args, **kwargs), timeout)
+        return wrapper
+    return decorator
@@ -15,7 +15,8 @@ import json
 import threading
 from datetime import datetime
 from typing import Optional, Dict, List, Any
-from pymongo import MongoClient
+from utils.mongo_client import get_client
+from utils.mongo_indexes import Index, register_indexes
 from dotenv import load_dotenv
 from openai import OpenAI
 from pathlib import Path
@@ -69,6 +70,13 @@ mongo_db = None
 translations_collection = None
 _translation_connection_pid = None  # 연결이 생성된 프로세스 ID 추적
 
+# 인덱스 선언 (`flask db-indexes sync`로 적용)
+# source_type 단독 조회/집계는 (source_type, source_id) 인덱스의 접두사로 처리됨
+register_indexes('translations', [
+    Index([("source_type", 1), ("source_id", 1)], unique=True),
+    Index("updated_at"),
+])
+
 
 # ==========================================
 # JSON 캐시 시스템 함수들
@@ -355,27 +363,14 @@ def init_mongodb():
         return False
     
     try:
-        mongo_client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=30000,
-            connectTimeoutMS=20000,
-            socketTimeoutMS=20000,
-            retryWrites=True,
-            retryReads=True,
-            w='majority',
-            readPreference='primaryPreferred'
-        )
-        mongo_client.server_info()
+        # 공유 클라이언트 사용 (연결 풀/연결 확인은 레지스트리에서 프로세스당 한 번)
+        mongo_client = get_client()
         mongo_db = mongo_client['STG-DB']
         translations_collection = mongo_db['translations']
         
         # 연결 생성 시 PID 저장
         _translation_connection_pid = current_pid
         
-        # 인덱스 생성
-        translations_collection.create_index([("source_type", 1), ("source_id", 1)], unique=True)
-        translations_collection.create_index("updated_at")
-        
         print(f"✅ 번역 시스템 MongoDB 연결 성공! (PID: {current_pid})")
         return True
     except Exception as e:
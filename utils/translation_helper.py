@@ -10,7 +10,7 @@
 
 import json
 from typing import Optional, Dict, Any, List
-from flask import session, request, g
+from flask import session, request, g, current_app, has_app_context
 from functools import wraps
 
 from utils.translation import (
@@ -608,6 +608,16 @@ def auto_translate_on_save(model_type: str):
     return decorator
 
 
+# 비동기 번역 완료 콜백 (model_type, model_instance) - 번역된 페이지 캐시/스냅샷 무효화용
+_translation_listeners = []
+
+
+def on_translation_complete(callback):
+    """비동기 번역이 끝난 뒤 호출할 함수 등록 (앱 컨텍스트 안에서 호출됨)"""
+    _translation_listeners.append(callback)
+    return callback
+
+
 def trigger_translation(model_type: str, model_instance):
     """
     모델 인스턴스에 대한 번역 트리거
@@ -620,6 +630,15 @@ def trigger_translation(model_type: str, model_instance):
     """
     import threading
     
+    app = current_app._get_current_object() if has_app_context() else None
+    
+    def notify_listeners():
+        for callback in _translation_listeners:
+            try:
+                callback(model_type, model_instance)
+            except Exception as e:
+                print(f"⚠️ 번역 완료 콜백 오류: {str(e)}")
+    
     def translate_async():
         try:
             if model_type == 'service':
@@ -635,6 +654,9 @@ def trigger_translation(model_type: str, model_instance):
             elif model_type == 'privacy_policy':
                 translate_privacy_policy(model_instance)
             print(f"✅ 비동기 번역 완료: {model_type}_{model_instance.id}")
+            if app is not None:
+                with app.app_context():
+                    notify_listeners()
         except Exception as e:
             print(f"❌ 비동기 번역 오류: {str(e)}")
     
@@ -652,18 +674,17 @@ def register_template_helpers(app):
         app: Flask 앱 인스턴스
     """
     
-    @app.context_processor
-    def inject_translation_helpers():
-        return {
-            't': t,
-            'get_current_language': get_current_language,
-            'get_translated_service': get_translated_service,
-            'get_translated_service_option': get_translated_service_option,
-            'get_translated_collage_text': get_translated_collage_text,
-            'get_translated_gallery_group': get_translated_gallery_group,
-            'TranslatedModel': TranslatedModel,
-            'SUPPORTED_LANGUAGES': SUPPORTED_LANGUAGES
-        }
+    # 요청마다 바뀌지 않는 함수/상수이므로 context_processor 대신 Jinja 전역에 한 번만 등록
+    app.jinja_env.globals.update({
+        't': t,
+        'get_current_language': get_current_language,
+        'get_translated_service': get_translated_service,
+        'get_translated_service_option': get_translated_service_option,
+        'get_translated_collage_text': get_translated_collage_text,
+        'get_translated_gallery_group': get_translated_gallery_group,
+        'TranslatedModel': TranslatedModel,
+        'SUPPORTED_LANGUAGES': SUPPORTED_LANGUAGES
+    })
     
     # Jinja2 필터 등록
     @app.template_filter('translate')
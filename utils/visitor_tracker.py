@@ -14,26 +14,35 @@ import os
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-from pymongo import MongoClient
 from dotenv import load_dotenv
 import requests
 
+from utils.mongo_client import get_database
+from utils.mongo_indexes import Index, register_indexes, retire_indexes
+from utils.mongo_models import encode_cursor, decode_cursor, keyset_filter, with_id_tiebreaker
+
 load_dotenv()
 
-# MongoDB 연결
-_mongo_client = None
+# MongoDB 컬렉션 (연결은 공유 클라이언트 레지스트리 사용)
 _visitors_collection = None
 _connection_pid = None
 
+# 인덱스 선언 (`flask db-indexes sync`로 적용)
+register_indexes('visitor_sessions', [
+    Index([("timestamp", -1), ("_id", -1)]),  # 기간 조회 + 키셋 페이지네이션 (timestamp 단일 인덱스 대체)
+    Index([("ip_address", 1)]),
+    Index([("session_id", 1)]),
+])
+retire_indexes('visitor_sessions', [Index([("timestamp", -1)])])  # (timestamp, _id) 복합 인덱스의 접두사
+
 
 def get_visitors_collection():
     """방문자 컬렉션 반환 (fork-safe)"""
-    global _mongo_client, _visitors_collection, _connection_pid
+    global _visitors_collection, _connection_pid
     
     current_pid = os.getpid()
     
     if _connection_pid is not None and _connection_pid != current_pid:
-        _mongo_client = None
         _visitors_collection = None
     
     if _visitors_collection is not None:
@@ -44,20 +53,10 @@ def get_visitors_collection():
         return None
     
     try:
-        _mongo_client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=10000,
-            connectTimeoutMS=10000
-        )
-        db = _mongo_client['STG-DB']
+        db = get_database()
         _visitors_collection = db['visitor_sessions']
         _connection_pid = current_pid
         
-        # 인덱스 생성
-        _visitors_collection.create_index([("timestamp", -1)])
-        _visitors_collection.create_index([("ip_address", 1)])
-        _visitors_collection.create_index([("session_id", 1)])
-        
         return _visitors_collection
     except Exception as e:
         print(f"방문자 추적 MongoDB 연결 실패: {str(e)}")
@@ -303,6 +302,10 @@ def update_visitor_tokens(session_id: str, tokens_used: int, cost_usd: float) ->
         return False
 
 
+# 세션 목록 정렬 허용 필드 - 모든 문서에 항상 저장되는 필드만 (없는 문서가 있으면 커서가 행을 건너뛰거나 반복)
+SESSION_SORT_FIELDS = ('timestamp', 'ip_address', 'tokens_used', 'cost_usd')
+
+
 def get_visitor_sessions(
     days: int = 30,
     limit: int = 100,
@@ -310,7 +313,8 @@ def get_visitor_sessions(
     sort_by: str = 'timestamp',
     sort_order: int = -1,
     ip_filter: Optional[str] = None,
-    country_filter: Optional[str] = None
+    country_filter: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> tuple:
     """
     방문자 세션 목록 조회
@@ -318,18 +322,19 @@ def get_visitor_sessions(
     Args:
         days: 조회 기간 (일)
         limit: 조회 개수
-        offset: 오프셋 (페이징)
-        sort_by: 정렬 기준
+        offset: 오프셋 (cursor가 없을 때만 사용, 이전 페이지 번호 방식 호환)
+        sort_by: 정렬 기준 (SESSION_SORT_FIELDS 중 하나, 그 외는 timestamp)
         sort_order: 정렬 순서 (-1: 내림차순, 1: 오름차순)
         ip_filter: IP 필터
         country_filter: 국가 필터
+        cursor: 이전 페이지가 돌려준 커서 ((sort_by, _id) 키셋, skip 없이 이어서 조회)
     
     Returns:
-        (세션 목록, 전체 개수)
+        (세션 목록, 전체 개수, 다음 페이지 커서 또는 None)
     """
     collection = get_visitors_collection()
     if collection is None:
-        return [], 0
+        return [], 0, None
     
     try:
         since = datetime.utcnow() - timedelta(days=days)
@@ -346,15 +351,22 @@ def get_visitor_sessions(
         # 전체 개수
         total_count = collection.count_documents(query)
         
-        # 정렬 및 페이징
-        cursor = collection.find(query).sort(sort_by, sort_order).skip(offset).limit(limit)
-        sessions = list(cursor)
+        # 정렬 및 페이징 - 커서가 있으면 마지막 (sort_by, _id) 이후만 조회
+        if sort_by not in SESSION_SORT_FIELDS:
+            sort_by = 'timestamp'
+        sort = with_id_tiebreaker([(sort_by, 1 if sort_order == 1 else -1)])
+        if cursor:
+            query = {'$and': [query, keyset_filter(sort, decode_cursor(cursor, sort))]}
+            offset = 0
+        
+        docs = list(collection.find(query).sort(sort).skip(offset).limit(limit + 1))
+        next_cursor = encode_cursor(sort, docs[limit - 1]) if len(docs) > limit else None
         
-        return sessions, total_count
+        return docs[:limit], total_count, next_cursor
         
     except Exception as e:
         print(f"세션 조회 오류: {str(e)}")
-        return [], 0
+        return [], 0, None
 
 
 def get_visitor_stats(days: int = 30) -> Dict:
@@ -0,0 +1,208 @@
+"""
+워커 예열 (warm-up)
+
+gunicorn 워커는 첫 요청에서 대형 템플릿(index.html, service_option_detail.html 등) Jinja 컴파일,
+번역 JSON 파싱, MongoDB 핸드셰이크, 페이지 캐시 채우기를 모두 처리하므로
+Render 재시작/배포 직후 첫 방문자가 느린 응답을 받습니다.
+warm_app()은 이 작업을 요청을 받기 전에 단계별로 실행하고 단계별 소요 시간을 기록합니다.
+
+단계:
+    templates    모든 .html 템플릿 컴파일 (Jinja 바이트코드 캐시 - 다음 워커/재시작은 파일에서 로드)
+    translations static/data/translations.json 파싱 (메모리 캐시)
+    mongo        MongoDB 연결 풀 + GridFS 연결
+    pages        주요 페이지 × 지원 언어 렌더링 (페이지/조각/모델 캐시 채움)
+    images       렌더링한 페이지에서 가장 많이 참조된 이미지를 디스크 캐시(비활성화 시 메모리 캐시)에 미리 로드
+
+실행:
+    gunicorn.conf.py 의 post_worker_init 훅 (워커마다, 요청을 받기 전)
+    flask warm      (공유 캐시/바이트코드 캐시를 채우고 단계별 시간 출력 - 배포 후 점검용)
+
+환경 변수:
+    WARMUP=0                 gunicorn 훅에서 예열 생략
+    WARMUP_PAGES             예열할 엔드포인트 (쉼표 구분, 기본: main.index,main.services,main.gallery,main.about)
+    WARMUP_IMAGES            미리 로드할 이미지 수 (기본: 24)
+    WARMUP_TIMEOUT           전체 예열 시간 한도(초) - 넘으면 남은 단계 생략 (기본: 60, gunicorn --timeout 보다 짧게)
+    JINJA_CACHE_DIR          템플릿 바이트코드 캐시 위치 (기본: instance/jinja_cache)
+"""
+
+import os
+import re
+import time
+import threading
+from collections import Counter
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from jinja2 import FileSystemBytecodeCache
+from utils.translation import SUPPORTED_LANGUAGES, load_translations_cache
+from utils.mongo_client import warm_pool
+from utils.gridfs_helper import get_mongo_connection, open_image, IMAGE_MODERN_FORMATS
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WARMUP_ENABLED = os.environ.get('WARMUP', '1').lower() not in ('0', 'false', 'off')
+WARMUP_PAGES = [name.strip() for name in os.environ.get(
+    'WARMUP_PAGES', 'main.index,main.services,main.gallery,main.about').split(',') if name.strip()]
+WARMUP_IMAGES = int(os.environ.get('WARMUP_IMAGES', '24'))
+WARMUP_TIMEOUT = float(os.environ.get('WARMUP_TIMEOUT', '60'))
+JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR') or os.path.join(_ROOT, 'instance', 'jinja_cache')
+
+# 렌더링된 HTML의 GridFS 이미지 URL (/image/<id>, /package-photo-image/<id>, 요청 크기 ?w=640 포함)
+_IMAGE_URL_RE = re.compile(r'/(?:image|package-photo-image)/([^"\'\s)?#]+)(?:\?w=(\d+))?')
+
+_last_report = None  # 마지막 예열 결과 (현재 프로세스)
+_report_lock = threading.Lock()
+
+
+def configure_bytecode_cache(app):
+    """
+    Jinja 템플릿 바이트코드 캐시 설정 (템플릿 로드 전에 호출)
+    
+    템플릿 소스 체크섬으로 검증하므로 템플릿이 바뀌면 다시 컴파일된다.
+    """
+    try:
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+    except OSError as e:
+        print(f"⚠️ 템플릿 바이트코드 캐시 비활성화 ({JINJA_CACHE_DIR}): {str(e)}")
+
+
+# ---------- 단계 ----------
+
+def _warm_templates(app):
+    names = app.jinja_env.list_templates(filter_func=lambda name: name.endswith('.html'))
+    for name in names:
+        app.jinja_env.get_template(name)
+    return f"{len(names)}개"
+
+
+def _warm_translations(app):
+    data = load_translations_cache()
+    return f"{len(data)}개 항목"
+
+
+def _warm_mongo(app):
+    pings = warm_pool()
+    gridfs, _, _ = get_mongo_connection()
+    return f"ping {pings}회, GridFS {'연결' if gridfs is not None else '없음'}"
+
+
+def _render_pages(app, langs, image_refs, deadline):
+    """주요 페이지 렌더링 (페이지 캐시 데코레이터 포함) + 이미지 참조 집계"""
+    rendered = 0
+    adapter = app.url_map.bind('localhost')
+    for endpoint in WARMUP_PAGES:
+        if endpoint not in app.view_functions:
+            print(f"⚠️ 예열 대상 엔드포인트 없음: {endpoint}")
+            continue
+        path = adapter.build(endpoint, {})
+        for lang in langs:
+            if time.time() > deadline:
+                return f"{rendered}개 (시간 초과)"
+            try:
+                # 언어/태그 메모가 g에 남으므로 페이지마다 새 앱 컨텍스트에서 렌더링
+                with app.app_context(), app.test_request_context(
+                        path, headers={'Cookie': f'preferred_lang={lang}'}):
+                    html = app.view_functions[endpoint]()
+            except Exception as e:
+                print(f"⚠️ 예열 렌더링 실패 ({lang} {path}): {str(e)}")
+                continue
+            if isinstance(html, str):
+                image_refs.update(_IMAGE_URL_RE.findall(html))
+                rendered += 1
+    return f"{rendered}개"
+
+
+def _prefetch_images(app, image_refs, deadline):
+    loaded = 0
+    # 대부분의 브라우저가 받는 포맷 (WebP - AVIF를 받는 브라우저도 함께 받음)
+    fmt = 'webp' if 'webp' in IMAGE_MODERN_FORMATS else None
+    for (image_id, width), _ in image_refs.most_common(WARMUP_IMAGES):
+        if time.time() > deadline:
+            break
+        try:
+            body, _, _ = open_image(image_id, int(width) if width else None, fmt=fmt)
+        except ValueError:
+            continue
+        if body is not None:
+            if not isinstance(body, bytes):
+                body.close()
+            loaded += 1
+    return f"{loaded}/{min(len(image_refs), WARMUP_IMAGES)}개"
+
+
+# ---------- 실행 ----------
+
+def warm_app(app, langs=None, pages=True, images=True):
+    """
+    워커 예열 실행 - 단계별로 실패해도 다음 단계 계속
+    
+    Args:
+        app: Flask 앱
+        langs: 렌더링할 언어 목록 (기본: 지원 언어 전체)
+        pages: 주요 페이지 렌더링 여부
+        images: 이미지 미리 로드 여부 (pages=True일 때만 대상 수집)
+    
+    Returns:
+        {'pid', 'total_ms', 'steps': [{'name', 'ms', 'ok', 'detail'}]}
+    """
+    global _last_report
+    langs = list(langs or SUPPORTED_LANGUAGES)
+    started = time.time()
+    deadline = started + WARMUP_TIMEOUT
+    image_refs = Counter()
+    
+    steps = [
+        ('templates', lambda: _warm_templates(app)),
+        ('translations', lambda: _warm_translations(app)),
+        ('mongo', lambda: _warm_mongo(app)),
+    ]
+    if pages:
+        steps.append(('pages', lambda: _render_pages(app, langs, image_refs, deadline)))
+        if images:
+            steps.append(('images', lambda: _prefetch_images(app, image_refs, deadline)))
+    
+    report = {'pid': os.getpid(), 'steps': []}
+    with app.app_context():
+        for name, step in steps:
+            if time.time() > deadline:
+                report['steps'].append({'name': name, 'ms': 0, 'ok': False, 'detail': '시간 초과로 생략'})
+                continue
+            step_started = time.perf_counter()
+            try:
+                detail, ok = step(), True
+            except Exception as e:
+                detail, ok = str(e), False
+            elapsed_ms = round((time.perf_counter() - step_started) * 1000, 1)
+            report['steps'].append({'name': name, 'ms': elapsed_ms, 'ok': ok, 'detail': detail})
+            print(f"{'🔥' if ok else '⚠️'} 예열 {name}: {elapsed_ms:.0f}ms - {detail}")
+    
+    report['total_ms'] = round((time.time() - started) * 1000, 1)
+    report['finished_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    print(f"✅ 워커 예열 완료: {report['total_ms']:.0f}ms (PID: {os.getpid()})")
+    with _report_lock:
+        _last_report = report
+    return report
+
+
+def get_warmup_stats():
+    """마지막 예열 결과 (현재 프로세스, 예열 전이면 None)"""
+    with _report_lock:
+        return _last_report
+
+
+# ---------- Flask CLI ----------
+
+@click.command('warm')
+@click.option('--lang', 'langs', multiple=True, type=click.Choice(list(SUPPORTED_LANGUAGES)),
+              help='렌더링할 언어 (여러 번 지정 가능, 기본: 전체)')
+@click.option('--no-pages', is_flag=True, help='페이지 렌더링/이미지 로드 생략')
+@click.option('--no-images', is_flag=True, help='이미지 로드 생략')
+@with_appcontext
+def warm_command(langs, no_pages, no_images):
+    """템플릿 컴파일, 번역/DB 연결, 주요 페이지 렌더링 예열 (단계별 시간 출력)"""
+    report = warm_app(current_app._get_current_object(), langs=langs or None,
+                      pages=not no_pages, images=not no_images)
+    for step in report['steps']:
+        print(f"  {step['name']:<13}{step['ms']:>9.1f}ms  {'OK ' if step['ok'] else 'ERR'}  {step['detail']}")
+    print(f"  {'total':<13}{report['total_ms']:>9.1f}ms")